@@ -0,0 +1,194 @@
+"""
+Analytics stage run after extraction: 자산내역 holdings joined to the 투자원장 deal ledger and
+summarized per 펀드, 전략, 기초자산 and 섹터, written as precomputed sheets next to the raw
+tables so the workbook needs no lookup formulas.
+
+    보유원장     holdings with their ledger totals (종목코드 = 자산코드)
+    펀드요약     평가액, 종목 수, ledger coverage and share of the day's total per 날짜 x 펀드
+    전략요약     평가액 and 펀드내비중 per 날짜 x 펀드 x 전략
+    기초자산노출  평가액 and 펀드내비중 per 날짜 x 펀드 x 기초자산
+    섹터노출     평가액 and 펀드내비중 per 날짜 x 펀드 x 섹터
+
+Holdings are snapshots, so 평가액 of different 날짜 never add up: every total and weight is taken
+within one 날짜 (when 자산내역 has no 날짜 column, over the whole table).
+
+The ledger is collapsed to one row per 자산코드 and indexed on it, so the join is one hash
+lookup per holding; every summary is a grouped aggregation over the joined frame. Results are
+cached under a fingerprint of the input tables: a run whose 자산내역 and 투자원장 did not change
+reuses the previous summaries (in memory, or from the cache directory) instead of recomputing.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+
+import pandas as pd
+
+# Bump when the summaries change shape, so cached results of older code are not reused
+VERSION = 2
+INPUTS = ("자산내역", "투자원장")
+JOIN_SHEET = "보유원장"
+FUND_SHEET = "펀드요약"
+STRATEGY_SHEET = "전략요약"
+UNDERLYING_SHEET = "기초자산노출"
+SECTOR_SHEET = "섹터노출"
+
+LEDGER_SUMS = ["최초투자원금", "현재원금액", "현재평가액"]
+HOLDING_COLUMNS = ["날짜", "펀드", "전략", "종목코드", "종목명", "자산구분", "기초자산코드", "기초자산명", "섹터",
+                   "보유수량", "종가", "평가액"]
+
+def fingerprint(frames):
+    """-> hex digest of the analytics inputs (columns, dtypes and values) and VERSION"""
+    digest = hashlib.sha1(f"analytics v{VERSION}".encode("utf-8"))
+    for sheet in INPUTS:
+        df = frames.get(sheet)
+        if df is None: df = pd.DataFrame()
+        digest.update(sheet.encode("utf-8"))
+        digest.update(repr([(str(c), str(t)) for c, t in zip(df.columns, df.dtypes)]).encode("utf-8"))
+        if len(df): digest.update(pd.util.hash_pandas_object(df.set_axis(range(df.shape[1]), axis=1), index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def _codes(series):
+    return series.astype("string").str.strip()
+
+def ledger_index(deals):
+    """
+    투자원장 collapsed to one row per 자산코드 (deals of the same asset summed)
+    -> DataFrame indexed by 자산코드 with 원장 columns
+    """
+    if deals is None or deals.empty or "자산코드" not in deals.columns:
+        return pd.DataFrame(columns=["원장 자산명", "원장 건수"] + [f"원장 {c}" for c in LEDGER_SUMS])
+    codes = _codes(deals["자산코드"])
+    deals = deals.loc[codes.notna() & (codes != "").fillna(False)].assign(자산코드=codes)
+    sums = [c for c in LEDGER_SUMS if c in deals.columns]
+    grouped = deals.groupby("자산코드", sort=False)
+    ledger = grouped[sums].sum(min_count=1) if sums else pd.DataFrame(index=grouped.size().index)
+    ledger.insert(0, "건수", grouped.size())
+    if "자산명" in deals.columns: ledger.insert(0, "자산명", grouped["자산명"].first())
+    return ledger.add_prefix("원장 ")
+
+def join_holdings(assets, ledger):
+    """자산내역 joined with ledger_index on 종목코드 = 자산코드 -> DataFrame with a 원장매칭 flag"""
+    holdings = assets[[c for c in HOLDING_COLUMNS if c in assets.columns]].reset_index(drop=True)
+    matches = ledger.reindex(_codes(holdings["종목코드"]).to_numpy()).reset_index(drop=True)
+    joined = pd.concat([holdings, matches], axis=1)
+    joined["원장 건수"] = joined["원장 건수"].astype("Int64")
+    joined["원장매칭"] = joined["원장 건수"].notna()
+    return joined
+
+def _exposure(joined, keys, fund_keys, fund_totals):
+    """평가액 and 종목 수 per keys, with 펀드내비중 against the 펀드's total of the same 날짜"""
+    grouped = joined.groupby(keys, observed=True, dropna=False, sort=False)
+    summary = grouped.agg(평가액=("평가액", "sum"), 종목수=("종목코드", "nunique")).reset_index()
+    summary = summary.merge(fund_totals.rename("_펀드평가액").reset_index(), on=fund_keys, how="left")
+    total = summary.pop("_펀드평가액").astype("float64")
+    summary["펀드내비중"] = (summary["평가액"] / total).where(total != 0)
+    return _sorted(summary, fund_keys, by_value=True)
+
+def _sorted(summary, fund_keys, by_value=False):
+    """Rows by 날짜 and 펀드 (as text), then by 평가액 descending within a 펀드"""
+    order = {f"_order{i}": summary[key].astype("string") if key == "펀드" else summary[key] for i, key in enumerate(fund_keys)}
+    columns = list(order) + (["평가액"] if by_value else [])
+    ascending = [True] * len(order) + ([False] if by_value else [])
+    return summary.assign(**order).sort_values(columns, ascending=ascending).drop(columns=list(order)).reset_index(drop=True)
+
+def summarize(frames):
+    """
+    Compute every analytics sheet from one run's tables
+    -> dict sheet name -> DataFrame (empty dict without 자산내역 holdings)
+    """
+    assets = frames.get("자산내역")
+    if assets is None or assets.empty or not {"펀드", "종목코드", "평가액"} <= set(assets.columns): return {}
+    joined = join_holdings(assets, ledger_index(frames.get("투자원장")))
+    joined["평가액"] = pd.to_numeric(joined["평가액"], errors="coerce")
+
+    dates = ["날짜"] if "날짜" in joined.columns else []
+    fund_keys = dates + ["펀드"]
+    by_fund = joined.groupby(fund_keys, observed=True, sort=False)
+    fund_totals = by_fund["평가액"].sum()
+    matched = joined["평가액"].where(joined["원장매칭"], 0.0)
+    funds = pd.DataFrame({
+        "평가액": fund_totals,
+        "종목수": by_fund["종목코드"].nunique(),
+        "원장매칭 종목수": joined.loc[joined["원장매칭"]].groupby(fund_keys, observed=True)["종목코드"].nunique(),
+        "원장매칭 평가액": matched.groupby([joined[key] for key in fund_keys], observed=True).sum(),
+    })
+    funds["원장매칭 종목수"] = funds["원장매칭 종목수"].fillna(0).astype("int64")
+    funds = funds.reset_index()
+    day_totals = funds.groupby(dates, observed=True)["평가액"].transform("sum") if dates else \
+                 pd.Series(funds["평가액"].sum(), index=funds.index)
+    funds["전체비중"] = (funds["평가액"] / day_totals).where(day_totals != 0)
+    funds["펀드"] = funds["펀드"].astype("string")
+    funds = _sorted(funds, fund_keys)
+
+    sheets = {JOIN_SHEET: joined, FUND_SHEET: funds}
+    for sheet, column in ((STRATEGY_SHEET, ["전략"]), (UNDERLYING_SHEET, ["기초자산코드", "기초자산명"]), (SECTOR_SHEET, ["섹터"])):
+        columns = [c for c in column if c in joined.columns]
+        if columns: sheets[sheet] = _exposure(joined, fund_keys + columns, fund_keys, fund_totals)
+    return sheets
+
+class AnalyticsCache:
+    """Summaries by input fingerprint: the latest in memory, the last `keep` runs as pickles on disk"""
+    def __init__(self, directory=None, keep=5):
+        self.directory = directory
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._latest = (None, None)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key):
+        with self._lock:
+            if self._latest[0] == key: return self._latest[1]
+        if not self.directory or not os.path.exists(self._path(key)): return None
+        try: sheets = pd.read_pickle(self._path(key))
+        except Exception as e:
+            print(f"⚠️ 분석 캐시 읽기 실패, 다시 계산: {e}")
+            return None
+        with self._lock: self._latest = (key, sheets)
+        return sheets
+
+    def put(self, key, sheets):
+        with self._lock: self._latest = (key, sheets)
+        if not self.directory: return
+        # Unique temp name: processes sharing the cache directory never replace each other's temp.
+        # A failed write only costs recomputing on a later run
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp = tempfile.mkstemp(prefix=f".{key}-", suffix=".tmp", dir=self.directory)
+            try:
+                with os.fdopen(fd, "wb") as f: pd.to_pickle(sheets, f)
+                os.replace(temp, self._path(key))
+            except BaseException:
+                try: os.remove(temp)
+                except OSError: pass
+                raise
+        except OSError as e:
+            print(f"⚠️ 분석 캐시 저장 실패: {e}")
+            return
+        cached = sorted((f for f in os.listdir(self.directory) if f.endswith(".pkl")),
+                        key=lambda f: os.path.getmtime(os.path.join(self.directory, f)))
+        for name in cached[:-self.keep]:
+            try: os.remove(os.path.join(self.directory, name))
+            except OSError: pass
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+def run_analytics(frames, cache_dir=None, keep=5):
+    """
+    Summaries for frames, computed only when 자산내역/투자원장 changed since a cached run
+    cache_dir: directory of the on-disk cache (None: memory only)
+    -> dict sheet name -> DataFrame
+    """
+    with _caches_lock: cache = _caches.setdefault(cache_dir, AnalyticsCache(cache_dir, keep))
+    key = fingerprint(frames)
+    sheets = cache.get(key)
+    if sheets is not None:
+        print(f"♻️ 입력 변경 없음, 분석 시트 재사용 ({len(sheets)}개)")
+        return sheets
+    sheets = summarize(frames)
+    cache.put(key, sheets)
+    print(f"📈 분석 시트 {len(sheets)}개 생성")
+    return sheets
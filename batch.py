@@ -0,0 +1,121 @@
+"""
+Batch mode: scrape several accounts in parallel, one credential JSON per account.
+
+Accounts run in a bounded process pool, one browser per worker process. chromedriver is resolved
+once in the parent and handed to every worker. Each account writes into its own directory
+(<batch_output_dir>/<credential file name>/temp.xlsx, with its own snapshots and history).
+The OS clipboard is one per desktop, so workers never use the clipboard extractor: views
+configured for it switch to batch_extractor ("script" by default).
+
+Usage: python batch.py <credentials dir or json files...> [--workers 2] [--output accounts] [--visible]
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from easyscraperlib import get, update, resolve_chromedriver
+
+def credential_files(sources):
+    """Directories expand to the *.json files they contain -> sorted list of paths"""
+    files = []
+    for source in sources:
+        if os.path.isdir(source): files.extend(glob.glob(os.path.join(source, "*.json")))
+        else: files.append(source)
+    return sorted(dict.fromkeys(os.path.abspath(f) for f in files))
+
+def _init_worker(driver_path):
+    if driver_path: update("chromedriver_path", driver_path)
+
+def run_account(credential_file, output_root, headless=True):
+    """
+    Worker process: one scrape_once run for the account in credential_file
+    -> dict: account, ok, seconds, rows per sheet, error, output directory
+    """
+    import scrape
+
+    account = os.path.splitext(os.path.basename(credential_file))[0]
+    output_dir = os.path.join(output_root, account)
+    result = {"account": account, "file": credential_file, "output_dir": output_dir, "pid": os.getpid()}
+    start = time.perf_counter()
+    try:
+        _, _, headless_from_file = scrape.load_credentials(credential_file)
+        os.makedirs(output_dir, exist_ok=True)
+        update("output_dir", output_dir)
+        for table in scrape.TABLES:
+            if get(table["extractor"]) == "clipboard": update(table["extractor"], get("batch_extractor", "script"))
+
+        frames = scrape.scrape_once(headless=headless or bool(headless_from_file))
+        result.update(ok=True, rows={sheet: len(df) for sheet, df in frames.items()})
+    except Exception as e:
+        result.update(ok=False, error=f"{type(e).__name__}: {e}")
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def run_batch(files, workers=None, output_root=None, headless=True):
+    """
+    Scrape every account in files with at most `workers` browsers at a time
+    -> list of result dicts (see run_account), in completion order
+    """
+    workers = max(1, min(workers or get("batch_workers", 2), len(files)))
+    output_root = os.path.abspath(output_root or get("batch_output_dir", "accounts"))
+    driver_path = resolve_chromedriver()
+    print(f"🚀 {len(files)}개 계정, 동시 실행 {workers}개 -> {output_root}")
+
+    results = []
+    context = multiprocessing.get_context("spawn")  # no forked Selenium/threads state in workers
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(driver_path,)) as pool:
+        futures = {pool.submit(run_account, f, output_root, headless): f for f in files}
+        for future in as_completed(futures):
+            try: result = future.result()
+            except Exception as e:  # worker process died
+                account = os.path.splitext(os.path.basename(futures[future]))[0]
+                result = {"account": account, "file": futures[future], "ok": False, "error": f"{type(e).__name__}: {e}", "seconds": None}
+            print(f"{'✅' if result['ok'] else '❌'} {result['account']}" + ("" if result["ok"] else f": {result['error']}"))
+            results.append(result)
+    return results
+
+def report(results, wall_seconds, output_root=None):
+    """Print the aggregated success/failure and timing table and write batch_report_<time>.json -> report path"""
+    width = max([len("account")] + [len(r["account"]) for r in results])
+    print(f"{'account':<{width}}  {'status':<6}  {'seconds':>8}  {'rows':>8}")
+    for r in sorted(results, key=lambda r: r["account"]):
+        seconds = f"{r['seconds']:.1f}s" if r.get("seconds") is not None else "-"
+        rows = sum(r.get("rows", {}).values()) if r["ok"] else "-"
+        print(f"{r['account']:<{width}}  {'ok' if r['ok'] else 'FAIL':<6}  {seconds:>8}  {rows:>8}")
+    succeeded = sum(1 for r in results if r["ok"])
+    busy = sum(r["seconds"] for r in results if r.get("seconds"))
+    print(f"성공 {succeeded}/{len(results)}, 전체 {wall_seconds:.1f}s (계정별 합계 {busy:.1f}s)")
+
+    output_root = os.path.abspath(output_root or get("batch_output_dir", "accounts"))
+    os.makedirs(output_root, exist_ok=True)
+    path = os.path.join(output_root, f"batch_report_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"wall_seconds": wall_seconds, "succeeded": succeeded, "failed": len(results) - succeeded,
+                   "accounts": results}, f, ensure_ascii=False, indent=2)
+    return path
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape several accounts in parallel")
+    parser.add_argument("sources", nargs="+", help="credential JSON files or directories of them")
+    parser.add_argument("--workers", type=int, default=None, help="browsers at a time (default: batch_workers setting)")
+    parser.add_argument("--output", default=None, help="root of the per-account output directories")
+    parser.add_argument("--visible", action="store_true", help="show the browsers instead of running headless")
+    args = parser.parse_args()
+
+    files = credential_files(args.sources)
+    if not files: raise SystemExit("credential JSON 파일 없음")
+    start = time.perf_counter()
+    results = run_batch(files, args.workers, args.output, headless=not args.visible)
+    path = report(results, time.perf_counter() - start, args.output)
+    print(f"📋 보고서: {path}")
+    if not all(r["ok"] for r in results): sys.exit(1)
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()
@@ -0,0 +1,62 @@
+"""
+Analytics stage cost: the indexed 자산내역 x 투자원장 join against a row-by-row lookup (what a
+lookup formula per holding does in the workbook), and a full summarize against a cache hit.
+
+Usage: python benchmarks/bench_analytics.py [--rows 5000,50000] [--deals 3000] [--lookup-sample 2000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def make_frames(rows, deals):
+    import pandas as pd
+    from mock_tms import make_records
+    from schema import SCHEMAS
+    frames = {}
+    for view, sheet, count in (("asset", "자산내역", rows), ("deal", "투자원장", deals)):
+        schema = SCHEMAS[sheet]
+        frames[sheet] = schema.convert(pd.DataFrame([list(r.values()) for r in make_records(view, count)], columns=schema.headers))
+    asset = frames["자산내역"]
+    asset["평가액"] = asset["보유수량"] * asset["종가"]
+    return frames
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+def row_lookup(assets, deals, sample):
+    """One filter of the ledger per holding, like a lookup formula in every row"""
+    codes = deals["자산코드"].astype(str)
+    return [deals.loc[codes == code, "현재평가액"].sum() for code in assets["종목코드"].astype(str).head(sample)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", default="5000,50000")
+    parser.add_argument("--deals", type=int, default=3000)
+    parser.add_argument("--lookup-sample", type=int, default=2000, help="holdings looked up row by row (extrapolated)")
+    args = parser.parse_args()
+
+    import analytics
+    print(f"{'rows':>7}  {'row lookup':>11}  {'indexed join':>12}  {'summarize':>10}  {'cache (mem)':>11}  {'cache (disk)':>12}")
+    for rows in (int(r) for r in args.rows.split(",")):
+        frames = make_frames(rows, args.deals)
+        sample = min(args.lookup_sample, rows)
+        _, lookup = timed(lambda: row_lookup(frames["자산내역"], frames["투자원장"], sample))
+        lookup *= rows / sample
+        _, join = timed(lambda: analytics.join_holdings(frames["자산내역"], analytics.ledger_index(frames["투자원장"])))
+        _, full = timed(lambda: analytics.summarize(frames))
+
+        directory = tempfile.mkdtemp()
+        analytics.run_analytics(frames, directory)
+        _, memory = timed(lambda: analytics.run_analytics(frames, directory))
+        analytics._caches.clear()
+        _, disk = timed(lambda: analytics.run_analytics(frames, directory))
+        print(f"{rows:>7}  {lookup:>10.2f}s  {join * 1000:>10.0f}ms  {full * 1000:>8.0f}ms  {memory * 1000:>9.0f}ms  {disk * 1000:>10.0f}ms")
+
+if __name__ == "__main__":
+    main()
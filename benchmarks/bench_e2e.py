@@ -0,0 +1,104 @@
+"""
+End-to-end benchmark: scrape_once against the local mock TMS site (mock_tms.py), once per
+extraction strategy, reporting rows/sec, total latency and peak memory.
+
+Strategies: clipboard (context menu copy), script (in-page JSON serialization), scroll
+(scroll-and-harvest, spilled to disk), network (DevTools response capture) and http (browserless
+replay). --virtual makes the mock grids render only the rows in view, where only scroll, network
+and http see every row. Chrome runs headless; every case runs
+in its own subprocess so peak RSS of one case does not leak into the next. "browser" is the
+largest Chrome/chromedriver process of the case (Linux/macOS only).
+
+Usage: python benchmarks/bench_e2e.py [--rows 1000,10000] [--latency 0.2] [--strategies clipboard,script,scroll,network,http]
+                                      [--repeats 1] [--concurrent] [--virtual]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STRATEGIES = ["clipboard", "script", "scroll", "network", "http"]
+
+def peak_rss_mb(who="self"):
+    try:
+        import resource
+        target = resource.RUSAGE_SELF if who == "self" else resource.RUSAGE_CHILDREN
+        peak = resource.getrusage(target).ru_maxrss
+        return peak / 1024 if sys.platform != "darwin" else peak / (1024 * 1024)
+    except ImportError:
+        if who != "self": return None
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+        except Exception: return None
+
+def start_mock(rows, latency, virtual=False):
+    """Serve mock_tms in a background thread -> base url"""
+    import logging
+    from werkzeug.serving import make_server
+    from mock_tms import create_app
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", 0, create_app(rows=rows, require_login=True, latency=latency, virtual=virtual),
+                         threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+def run_case(strategy, url, concurrent):
+    """Child process: one scrape_once run with every table on the given strategy"""
+    import scrape
+    from easyscraperlib import update
+
+    scrape.USERID, scrape.PASSWORD = "mock", "mock"
+    update("details_url", url)
+    update("output_dir", tempfile.mkdtemp())
+    if strategy != "http":
+        for table in scrape.TABLES: update(table["extractor"], strategy)
+        update("capture_network", strategy == "network")
+
+    start = time.perf_counter()
+    frames = scrape.scrape_once(headless=True, concurrent=concurrent, http=strategy == "http", delta=False)
+    elapsed = time.perf_counter() - start
+    if strategy == "http" and not frames: raise SystemExit("http replay returned nothing")
+    rows = sum(len(df) for df in frames.values())
+    print(json.dumps({"seconds": elapsed, "rows": rows, "python_mb": peak_rss_mb(),
+                      "browser_mb": peak_rss_mb("children") if strategy != "http" else None}))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", default="1000,10000")
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds added to every mock API response")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES))
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--concurrent", action="store_true", help="extract the views in parallel browsers")
+    parser.add_argument("--virtual", action="store_true", help="mock grids render only the rows in view")
+    parser.add_argument("--case", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.case: return run_case(args.case[0], args.case[1], args.concurrent)
+
+    print(f"{'rows':>7}  {'strategy':<10}  {'seconds':>8}  {'rows/s':>9}  {'python':>8}  {'browser':>8}")
+    for rows in (int(r) for r in args.rows.split(",")):
+        url = start_mock(rows, args.latency, args.virtual)
+        for strategy in args.strategies.split(","):
+            for _ in range(args.repeats):
+                command = [sys.executable, __file__, "--case", strategy, url] + (["--concurrent"] if args.concurrent else [])
+                completed = subprocess.run(command, capture_output=True, text=True)
+                lines = completed.stdout.strip().splitlines()
+                if completed.returncode != 0 or not lines or not lines[-1].startswith("{"):
+                    error = (completed.stderr.strip().splitlines() or lines or ["no output"])[-1]
+                    print(f"{rows:>7}  {strategy:<10}  failed: {error}")
+                    continue
+                result = json.loads(lines[-1])
+                mb = lambda value: f"{value:.0f}MB" if value else "n/a"
+                rate = result["rows"] / result["seconds"] if result["seconds"] else 0
+                print(f"{rows:>7}  {strategy:<10}  {result['seconds']:>7.2f}s  {rate:>9,.0f}  "
+                      f"{mb(result['python_mb']):>8}  {mb(result['browser_mb']):>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Streaming zip-level export vs. openpyxl append mode, replacing the three scraped sheets of a
+workbook that also holds an untouched sheet of the same size.
+
+Every case runs in its own subprocess so the peak RSS of one case does not leak into the next.
+
+Usage: python benchmarks/bench_excel_export.py [--rows 10000,100000,1000000] [--openpyxl-max 100000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SHEETS = ["보유비중", "자산내역", "투자원장"]
+
+def peak_rss_mb():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 if sys.platform != "darwin" else peak / (1024 * 1024)
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+        except Exception: return None
+
+def make_frame(rows):
+    """자산내역-shaped frame: dates, categoricals, codes, text and numbers"""
+    import numpy as np
+    import pandas as pd
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "날짜": pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(rows) % 365, unit="D"),
+        "펀드": pd.Categorical(rng.choice(["AI 1호", "AI 2호", "메자닌 1호"], rows)),
+        "종목코드": [f"A{i % 100000:06d}" for i in range(rows)],
+        "종목명": [f"종목{i % 5000}" for i in range(rows)],
+        "보유수량": rng.integers(0, 1_000_000, rows),
+        "종가": rng.uniform(100, 500_000, rows).round(2),
+        "섹터": rng.choice(["IT", "바이오", "소재", "산업재"], rows),
+        "평가액": rng.uniform(0, 1e10, rows).round(0),
+    })
+
+def run_case(writer, rows):
+    """Child process: build the base workbook, then time replacing the scraped sheets"""
+    import pandas as pd
+    from excel_export import write_sheets
+
+    df = make_frame(rows)
+    directory = tempfile.mkdtemp()
+    filename = os.path.join(directory, "temp.xlsx")
+    write_sheets(filename, {"untouched": df, **{sheet: df for sheet in SHEETS}})
+    frames = {sheet: df for sheet in SHEETS}
+
+    start = time.perf_counter()
+    if writer == "stream":
+        write_sheets(filename, frames)
+    else:
+        with pd.ExcelWriter(filename, engine="openpyxl", mode="a", if_sheet_exists="replace") as excel:
+            for sheet, frame in frames.items(): frame.to_excel(excel, sheet_name=sheet, index=False)
+    elapsed = time.perf_counter() - start
+
+    size = os.path.getsize(filename)
+    os.remove(filename)
+    os.rmdir(directory)
+    print(json.dumps({"seconds": elapsed, "peak_rss_mb": peak_rss_mb(), "file_mb": size / (1024 * 1024)}))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", default="10000,100000,1000000")
+    parser.add_argument("--openpyxl-max", type=int, default=100000, help="skip openpyxl above this row count")
+    parser.add_argument("--case", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.case: return run_case(args.case[0], int(args.case[1]))
+
+    print(f"{'rows':>9}  {'writer':<8}  {'seconds':>8}  {'peak RSS':>9}  {'file':>8}")
+    for rows in (int(r) for r in args.rows.split(",")):
+        for writer in ("stream", "openpyxl"):
+            if writer == "openpyxl" and rows > args.openpyxl_max:
+                print(f"{rows:>9}  {writer:<8}  {'skipped':>8}")
+                continue
+            output = subprocess.run([sys.executable, __file__, "--case", writer, str(rows)],
+                                    capture_output=True, text=True, check=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            rss = f"{result['peak_rss_mb']:.0f}MB" if result["peak_rss_mb"] else "n/a"
+            print(f"{rows:>9}  {writer:<8}  {result['seconds']:>7.2f}s  {rss:>9}  {result['file_mb']:>6.1f}MB")
+
+if __name__ == "__main__":
+    main()
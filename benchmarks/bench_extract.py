@@ -0,0 +1,35 @@
+"""
+Compare the clipboard and in-page script extractors on the live TMS grids.
+
+Usage: python benchmarks/bench_extract.py <credentials.json> [repeats]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scrape
+from easyscraperlib import EasyScraper, grid_rows_stable
+
+VIEWS = [
+    ("보유비중(AI,Bond,재간접)", "#cell1_d"),
+    ("자산내역", "#cell0_d"),
+    ("투자 원장 조회", "#cell105_Id"),
+]
+
+def main():
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    _, _, headless = scrape.load_credentials(sys.argv[1] if len(sys.argv) > 1 else None)
+    scraper = EasyScraper(headless=headless or False)
+    scraper.setup()
+    try:
+        scrape.login(scraper)
+        scrape.open_operations(scraper)
+        for menu_text, cell_selector in VIEWS:
+            scraper.click_button_by_text(menu_text, until=grid_rows_stable(cell_selector))
+            scrape.benchmark_extractors(scraper, cell_selector, repeats)
+    finally:
+        scraper.cleanup()
+
+if __name__ == "__main__":
+    main()
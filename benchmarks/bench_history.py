@@ -0,0 +1,75 @@
+"""
+Query latency of the Parquet history store over a year of daily snapshots.
+
+Builds --days daily runs of 자산내역 (--rows rows) and 보유비중 (--weight-rows rows) in a temporary
+directory, then times typical queries with partition pruning and column projection.
+
+Usage: python benchmarks/bench_history.py [--days 365] [--rows 5000] [--weight-rows 60] [--repeats 5]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def make_frames(rows, weight_rows):
+    import pandas as pd
+    from mock_tms import make_records
+    from schema import SCHEMAS
+    frames = {}
+    for view, sheet, count in (("asset", "자산내역", rows), ("weight", "보유비중", weight_rows)):
+        schema = SCHEMAS[sheet]
+        frames[sheet] = schema.convert(pd.DataFrame([list(r.values()) for r in make_records(view, count)], columns=schema.headers))
+    asset = frames["자산내역"]
+    asset["평가액"] = asset["보유수량"] * asset["종가"]
+    return frames
+
+def timed(function, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--weight-rows", type=int, default=60)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    from history import HistoryStore
+    frames = make_frames(args.rows, args.weight_rows)
+    directory = tempfile.mkdtemp()
+    try:
+        store = HistoryStore(directory)
+        first = datetime(2025, 1, 1, 8, 30)
+        start = time.perf_counter()
+        for day in range(args.days): store.append(frames, first + timedelta(days=day))
+        write = time.perf_counter() - start
+        size = sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(directory) for f in files)
+        print(f"wrote {args.days} days in {write:.1f}s ({write / args.days * 1000:.0f}ms/run), {size / (1024 * 1024):.1f}MB on disk")
+
+        last = first + timedelta(days=args.days - 1)
+        queries = [
+            ("평가액, one 펀드, one quarter", lambda: store.fund_values("타임폴리오 AI 1호", start=last - timedelta(days=90), end=last)),
+            ("평가액, one 펀드, whole history", lambda: store.fund_values("타임폴리오 AI 1호")),
+            ("보유비중 펀드내비중 trend", lambda: store.weight_trend("펀드내비중")),
+            ("자산내역, latest day, all columns", lambda: store.query("자산내역", start=last, end=last)),
+            ("자산내역 종목코드 == A100042, history", lambda: store.query("자산내역", columns=["종목코드", "평가액"], filters={"종목코드": "A100042"})),
+        ]
+        print(f"{'query':<40}  {'rows':>8}  {'ms':>8}")
+        for name, query in queries:
+            result, seconds = timed(query, args.repeats)
+            print(f"{name:<40}  {len(result):>8}  {seconds * 1000:>8.1f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
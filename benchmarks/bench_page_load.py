@@ -0,0 +1,75 @@
+"""
+Page load of the mock TMS site (mock_tms.py with heavy subresources) under each resource policy:
+page_load_strategy normal/eager, with and without blocked_urls, reporting the time until the
+login form is usable, requests and transferred bytes per load (EasyScraper.open/page_loads).
+
+Every case starts its own headless Chrome, so nothing is served from a warm HTTP cache.
+
+Usage: python benchmarks/bench_page_load.py [--assets 30] [--asset-kb 80] [--latency 0.1] [--repeats 3]
+"""
+import argparse
+import logging
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CASES = [
+    ("normal", "normal", False),
+    ("eager", "eager", False),
+    ("normal + blocked", "normal", True),
+    ("eager + blocked", "eager", True),
+]
+
+def serve(assets, asset_kb, latency):
+    from werkzeug.serving import make_server
+    from mock_tms import create_app
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", 0, create_app(rows=100, require_login=True, latency=latency, assets=assets,
+                                                    asset_kb=asset_kb), threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}/"
+
+def run_case(url, strategy, blocked, repeats):
+    from easyscraperlib import EasyScraper, element_clickable, get, update
+    patterns = list(get("blocked_urls") or [])
+    update("page_load_strategy", strategy)
+    # The mock serves its tracker locally; the real ones are matched by the analytics host patterns
+    update("blocked_urls", patterns + ["*/asset/analytics.js"] if blocked else [])
+    try:
+        loads = []
+        for _ in range(repeats):
+            scraper = EasyScraper(headless=True)
+            scraper.setup()
+            try:
+                scraper.open(url, until=element_clickable("#userId"), name="login page")
+                loads.append(scraper.page_loads[-1])
+            finally: scraper.cleanup()
+        return loads
+    finally: update("blocked_urls", patterns)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--assets", type=int, default=30)
+    parser.add_argument("--asset-kb", type=int, default=80)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    url = serve(args.assets, args.asset_kb, args.latency)
+    results = []
+    for name, strategy, blocked in CASES:
+        try: loads = run_case(url, strategy, blocked, args.repeats)
+        except Exception as e:
+            print(f"{name} failed: {e}")
+            continue
+        best = min(loads, key=lambda load: load["seconds"])
+        results.append((name, best))
+
+    print(f"{'case':<18}  {'ready':>8}  {'requests':>8}  {'transfer':>10}")
+    for name, load in results:
+        print(f"{name:<18}  {load['seconds']:>7.2f}s  {load['requests']:>8}  {load['transfer_bytes'] / 1024:>8.0f}KB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+GUI startup cost: module import times and time to the first painted window.
+
+Every measurement runs in a fresh interpreter. Import times cover the modules the GUI used to load
+before drawing anything (scrape pulls in pandas, selenium and openpyxl). First paint is taken
+from the launch of `gui.py --startup-timing` to the window's first idle callback, lazy (scrape
+imported in the background after the paint) against eager (scrape imported before the window,
+as gui.py used to). First paint needs a display; without one only import times are reported.
+
+Usage: python benchmarks/bench_startup.py [--repeats 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = ["tkinter", "pandas", "selenium.webdriver", "openpyxl", "easyscraperlib", "scrape", "gui"]
+
+EAGER = "import sys; sys.argv = ['gui.py', '--startup-timing']; import scrape, gui; gui.main()"
+
+def import_seconds(module):
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+def first_paint(command):
+    """-> (seconds from launch to first paint, seconds from launch until scrape is imported)"""
+    launched = time.time()
+    output = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True, timeout=60).stdout
+    report = json.loads(output.strip().splitlines()[-1])
+    finished = time.time()
+    return report["first_paint_at"] - launched, finished - launched
+
+def has_display():
+    code = "import tkinter; tkinter.Tk().destroy()"
+    return subprocess.run([sys.executable, "-c", code], capture_output=True).returncode == 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'import':<20}  {'ms (best of ' + str(args.repeats) + ')':>16}")
+    for module in MODULES:
+        try: best = min(import_seconds(module) for _ in range(args.repeats))
+        except subprocess.CalledProcessError as e:
+            print(f"{module:<20}  {'failed':>16}  {e.stderr.strip().splitlines()[-1]}")
+            continue
+        print(f"{module:<20}  {best * 1000:>16.0f}")
+
+    if not has_display():
+        print("no display: first paint not measured")
+        return
+    print(f"{'startup':<20}  {'first paint ms':>16}  {'ready ms':>10}")
+    for name, command in (("lazy", [sys.executable, "gui.py", "--startup-timing"]), ("eager", [sys.executable, "-c", EAGER])):
+        runs = [first_paint(command) for _ in range(args.repeats)]
+        paint, ready = min(r[0] for r in runs), min(r[1] for r in runs)
+        print(f"{name:<20}  {paint * 1000:>16.0f}  {ready * 1000:>10.0f}")
+
+if __name__ == "__main__":
+    main()
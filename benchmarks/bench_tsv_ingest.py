@@ -0,0 +1,61 @@
+"""
+Clipboard/grid TSV ingestion: Python list-of-lists path vs. the pandas C parser path.
+
+Both paths end with the same 자산내역 schema conversion; peak memory is measured with tracemalloc
+on top of the TSV text itself.
+
+Usage: python benchmarks/bench_tsv_ingest.py [--rows 10000,100000,500000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def make_tsv(rows):
+    """자산내역-shaped clipboard text, formatted the way the grid displays it"""
+    from mock_tms import make_records
+    lines = []
+    for record in make_records("asset", rows):
+        lines.append("\t".join(f"{v:,}" if isinstance(v, (int, float)) else str(v) for v in record.values()))
+    return "\r\n".join(lines) + "\r\n"
+
+def measure(function, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / (1024 * 1024)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", default="10000,100000,500000")
+    args = parser.parse_args()
+
+    import scrape
+    from easyscraperlib import EasyScraper
+    from schema import SCHEMAS
+
+    def list_path(text):
+        return scrape.create_dataframe_from_rows(EasyScraper.parse_tsv_to_rows(text), SCHEMAS["자산내역"])
+
+    def tsv_path(text):
+        return scrape.create_dataframe_from_tsv(text, SCHEMAS["자산내역"])
+
+    print(f"{'rows':>8}  {'text':>7}  {'path':<6}  {'seconds':>8}  {'peak':>8}")
+    for rows in (int(r) for r in args.rows.split(",")):
+        text = make_tsv(rows)
+        text_mb = len(text.encode("utf-8")) / (1024 * 1024)
+        results = {}
+        for name, function in (("lists", list_path), ("tsv", tsv_path)):
+            df, elapsed, peak = measure(function, text)
+            results[name] = df
+            print(f"{rows:>8}  {text_mb:>5.1f}MB  {name:<6}  {elapsed:>7.2f}s  {peak:>6.1f}MB")
+        assert results["lists"].equals(results["tsv"]), "paths disagree"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Daemon mode: run scrape jobs on a cron-like schedule, keeping a logged-in browser warm in the
+ScraperPool between jobs.
+
+- Triggers that fire while a job is running (missed schedule slots, trigger() calls) are
+  coalesced into a single follow-up run instead of starting a second Chrome.
+- A failed job is retried with jittered exponential backoff until it succeeds, max_retries is
+  reached or the next scheduled slot comes up.
+- temp.xlsx is replaced atomically by write_sheets; after every successful job the daemon also
+  publishes a copy to publish_path (temp file + os.replace), so readers of either file never see
+  a half-written workbook, and records the run in last_success.json.
+
+Usage: python daemon.py [credentials.json] [--schedule "*/30 8-18 * * 1-5"] [--headless] [--once] [--serve]
+   or: scraper.exe [credentials.json] --daemon [--serve]
+"""
+import os
+import random
+import shutil
+import tempfile
+import threading
+from datetime import datetime, timedelta
+
+from easyscraperlib import get, write_json_atomic
+
+class CronSchedule:
+    """
+    Five-field cron expression: minute hour day-of-month month day-of-week (0 or 7 = Sunday).
+    Fields accept *, lists (1,15), ranges (8-18) and steps (*/30, 8-18/2).
+    """
+    FIELDS = [("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 7)]
+
+    def __init__(self, expression):
+        parts = expression.split()
+        if len(parts) != 5: raise ValueError(f"cron expression needs 5 fields: {expression!r}")
+        self.expression = expression
+        self.fields = {}
+        for text, (name, low, high) in zip(parts, self.FIELDS):
+            self.fields[name] = self._parse(text, low, high)
+        if 7 in self.fields["weekday"]: self.fields["weekday"] = (self.fields["weekday"] - {7}) | {0}
+        # Standard cron: when both day fields are restricted, either one matching is enough
+        self._day_or = parts[2] != "*" and parts[4] != "*"
+
+    @staticmethod
+    def _parse(text, low, high):
+        values = set()
+        for item in text.split(","):
+            spec, _, step = item.partition("/")
+            if spec == "*": start, end = low, high
+            elif "-" in spec: start, end = (int(v) for v in spec.split("-"))
+            else: start = end = int(spec)
+            if step and spec != "*" and "-" not in spec: end = high
+            if not low <= start <= end <= high: raise ValueError(f"cron field out of range: {item!r}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, moment):
+        day = moment.day in self.fields["day"]
+        weekday = (moment.isoweekday() % 7) in self.fields["weekday"]
+        return (day or weekday) if self._day_or else (day and weekday)
+
+    def next_after(self, moment):
+        """-> first datetime strictly after moment (to the minute) matching the schedule"""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.fields["month"] or not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.fields["hour"]:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.fields["minute"]:
+                candidate += timedelta(minutes=1)
+            else: return candidate
+        raise ValueError(f"cron expression never fires: {self.expression!r}")
+
+def backoff_delay(attempt, base, maximum):
+    """Exponential backoff with jitter: a random delay in [50%, 100%] of min(maximum, base * 2^attempt)"""
+    return min(maximum, base * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+def publish(source, destination):
+    """Copy source to destination atomically: readers see the old file or the new one, never a partial copy"""
+    directory = os.path.dirname(os.path.abspath(destination))
+    os.makedirs(directory, exist_ok=True)
+    # Unique temp name: two daemons publishing to one share never replace each other's half-written copy
+    fd, temp = tempfile.mkstemp(prefix=f".{os.path.basename(destination)}-", suffix=".tmp", dir=directory)
+    os.close(fd)
+    try:
+        shutil.copyfile(source, temp)
+        os.replace(temp, destination)
+    except BaseException:
+        try: os.remove(temp)
+        except OSError: pass
+        raise
+
+def write_status(path, status):
+    write_json_atomic(path, status, indent=2)
+
+class Daemon:
+    def __init__(self, job, schedule, output_file, publish_path=None, backoff_base=None, backoff_max=None, max_retries=None):
+        """
+        job: callable running one scrape, returning dict sheet name -> DataFrame; raises on failure
+        schedule: CronSchedule
+        output_file: workbook the job writes (temp.xlsx); last_success.json goes next to it
+        publish_path: where to publish a copy after each success (None: temp.xlsx only)
+        """
+        self.job = job
+        self.schedule = schedule
+        self.output_file = output_file
+        self.publish_path = publish_path or None
+        self.backoff_base = backoff_base if backoff_base is not None else get("backoff_base", 30)
+        self.backoff_max = backoff_max if backoff_max is not None else get("backoff_max", 600)
+        self.max_retries = max_retries if max_retries is not None else get("max_retries", 5)
+        self._lock = threading.Lock()
+        self._running = False
+        self._pending = False
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+
+    def trigger(self):
+        """
+        Ask for a run now. While a job is running, any number of triggers collapse into one
+        follow-up run.
+        -> False if the trigger was coalesced into a pending run
+        """
+        with self._lock:
+            coalesced = self._running or self._pending
+            self._pending = True
+        self._wake.set()
+        return not coalesced
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+
+    def _sleep_until(self, moment):
+        """Wait until moment, a trigger() or stop() -> True if woken early"""
+        while not self._stopped.is_set():
+            remaining = (moment - datetime.now()).total_seconds()
+            if remaining <= 0: return False
+            if self._wake.wait(min(remaining, 60)):
+                self._wake.clear()
+                return True
+        return True
+
+    def run_job(self, deadline=None):
+        """
+        Run the job with retries; jittered exponential backoff between attempts.
+        deadline: stop retrying once the next scheduled slot is due
+        -> bool: whether a run succeeded
+        """
+        with self._lock:
+            if self._running: return False
+            self._running, self._pending = True, False
+        self._wake.clear()
+        try:
+            for attempt in range(self.max_retries + 1):
+                started = datetime.now()
+                try:
+                    frames = self.job()
+                    self._published(started, frames)
+                    return True
+                except Exception as e:
+                    print(f"❌ 실행 실패 ({attempt + 1}/{self.max_retries + 1}): {e}")
+                if attempt == self.max_retries: break
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+                if deadline and datetime.now() + timedelta(seconds=delay) >= deadline:
+                    print("다음 예약 실행이 가까워 재시도 중단")
+                    break
+                print(f"{delay:.0f}초 후 재시도")
+                if self._stopped.wait(delay): break
+            return False
+        finally:
+            with self._lock: self._running = False
+
+    def _published(self, started, frames):
+        if self.publish_path and os.path.exists(self.output_file):
+            publish(self.output_file, self.publish_path)
+            print(f"📤 게시 완료: {self.publish_path}")
+        status = {
+            "started_at": started.isoformat(timespec="seconds"),
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "rows": {sheet: len(df) for sheet, df in (frames or {}).items()},
+            "published": self.publish_path,
+        }
+        write_status(os.path.join(os.path.dirname(self.output_file), "last_success.json"), status)
+
+    def run_forever(self):
+        """Run jobs on schedule until stop(); missed slots while a job runs are coalesced"""
+        print(f"⏰ 예약 실행 시작: {self.schedule.expression}")
+        while not self._stopped.is_set():
+            next_run = self.schedule.next_after(datetime.now())
+            if not self._pending:
+                print(f"다음 실행: {next_run:%Y-%m-%d %H:%M}")
+                self._sleep_until(next_run)
+            if self._stopped.is_set(): break
+            started = datetime.now()
+            self.run_job(deadline=self.schedule.next_after(datetime.now()))
+            skipped = self._missed_slots(started, datetime.now())
+            if skipped: print(f"실행 중 놓친 예약 {skipped}건은 이번 실행으로 대체")
+
+    def _missed_slots(self, start, end):
+        count, slot = 0, self.schedule.next_after(start)
+        while slot <= end and count < 1000:
+            count += 1
+            slot = self.schedule.next_after(slot)
+        return count
+
+def run_daemon(job, output_file, schedule=None, once=False):
+    """
+    Build a Daemon from the "daemon" settings and run it until Ctrl+C
+
+    job: callable running one scrape (see scrape.scrape_once)
+    output_file: temp.xlsx written by the job
+    once: run a single job (with retries) and return
+    """
+    daemon = Daemon(job, CronSchedule(schedule or get("schedule", "*/30 8-18 * * 1-5")),
+                    output_file=output_file, publish_path=get("publish_path"))
+    if once: return daemon.run_job()
+    try: daemon.run_forever()
+    except KeyboardInterrupt: print("예약 실행 종료")
+    finally: daemon.stop()
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Scheduled scraping with a warm browser")
+    parser.add_argument("credentials", nargs="?", help="credentials JSON (id, pw, headless)")
+    parser.add_argument("--schedule", help='cron expression, e.g. "*/30 8-18 * * 1-5" (default: "schedule" setting)')
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--once", action="store_true", help="run one job with retries and exit")
+    parser.add_argument("--serve", action="store_true", help="serve the latest tables over HTTP (see snapshot_service.py)")
+    args = parser.parse_args()
+
+    import scrape
+    _, _, headless_from_file = scrape.load_credentials(args.credentials)
+    headless = headless_from_file if headless_from_file is not None else args.headless
+    if args.serve or get("service_enabled", False):
+        from snapshot_service import serve
+        serve()
+    try:
+        run_daemon(lambda: scrape.scrape_once(headless=headless, pool=scrape.get_pool(headless)),
+                   os.path.join(scrape.get_output_dir(), "temp.xlsx"), schedule=args.schedule, once=args.once)
+    finally: scrape.close_pool()
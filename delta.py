@@ -0,0 +1,152 @@
+"""
+Incremental export: diff each freshly scraped table against the previous snapshot by its
+natural key, so only inserted, updated and removed rows are written.
+"""
+import os
+from datetime import datetime
+
+import pandas as pd
+
+# Natural keys per sheet; the first candidate whose columns exist and identify rows uniquely is used
+KEYS = {
+    "보유비중": [["날짜", "펀드 - 펀드"]],
+    "자산내역": [["날짜", "펀드", "종목코드"]],
+    "투자원장": [["투자번호"], ["ID"]],
+}
+
+CHANGE_INSERTED = "추가"
+CHANGE_UPDATED = "수정"
+CHANGE_REMOVED = "삭제"
+
+def resolve_keys(sheet, *frames):
+    """-> key columns usable on every frame, or None when the sheet cannot be diffed by key"""
+    for keys in KEYS.get(sheet, []):
+        if all(_unique_key(df, keys) for df in frames): return keys
+    return None
+
+def _unique_key(df, keys):
+    if any((df.columns == key).sum() != 1 for key in keys): return False
+    key_frame = df[keys]
+    return not key_frame.isna().any().any() and not key_frame.duplicated().any()
+
+def _key_index(df, keys):
+    # Keys compare as text so 1001 (parsed) and "1001" (previous snapshot) match
+    return pd.MultiIndex.from_frame(df[keys].astype(str))
+
+def diff_frames(old, new, keys):
+    """
+    Compare two snapshots of one table row by row on their key
+
+    old, new: DataFrames with the same columns
+    keys: key column names
+    -> dict: "inserted", "updated" (new values) and "removed" (old values) DataFrames
+    """
+    old_index = _key_index(old, keys)
+    new_index = _key_index(new, keys)
+    inserted = new[~new_index.isin(old_index)]
+    removed = old[~old_index.isin(new_index)]
+
+    # Positional comparison: 보유비중 repeats column names, so compare the value matrices
+    common_new = new[new_index.isin(old_index)]
+    position = pd.Series(range(len(old)), index=old_index)
+    common_old = old.iloc[position.loc[_key_index(common_new, keys)].to_numpy()]
+    new_values = common_new.to_numpy(dtype=object)
+    old_values = common_old.to_numpy(dtype=object)
+    same = (new_values == old_values) | (pd.isna(new_values) & pd.isna(old_values))
+    changed = ~same.all(axis=1)
+    return {"inserted": inserted, "updated": common_new[changed], "removed": removed}
+
+def apply_delta(old, delta, keys):
+    """
+    Patch the previous snapshot: drop removed rows, replace updated rows in place, append inserted rows.
+    Keeps the previous row order so the sheet reads like the old one with edits.
+    """
+    old_index = _key_index(old, keys)
+    patched = old[~old_index.isin(_key_index(delta["removed"], keys))].copy()
+    if len(delta["updated"]):
+        patched_index = _key_index(patched, keys)
+        position = pd.Series(range(len(patched)), index=patched_index)
+        rows = position.loc[_key_index(delta["updated"], keys)].to_numpy()
+        for column in range(patched.shape[1]):
+            patched.isetitem(column, _set_rows(patched.iloc[:, column], rows, delta["updated"].iloc[:, column]))
+    return pd.concat([patched, delta["inserted"]], ignore_index=True)
+
+def _set_rows(series, rows, values):
+    series = series.astype(object) if series.dtype != values.dtype else series.copy()
+    series.iloc[rows] = values.to_numpy()
+    return series
+
+def change_log(delta, run_time=None):
+    """
+    -> DataFrame with one line per changed row: 실행시각, 구분 (추가/수정/삭제) and the row itself
+       (new values for inserted and updated rows, the last known values for removed ones)
+    """
+    run_time = run_time or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    parts = []
+    for kind, label in (("inserted", CHANGE_INSERTED), ("updated", CHANGE_UPDATED), ("removed", CHANGE_REMOVED)):
+        df = delta[kind]
+        if df.empty: continue
+        # Column-position safe: 보유비중 repeats column names
+        part = df.reset_index(drop=True)
+        part.insert(0, "구분", label, allow_duplicates=True)
+        part.insert(0, "실행시각", run_time, allow_duplicates=True)
+        parts.append(part)
+    return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+
+def append_log(previous, log, max_rows):
+    """-> previous change log with log appended, keeping the last max_rows lines (restarted when the columns changed)"""
+    if previous is not None and list(previous.columns) == list(log.columns): log = pd.concat([previous, log], ignore_index=True)
+    return log.tail(max_rows).reset_index(drop=True)
+
+class SnapshotStore:
+    """Previous snapshot of every sheet, pickled next to the workbook so it loads without parsing Excel"""
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, sheet):
+        return os.path.join(self.directory, f"{sheet}.pkl")
+
+    def load(self, sheet, excel_filename=None):
+        """-> previous DataFrame, bootstrapped once from the workbook if no snapshot exists; None if neither"""
+        if os.path.exists(self._path(sheet)): return pd.read_pickle(self._path(sheet))
+        if excel_filename and os.path.exists(excel_filename):
+            try: return pd.read_excel(excel_filename, sheet_name=sheet)
+            except ValueError: return None  # sheet not in the workbook yet
+        return None
+
+    def save(self, sheet, df):
+        os.makedirs(self.directory, exist_ok=True)
+        df.to_pickle(self._path(sheet))
+
+def compute_deltas(frames, store, excel_filename=None):
+    """
+    Diff every new frame against its previous snapshot
+
+    frames: dict sheet name -> new DataFrame
+    -> dict sheet name -> {"target": DataFrame to write or None if unchanged, "delta": dict or None,
+                           "log": DataFrame of changed rows (see change_log)}
+    """
+    results = {}
+    run_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for sheet, new in frames.items():
+        old = store.load(sheet, excel_filename)
+        keys = resolve_keys(sheet, new) if old is None else resolve_keys(sheet, old, new)
+        if old is None or keys is None or list(old.columns) != list(new.columns):
+            # No usable previous snapshot: the whole table is new
+            results[sheet] = {"target": new, "delta": None, "log": pd.DataFrame()}
+            continue
+        delta = diff_frames(old, new, keys)
+        changed = any(len(df) for df in delta.values())
+        results[sheet] = {
+            "target": apply_delta(old, delta, keys) if changed else None,
+            "delta": delta,
+            "log": change_log(delta, run_time),
+        }
+    return results
+
+def report(results):
+    """Print change counts per sheet"""
+    for sheet, result in results.items():
+        delta = result["delta"]
+        if delta is None: print(f"{sheet}: 전체 기록 ({len(result['target'])}행)")
+        else: print(f"{sheet}: +{len(delta['inserted'])} ~{len(delta['updated'])} -{len(delta['removed'])}")
@@ -1,20 +1,46 @@
 import json
+import re
 import time
+import base64
+import tempfile
+import threading
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import pyperclip
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from tracing import span, count_commands
 
 import json
 import os
 import sys
 
 class Settings:
-    def __init__(self):
+    """
+    system_constants.json, looked up through one flattened key -> value table (keys are unique
+    across sections). The file is re-read when it changes on disk, checked at most every
+    reload_interval seconds; values set through update()/update_section() survive a reload.
+    """
+    def __init__(self, reload_interval=1.0):
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._overrides = {}
+        self._section_overrides = {}
+        self._mtime = None
+        self._checked = time.monotonic()
         self._system_data = self.load_system_constants()
+        self._flat = self._flatten()
     
     def _get_resource_path(self, relative_path):
         """Get the resource path, checking both exe directory and PyInstaller temp directory"""
@@ -37,24 +63,65 @@ class Settings:
         
         return os.path.join(base_path, relative_path)
     
+    def _read(self):
+        file_path = self._get_resource_path("system_constants.json")
+        mtime = os.path.getmtime(file_path)
+        with open(file_path, 'r', encoding='utf-8') as f: data = json.load(f)
+        self._mtime = mtime
+        return data
+    
     def load_system_constants(self):
-        try:
-            file_path = self._get_resource_path("system_constants.json")
-            with open(file_path, 'r', encoding='utf-8') as f: return json.load(f)
+        try: return self._read()
         except Exception as e:
             print(f"Failed to load system_constants.json: {e}")
             return {}
     
-    def get(self, key, default=None):
+    def _flatten(self):
+        """-> dict key -> value over every section; the first section holding a key wins"""
+        flat = {}
         for section in self._system_data.values():
-            if isinstance(section, dict) and key in section: return section[key]
-        return default
+            if isinstance(section, dict):
+                for key, value in section.items(): flat.setdefault(key, value)
+        return flat
+    
+    def reload(self):
+        """Re-read system_constants.json if it changed on disk -> True if reloaded"""
+        try: mtime = os.path.getmtime(self._get_resource_path("system_constants.json"))
+        except OSError: return False
+        if mtime == self._mtime: return False
+        try: data = self._read()
+        except Exception as e:
+            # Half-saved or invalid file: keep serving the current values until the next change
+            self._mtime = mtime
+            print(f"⚠️ system_constants.json 다시 읽기 실패, 이전 설정 유지: {e}")
+            return False
+        with self._lock:
+            data.update(self._section_overrides)
+            for key, value in self._overrides.items():
+                for section in data.values():
+                    if isinstance(section, dict) and key in section:
+                        section[key] = value
+                        break
+            self._system_data = data
+            self._flat = self._flatten()
+        print("🔄 system_constants.json 변경 반영")
+        return True
+    
+    def get(self, key, default=None):
+        now = time.monotonic()
+        if now - self._checked > self.reload_interval:
+            self._checked = now
+            self.reload()
+        return self._flat.get(key, default)
     
     def update(self, key, value):
-        for section_name, section_data in self._system_data.items():
-            if key in section_data:
-                self._system_data[section_name][key] = value
-                return True
+        with self._lock:
+            for section_name, section_data in self._system_data.items():
+                if isinstance(section_data, dict) and key in section_data:
+                    self._system_data[section_name][key] = value
+                    self._overrides[key] = value
+                    self._flat = self._flatten()
+                    return True
         return False
     
     def get_section(self, section_name):
@@ -62,7 +129,11 @@ class Settings:
     
     def update_section(self, section_name, data):
         try:
-            self._system_data[section_name] = data
+            with self._lock:
+                self._system_data[section_name] = data
+                self._section_overrides[section_name] = data
+                for key in data: self._overrides.pop(key, None)
+                self._flat = self._flatten()
             return True
         except Exception: return False
 
@@ -73,106 +144,763 @@ def get_section(section_name): return _settings.get_section(section_name)
 def update_section(section_name, data): return _settings.update_section(section_name, data)
 def get_resource_path(relative_path): return _settings._get_resource_path(relative_path)
 
+def write_json_atomic(path, data, **dump_options):
+    """
+    Write data as JSON to path atomically: readers see the old file or the new one. The temp file
+    is unique (mkstemp in the same directory), so processes sharing the file (batch workers) never
+    replace each other's half-written temp. Raises OSError; the last writer wins.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp = tempfile.mkstemp(prefix=f".{os.path.basename(path)}-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f: json.dump(data, f, ensure_ascii=False, **dump_options)
+        os.replace(temp, path)
+    except BaseException:
+        try: os.remove(temp)
+        except OSError: pass
+        raise
+
+# Wait conditions: callables usable with WebDriverWait.until that describe what an
+# action is waiting for, so the action returns as soon as the page reaches that state.
+_DOM_IDLE_JS = """
+var w = window;
+if (!w.__esDom) {
+    w.__esDom = {last: performance.now()};
+    new MutationObserver(function() { w.__esDom.last = performance.now(); })
+        .observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+return document.readyState === 'complete' ? performance.now() - w.__esDom.last : -1;
+"""
+
+_NETWORK_IDLE_JS = """
+var w = window;
+if (!w.__esNet) {
+    var net = w.__esNet = {pending: 0, last: performance.now()};
+    var done = function() { net.pending = Math.max(0, net.pending - 1); net.last = performance.now(); };
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        net.pending++; net.last = performance.now();
+        this.addEventListener('loadend', done);
+        return send.apply(this, arguments);
+    };
+    if (w.fetch) {
+        var fetch = w.fetch;
+        w.fetch = function() { net.pending++; net.last = performance.now(); return fetch.apply(this, arguments).finally(done); };
+    }
+}
+if (w.__esNet.pending > 0 || document.readyState !== 'complete') return -1;
+var entries = performance.getEntriesByType('resource');
+var last = entries.length ? entries[entries.length - 1].responseEnd : 0;
+return performance.now() - Math.max(w.__esNet.last, last);
+"""
+
+_GRID_ROWS_JS = """
+var cell = document.querySelector(arguments[0]);
+if (!cell) return -1;
+var grid = cell.closest(arguments[1]) || cell.closest('table');
+return grid.querySelectorAll('tbody tr').length;
+"""
+
+# Serializes a whole datagrid inside the page so it crosses the WebDriver wire once
+_GRID_EXTRACT_JS = """
+var cell = document.querySelector(arguments[0]);
+if (!cell) return null;
+var grid = cell.closest(arguments[1]) || cell.closest('table');
+var text = function(el) { return (el.textContent || '').trim(); };
+var collect = function(selector, cellSelector) {
+    var out = [];
+    var trs = grid.querySelectorAll(selector);
+    for (var i = 0; i < trs.length; i++) {
+        var tds = trs[i].querySelectorAll(cellSelector);
+        if (!tds.length) continue;
+        var row = new Array(tds.length);
+        for (var j = 0; j < tds.length; j++) row[j] = text(tds[j]);
+        out.push(row);
+    }
+    return out;
+};
+return JSON.stringify({headers: collect('thead tr', 'th,td'), rows: collect('tbody tr', 'td')});
+"""
+
+# Harvest step for virtualized datagrids that only render the rows in view. Returns up to `limit`
+# rendered rows not returned before (deduplicated by the key cells, or the whole row), resuming
+# after the last row read while the DOM is unchanged. When every rendered row is read and the
+# grid's own scroll viewport holds more than it renders, scrolls it by 80% of a screen.
+# The grid is remembered, as the starting cell disappears once it scrolls out of view.
+_GRID_HARVEST_JS = """
+var cell = document.querySelector(arguments[0]);
+var grid = cell ? (cell.closest(arguments[1]) || cell.closest('table')) : window.__esHarvestGrid;
+if (!grid || !grid.isConnected) return null;
+var keys = arguments[2], limit = arguments[3];
+if (arguments[4] || !grid.__esHarvest) grid.__esHarvest = {seen: new Set(), cursor: 0, cursorKey: null};
+window.__esHarvestGrid = grid;
+var state = grid.__esHarvest;
+var read = function(tr) {
+    var tds = tr.querySelectorAll('td'), row = new Array(tds.length);
+    for (var j = 0; j < tds.length; j++) row[j] = (tds[j].textContent || '').trim();
+    return row;
+};
+var keyOf = function(row) { return (keys.length ? keys.map(function(i) { return row[i]; }) : row).join('\u0001'); };
+var trs = Array.prototype.filter.call(grid.querySelectorAll('tbody tr'), function(tr) { return tr.querySelector('td'); });
+var i = state.cursor > 0 && state.cursor <= trs.length && keyOf(read(trs[state.cursor - 1])) === state.cursorKey ? state.cursor : 0;
+var rows = [];
+for (; i < trs.length && rows.length < limit; i++) {
+    var row = read(trs[i]);
+    if (row.every(function(v) { return v === ''; })) continue;
+    var key = keyOf(row);
+    if (state.seen.has(key)) continue;
+    state.seen.add(key);
+    rows.push(row);
+}
+state.cursor = i;
+state.cursorKey = i > 0 ? keyOf(read(trs[i - 1])) : null;
+var more = i < trs.length, scrolled = false;
+var signature = trs.length + '|' + (trs.length ? keyOf(read(trs[0])) + '|' + keyOf(read(trs[trs.length - 1])) : '');
+if (!more) {
+    var tbody = grid.querySelector('tbody'), scroller = null;
+    for (var el = tbody.parentElement; el; el = el === grid ? null : el.parentElement) {
+        if (el.scrollHeight > el.clientHeight + 1 && /(auto|scroll)/.test(getComputedStyle(el).overflowY)) { scroller = el; break; }
+    }
+    var virtual = scroller && scroller.scrollHeight - tbody.offsetHeight > scroller.clientHeight / 2;
+    if (virtual && scroller.scrollTop + scroller.clientHeight < scroller.scrollHeight - 1) {
+        scroller.scrollTop += Math.max(1, Math.floor(scroller.clientHeight * 0.8));
+        scrolled = true;
+    }
+}
+return {rows: rows, more: more, scrolled: scrolled, signature: signature, seen: state.seen.size};
+"""
+
+_GRID_SIGNATURE_JS = """
+var grid = window.__esHarvestGrid;
+if (!grid || !grid.isConnected) return null;
+var trs = Array.prototype.filter.call(grid.querySelectorAll('tbody tr'), function(tr) { return tr.querySelector('td'); });
+var keys = arguments[0];
+var keyOf = function(tr) {
+    var tds = tr.querySelectorAll('td'), row = [];
+    for (var j = 0; j < tds.length; j++) row.push((tds[j].textContent || '').trim());
+    return (keys.length ? keys.map(function(i) { return row[i]; }) : row).join('\u0001');
+};
+return trs.length + '|' + (trs.length ? keyOf(trs[0]) + '|' + keyOf(trs[trs.length - 1]) : '');
+"""
+
+# First visible cell of a datagrid whose id matches a pattern, found in one query
+_FIRST_CELL_JS = """
+var pattern = new RegExp(arguments[0]);
+var grids = document.querySelectorAll(arguments[1]);
+var scopes = grids.length ? grids : [document];
+for (var g = 0; g < scopes.length; g++) {
+    var elements = scopes[g].querySelectorAll('[id]');
+    for (var i = 0; i < elements.length; i++) {
+        var el = elements[i];
+        if (pattern.test(el.id) && el.getClientRects().length) return '#' + CSS.escape(el.id);
+    }
+}
+return null;
+"""
+
+# Datagrid holding the first visible cell whose id matches a pattern, identified across a view switch.
+# arguments[2] set: tag that grid with the mark and return its header text (null: no such grid yet).
+# Otherwise: the cell's selector once it sits in a grid other than the marked one, or in the marked
+# grid under a header other than arguments[3] -- the previous view's grid still matching does not count.
+_VIEW_GRID_JS = """
+var pattern = new RegExp(arguments[0]), mark = arguments[2];
+var grids = document.querySelectorAll(arguments[1]);
+var scopes = grids.length ? grids : [document], cell = null;
+for (var g = 0; g < scopes.length && !cell; g++) {
+    var elements = scopes[g].querySelectorAll('[id]');
+    for (var i = 0; i < elements.length; i++) {
+        if (pattern.test(elements[i].id) && elements[i].getClientRects().length) { cell = elements[i]; break; }
+    }
+}
+if (!cell) return null;
+var grid = cell.closest(arguments[1]) || cell.closest('table') || cell.parentElement;
+var head = grid.querySelector('thead');
+var header = head ? (head.textContent || '').replace(/\\s+/g, ' ').trim() : '';
+if (arguments[4]) { grid.__esViewMark = mark; return header; }
+if (grid.__esViewMark === mark && header === arguments[3]) return null;
+return '#' + CSS.escape(cell.id);
+"""
+
+# Normalized text -> buttons/links of the current document (or frame), rebuilt only after the DOM changed.
+# arguments[0]: labels to resolve; arguments[1]: click the first label found instead of returning matches
+_TEXT_INDEX_JS = """
+var w = window;
+if (!w.__esText) {
+    var index = w.__esText = {map: null};
+    new MutationObserver(function() { index.map = null; })
+        .observe(document, {subtree: true, childList: true, characterData: true});
+}
+var index = w.__esText;
+if (!index.map) {
+    index.map = {};
+    var elements = document.querySelectorAll('button, a');
+    for (var i = 0; i < elements.length; i++) {
+        var key = (elements[i].textContent || '').replace(/\\s+/g, ' ').trim();
+        if (key) (index.map[key] = index.map[key] || []).push(elements[i]);
+    }
+}
+var found = {};
+for (var i = 0; i < arguments[0].length; i++) {
+    var label = arguments[0][i];
+    var candidates = index.map[label] || [];
+    for (var j = 0; j < candidates.length; j++) {
+        if (candidates[j].isConnected && candidates[j].getClientRects().length) { found[label] = candidates[j]; break; }
+    }
+    if (arguments[1] && found[label]) { found[label].click(); return label; }
+}
+return arguments[1] ? null : found;
+"""
+
+# Requests and bytes of the current document, from the Navigation and Resource Timing APIs.
+# Blocked requests never reach Resource Timing; cross-origin responses without
+# Timing-Allow-Origin count as requests with 0 bytes.
+_PAGE_STATS_JS = """
+var nav = performance.getEntriesByType('navigation')[0] || {};
+var resources = performance.getEntriesByType('resource');
+var transfer = nav.transferSize || 0, body = nav.encodedBodySize || 0;
+for (var i = 0; i < resources.length; i++) {
+    transfer += resources[i].transferSize || 0;
+    body += resources[i].encodedBodySize || 0;
+}
+return {requests: 1 + resources.length, transfer_bytes: transfer, body_bytes: body,
+        dom_content_loaded_ms: nav.domContentLoadedEventEnd || null, load_ms: nav.loadEventEnd || null,
+        ready_state: document.readyState};
+"""
+
+def document_ready(state="interactive"):
+    """document.readyState reached `state` ("interactive": DOM parsed, "complete": every subresource loaded)"""
+    states = ("interactive", "complete") if state == "interactive" else ("complete",)
+    return lambda driver: driver.execute_script("return document.readyState") in states
+
+def dom_settled(quiet=None):
+    """Document loaded and no DOM mutation for `quiet` seconds"""
+    quiet_ms = (get("settle_time") if quiet is None else quiet) * 1000
+    def _predicate(driver):
+        idle_ms = driver.execute_script(_DOM_IDLE_JS)
+        return idle_ms is not None and idle_ms >= quiet_ms
+    return _predicate
+
+def network_idle(quiet=None):
+    """No XHR/fetch in flight and no resource finished loading for `quiet` seconds"""
+    quiet_ms = (get("settle_time") if quiet is None else quiet) * 1000
+    def _predicate(driver):
+        idle_ms = driver.execute_script(_NETWORK_IDLE_JS)
+        return idle_ms is not None and idle_ms >= quiet_ms
+    return _predicate
+
+def grid_rows_stable(cell_selector, quiet=None):
+    """
+    Datagrid containing cell_selector has rows and its row count did not change for `quiet` seconds
+    -> row count
+    """
+    quiet = get("grid_stable_time") if quiet is None else quiet
+    state = {"count": None, "since": 0.0}
+    def _predicate(driver):
+        count = driver.execute_script(_GRID_ROWS_JS, cell_selector, get("grid_container"))
+        now = time.monotonic()
+        if count != state["count"]:
+            state["count"], state["since"] = count, now
+            return False
+        return count if count > 0 and now - state["since"] >= quiet else False
+    return _predicate
+
+def cell_discovered(id_pattern):
+    """A visible grid cell whose id matches the regular expression exists -> its CSS selector"""
+    def _predicate(driver):
+        return driver.execute_script(_FIRST_CELL_JS, id_pattern, get("grid_container")) or False
+    return _predicate
+
+def view_replaced(previous, id_pattern):
+    """
+    After a view switch: a visible cell matching id_pattern exists and its grid is not the one
+    marked by EasyScraper.mark_grid before the switch (or that grid now has a different header row)
+    -> the cell's CSS selector
+    previous: EasyScraper.mark_grid result (None: no grid was on screen, any matching cell will do)
+    """
+    if previous is None: return cell_discovered(id_pattern)
+    def _predicate(driver):
+        return driver.execute_script(_VIEW_GRID_JS, id_pattern, get("grid_container"), previous["mark"], previous["header"], False) or False
+    return _predicate
+
+def grid_rerendered(signature, key_columns=()):
+    """The grid being harvested (harvest_grid) renders different rows than at `signature`"""
+    def _predicate(driver):
+        current = driver.execute_script(_GRID_SIGNATURE_JS, list(key_columns))
+        return current is not None and current != signature
+    return _predicate
+
+def element_clickable(selector):
+    """Element matching the CSS selector is visible and enabled"""
+    return EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+
+def text_element_present(text):
+    """Button or link with the given text is displayed -> the element"""
+    def _predicate(driver):
+        return driver.execute_script(_TEXT_INDEX_JS, [text], False).get(text) or False
+    return _predicate
+
+def text_clicked(labels):
+    """
+    Resolve and click in one round trip: the first displayed button or link among labels is clicked
+    labels: text or list of texts, in order of preference
+    -> the label that was clicked
+    """
+    labels = [labels] if isinstance(labels, str) else list(labels)
+    def _predicate(driver):
+        return driver.execute_script(_TEXT_INDEX_JS, labels, True) or False
+    return _predicate
+
+def clipboard_filled():
+    """
+    OS clipboard holds non-empty text -> the text
+    Clear it (pyperclip.copy("")) before the copy: a copy of the same table as last time would
+    otherwise be indistinguishable from a copy that never happened.
+    """
+    def _predicate(driver):
+        return pyperclip.paste() or False
+    return _predicate
+
+class StepTimer:
+    """Per-step wait timings, compared against the fixed buffer_time sleeps they replace"""
+    def __init__(self):
+        self.steps = []
+
+    def record(self, name, elapsed, replaced=0.0, timed_out=False):
+        self.steps.append({"step": name, "elapsed": elapsed, "replaced": replaced, "timed_out": timed_out})
+
+    def report(self):
+        if not self.steps: return
+        width = max(len(s["step"]) for s in self.steps)
+        print(f"{'step':<{width}}  {'waited':>8}  {'fixed':>8}  {'saved':>8}")
+        for s in self.steps:
+            flag = "  (timeout)" if s["timed_out"] else ""
+            print(f"{s['step']:<{width}}  {s['elapsed']:>7.2f}s  {s['replaced']:>7.2f}s  {s['replaced'] - s['elapsed']:>7.2f}s{flag}")
+        waited = sum(s["elapsed"] for s in self.steps)
+        replaced = sum(s["replaced"] for s in self.steps)
+        print(f"{'total':<{width}}  {waited:>7.2f}s  {replaced:>7.2f}s  {replaced - waited:>7.2f}s")
+
 class EasyScraper:
-    def __init__(self, headless = False):
+    def __init__(self, headless = False, profile_dir = None, capture_network = None):
+        """
+        profile_dir: persistent Chrome user-data-dir (cookies, HTTP cache); None for a fresh profile per run
+        capture_network: enable DevTools performance logging for network-capture extraction
+                         (default: "capture_network" setting)
+        """
         self.headless = headless
+        self.profile_dir = profile_dir
+        self.capture_network = get("capture_network", False) if capture_network is None else capture_network
         self.driver = None
         self.wait = None
+        self.timer = StepTimer()
+        self._responses = {}
+        self._response_seq = 0
+        self._frames = []  # iframe selectors entered through frame(), outermost first
+        self.page_loads = []  # requests/bytes/seconds of every open(), see record_page_load
 
     def setup(self): 
-        self.driver, self.wait = self._setup_driver(headless=self.headless)
+        with span("driver startup", headless=self.headless):
+            self.driver, self.wait = self._setup_driver(headless=self.headless)
+            self._apply_resource_policy()
+        count_commands(self.driver)
+
+    def _apply_resource_policy(self):
+        """Block the blocked_urls patterns (images, fonts, media, analytics) for every page of this browser"""
+        patterns = get("blocked_urls") or []
+        try:
+            # Resource Timing keeps 250 entries by default, too few for page_stats on a heavy page
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                        {"source": "performance.setResourceTimingBufferSize(10000);"})
+            if patterns:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+                print(f"🚫 URL 패턴 {len(patterns)}개 차단")
+        except WebDriverException as e: print(f"⚠️ 리소스 차단 설정 실패, 전체 로딩으로 진행: {e}")
+
+    def open(self, url, until=None, name=None, replaced=0.0):
+        """
+        Navigate to url and wait until the page is usable, recording its requests and bytes.
+        With the eager/none page_load_strategy driver.get returns before (or without waiting for)
+        subresources, so `until` is the readiness check the caller relies on.
+        
+        until: readiness condition (default: document_ready())
+        name: step name for the timing report and profile (default: "open <url>")
+        -> the condition's return value; raises TimeoutException if the page never gets ready
+        """
+        name = name or f"open {url}"
+        start = time.perf_counter()
+        with span(name, strategy=get("page_load_strategy", "normal")):
+            self.driver.get(url)
+            result = self.wait_for(until or document_ready(), name, replaced=replaced)
+        if get("page_stats", True): self.record_page_load(name, time.perf_counter() - start)
+        return result
+
+    def record_page_load(self, name, seconds):
+        """Append the current document's request count and bytes to self.page_loads -> the entry"""
+        try: stats = self.driver.execute_script(_PAGE_STATS_JS)
+        except WebDriverException: return None
+        entry = dict(stats, step=name, url=self.driver.current_url, seconds=seconds)
+        self.page_loads.append(entry)
+        print(f"📦 {name}: 요청 {entry['requests']}개, {entry['transfer_bytes'] / 1024:.0f}KB, {seconds:.2f}s")
+        return entry
 
     def cleanup(self): 
         if self.driver: self.driver.quit()
+
+    @staticmethod
+    def step_timeout(name, default, best_effort=False):
+        """
+        -> timeout for the named step: adjusted by its past latencies (timing_profile.py) or default
+        best_effort: the caller continues after a timeout (only then may the timeout drop below default)
+        """
+        from timing_profile import get_profile
+        profile = get_profile()
+        return profile.timeout(name, default, best_effort) if profile is not None else default
+
+    def wait_for(self, condition, name, timeout=None, replaced=0.0, best_effort=False):
+        """
+        Wait until condition(driver) is truthy, recording the time spent in self.timer
+        and in the timing profile when adaptive_timing is on
+        
+        condition: wait condition (e.g. dom_settled(), grid_rows_stable("#cell0_d"))
+        name: step name for the timing report and the timing profile
+        timeout: upper bound in seconds (default: long_loadtime), adjusted by the step's learned timeout
+        replaced: fixed sleep this wait replaces, for the timing report
+        best_effort: the caller catches the timeout and carries on, so a learned timeout may shorten it
+        -> the condition's return value; raises TimeoutException on timeout
+        """
+        from timing_profile import get_profile
+        profile = get_profile()
+        timeout = self.step_timeout(name, timeout or get("long_loadtime"), best_effort)
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            result = WebDriverWait(self.driver, timeout, poll_frequency=get("poll_interval")).until(condition)
+            if profile is not None: profile.record(name, time.perf_counter() - start)
+            return result
+        except TimeoutException:
+            timed_out = True
+            if profile is not None: profile.record(name, time.perf_counter() - start, timed_out=True)
+            raise
+        finally:
+            self.timer.record(name, time.perf_counter() - start, replaced, timed_out)
+
+    def settle(self, condition, name):
+        """
+        Best-effort wait after an action: returns as soon as condition holds, or after the step's
+        timeout (short_loadtime, shortened once its latency is learned).
+        Replaces the fixed buffer_time sleep that used to follow every action.
+        """
+        try: self.wait_for(condition or dom_settled(), name, timeout=get("short_loadtime"), replaced=get("buffer_time"), best_effort=True)
+        except TimeoutException:
+            print(f"⚠️ {name}: {self.step_timeout(name, get('short_loadtime'), best_effort=True):.1f}초 내에 안정화되지 않음, 계속 진행")
     
-    def click_button(self, selector, in_iframe=False):
+    @contextmanager
+    def frame(self, selector=None):
+        """
+        Run a sequence of actions inside an iframe, switching into it once.
+        Nested use with the frame already entered is a no-op; on exit (error included) the
+        driver is back in the frame it was in before.
+        
+        selector: CSS selector of the iframe (default: popup_iframe)
+        
+        with scraper.frame():
+            scraper.fill_input("#search_string", name)
+            scraper.click_button("#image2")
+        """
+        selector = selector or get("popup_iframe")
+        if self._frames and self._frames[-1] == selector:
+            yield self
+            return
+        self.driver.switch_to.frame(self.driver.find_element(By.CSS_SELECTOR, selector))
+        self._frames.append(selector)
+        try: yield self
+        finally:
+            self._frames.pop()
+            try:
+                if self._frames: self.driver.switch_to.parent_frame()
+                else: self.driver.switch_to.default_content()
+            except WebDriverException: pass
+
+    def _frame_if(self, in_iframe):
+        return self.frame() if in_iframe else nullcontext()
+
+    def click_button(self, selector, in_iframe=False, until=None):
+        """
+        in_iframe: run inside the popup iframe (see frame() to batch several actions in it)
+        until: wait condition after the click (default: dom_settled())
+        """
         try:
-            # Switch to iframe popup if needed
-            if in_iframe: self.driver.switch_to.frame(self.driver.find_element(By.CSS_SELECTOR, get("popup_iframe")))
-            
-            button = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-            self.driver.execute_script("arguments[0].click();", button)
-            print(f"✅ CSS {selector} 버튼 클릭 완료")
-            time.sleep(get("buffer_time"))
-            
-            if in_iframe: self.driver.switch_to.default_content()
-                
+            with span(f"click {selector}"), self._frame_if(in_iframe):
+                button = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+                self.driver.execute_script("arguments[0].click();", button)
+                print(f"✅ CSS {selector} 버튼 클릭 완료")
+                self.settle(until, f"click {selector}")
         except Exception as e:
-            if in_iframe: # Make sure to switch back to main frame on error
-                try: self.driver.switch_to.default_content()
-                except: pass
             raise Exception(f"❌ CSS {selector} 클릭 실패: {e}")
 
-    def click_button_by_text(self, button_text, in_iframe=False, max_attempts=10):
+    def click_button_by_text(self, button_text, in_iframe=False, max_attempts=10, until=None):
         """
-        Find and click an element by its text content (searches all nested elements).
+        Find and click a button or link by its whitespace-normalized text content.
+        Lookup and click happen in one in-page call against a text index that a MutationObserver
+        invalidates, so each poll is a single round trip.
         
         button_text: The text to search for on the element
-        in_iframe: Whether the element is inside an iframe
-        max_attempts: Maximum number of retry attempts (default: 10)
+        in_iframe: Whether the element is inside the popup iframe
+        max_attempts: Upper bound on the lookup, in buffer_time units (default: 10)
+        until: wait condition after the click (default: dom_settled())
+        """
+        try:
+            with span(f"click '{button_text}'"), self._frame_if(in_iframe):
+                self.wait_for(text_clicked(button_text), f"find '{button_text}'", timeout=max_attempts * get("buffer_time"))
+                print(f"✅ {button_text} 클릭 완료")
+                self.settle(until, f"click '{button_text}'")
+        except Exception as e:
+            raise Exception(f"{button_text} 클릭 실패: {e}")
+
+    def fill_input(self, selector, value, in_iframe=False, until=None):
+        """
+        in_iframe: run inside the popup iframe (see frame() to batch several actions in it)
+        until: wait condition after typing (default: dom_settled())
         """
-        attempt = 0
-        while attempt < max_attempts:
-            try:
-                if in_iframe:
-                    iframe_selector = get("popup_iframe")
-                    iframe = self.driver.find_element(By.CSS_SELECTOR, iframe_selector)
-                    self.driver.switch_to.frame(iframe)
-                
-                xpath_patterns = [
-                    f"//button[normalize-space(string())='{button_text}']",
-                    f"//a[normalize-space(string())='{button_text}']",
-                ]
-                for partial_xpath in xpath_patterns:
-                    try:
-                        element = self.driver.find_element(By.XPATH, partial_xpath)
-                        self.driver.execute_script("arguments[0].click();", element)
-                        print(f"✅ {button_text} 클릭 완료")
-                        if in_iframe: self.driver.switch_to.default_content()
-                        return
-                    except: continue
-                raise Exception(f"{button_text} 클릭 실패")
-                    
-            except Exception as e:
-                attempt += 1
-                if in_iframe:
-                    try: self.driver.switch_to.default_content()
-                    except: pass
-                if attempt < max_attempts: time.sleep(get("buffer_time"))
-                else: raise Exception(f"{button_text} 클릭 실패: {e}")
-
-    def fill_input(self, selector, value, in_iframe=False):
         if value is None: return
         try:
-            # Switch to iframe if needed
-            if in_iframe: self.driver.switch_to.frame(self.driver.find_element(By.CSS_SELECTOR, get("popup_iframe")))
-                
-            input = self.driver.find_element(By.CSS_SELECTOR, selector)
-            self.driver.execute_script("arguments[0].click();", input) # Use JavaScript click to bypass popup overlay
-            time.sleep(get("buffer_time"))
-
-            input.clear()
-            input.send_keys(value)
-            time.sleep(get("buffer_time"))
-            
-            if in_iframe: self.driver.switch_to.default_content()
-                
-        except Exception as e: 
-            if in_iframe: # Make sure to switch back to main frame on error
-                try: self.driver.switch_to.default_content()
-                except: pass
+            with self._frame_if(in_iframe):
+                input = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+                self.driver.execute_script("arguments[0].click();", input) # Use JavaScript click to bypass popup overlay
+                self.settle(None, f"focus {selector}")
+
+                input.clear()
+                input.send_keys(value)
+                self.settle(until, f"fill {selector}")
+        except Exception as e:
             raise Exception(f"{selector} 입력 실패: {e}")
     
+    def extract_grid(self, cell_selector):
+        """
+        Serialize the datagrid containing cell_selector in one execute_script round trip
+        
+        cell_selector: CSS selector of any cell in the grid
+        -> (headers, rows): header rows flattened to "top - bottom" names, data rows as list of lists
+        """
+        payload = self.driver.execute_script(_GRID_EXTRACT_JS, cell_selector, get("grid_container"))
+        if payload is None: raise Exception(f"{cell_selector} 그리드를 찾을 수 없음")
+        grid = json.loads(payload)
+        
+        # Flatten multi-row headers the same way the DOM scraper in main.py does
+        header_rows = grid["headers"]
+        max_cols = max((len(row) for row in header_rows), default=0)
+        headers = [" - ".join(filter(None, (row[i] for row in header_rows if i < len(row)))) for i in range(max_cols)]
+        return headers, grid["rows"]
+
+    def harvest_grid(self, cell_selector, key_columns=(), chunk_rows=None, name=None):
+        """
+        Read a datagrid that may only render the rows in view: scroll its viewport step by step
+        and yield only newly rendered rows, deduplicated in-page by the key_columns cells.
+        Each round trip carries at most chunk_rows rows, whatever the grid's size.
+        
+        cell_selector: CSS selector of any cell in the grid
+        key_columns: indexes of the cells identifying a row (empty: the whole row)
+        chunk_rows: rows per round trip (default: scroll_chunk_rows)
+        name: step name of the wait after each scroll (default: "scroll <cell_selector>")
+        -> iterator of lists of rows (lists of cell texts)
+        """
+        chunk_rows = chunk_rows or get("scroll_chunk_rows", 2000)
+        name = name or f"scroll {cell_selector}"
+        reset = True
+        while True:
+            state = self.driver.execute_script(_GRID_HARVEST_JS, cell_selector, get("grid_container"), list(key_columns), chunk_rows, reset)
+            reset = False
+            if state is None: raise Exception(f"{cell_selector} 그리드를 찾을 수 없음")
+            if state["rows"]: yield state["rows"]
+            if state["more"]: continue
+            if not state["scrolled"]: return
+            # A scroll that renders nothing new is harmless: the next step reads nothing and scrolls on
+            try: self.wait_for(grid_rerendered(state["signature"], key_columns), name, timeout=get("short_loadtime"), best_effort=True)
+            except TimeoutException: pass
+
+    def mark_grid(self, id_pattern):
+        """
+        Tag the datagrid on screen holding a cell matching id_pattern, before switching views, so
+        view_replaced() can tell it from the next view's grid when both use the same cell ids
+        -> marker for view_replaced, or None when no such grid is on screen
+        """
+        mark = f"{id(self)}-{time.perf_counter_ns()}"
+        header = self.driver.execute_script(_VIEW_GRID_JS, id_pattern, get("grid_container"), mark, None, True)
+        return None if header is None else {"mark": mark, "header": header}
+
+    def is_grid_cell(self, selector, id_pattern):
+        """Whether selector names a displayed element whose id matches id_pattern (no waiting)"""
+        try: elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+        except WebDriverException: return False
+        return any(re.search(id_pattern, e.get_attribute("id") or "") and e.is_displayed() for e in elements)
+
+    def is_alive(self):
+        """Health check: the browser and its window still answer WebDriver commands"""
+        if not self.driver: return False
+        try:
+            self.driver.current_window_handle
+            return True
+        except WebDriverException: return False
+
+    def memory_mb(self):
+        """JS heap allocated by the current page in MB (Chrome DevTools Performance metrics)"""
+        self.driver.execute_cdp_cmd("Performance.enable", {})
+        metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        heap = next((m["value"] for m in metrics if m["name"] == "JSHeapTotalSize"), 0)
+        return heap / (1024 * 1024)
+
+    @property
+    def cookie_file(self):
+        return os.path.join(self.profile_dir, "tms_cookies.json") if self.profile_dir else None
+
+    def save_cookies(self):
+        """Save the current cookies, session cookies included, next to the persistent profile"""
+        if not self.cookie_file: return
+        with open(self.cookie_file, 'w', encoding='utf-8') as f:
+            json.dump({"saved_at": time.time(), "cookies": self.driver.get_cookies()}, f)
+
+    def restore_cookies(self):
+        """
+        Load cookies saved by save_cookies into the browser, dropping expired ones.
+        Session cookies carry no expiry and are kept for session_max_age seconds after saving.
+        -> bool: whether any cookie was restored
+        """
+        if not self.cookie_file or not os.path.exists(self.cookie_file): return False
+        try:
+            with open(self.cookie_file, 'r', encoding='utf-8') as f: saved = json.load(f)
+        except Exception as e:
+            print(f"⚠️ 저장된 쿠키 읽기 실패: {e}")
+            return False
+        
+        now = time.time()
+        session_valid = now - saved.get("saved_at", 0) < get("session_max_age", 0)
+        cookies = [c for c in saved.get("cookies", []) if (c["expiry"] > now if "expiry" in c else session_valid)]
+        if not cookies: return False
+        
+        self.driver.get(get("details_url"))  # cookies can only be set for the current origin
+        restored = 0
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+                restored += 1
+            except Exception as e: print(f"⚠️ 쿠키 {cookie.get('name')} 복원 실패: {e}")
+        return restored > 0
+
+    def export_session(self):
+        """
+        Snapshot of the authenticated browser state
+        -> dict: current url, cookies, localStorage and sessionStorage
+        """
+        storage = self.driver.execute_script(
+            "return [Object.assign({}, window.localStorage), Object.assign({}, window.sessionStorage)];")
+        return {
+            "url": self.driver.current_url,
+            "cookies": self.driver.get_cookies(),
+            "local_storage": storage[0],
+            "session_storage": storage[1],
+        }
+
+    def import_session(self, session):
+        """
+        Restore a session captured by export_session into this driver, skipping the login form
+        
+        session: dict from export_session
+        """
+        self.driver.get(get("details_url"))  # cookies can only be set for the current origin
+        for cookie in session["cookies"]:
+            try: self.driver.add_cookie(cookie)
+            except Exception as e: print(f"⚠️ 쿠키 {cookie.get('name')} 복원 실패: {e}")
+        self.driver.execute_script(
+            "for (var k in arguments[0]) window.localStorage.setItem(k, arguments[0][k]);"
+            "for (var k in arguments[1]) window.sessionStorage.setItem(k, arguments[1][k]);",
+            session["local_storage"], session["session_storage"])
+        self.driver.get(session["url"])
+        self.settle(network_idle(), "restore session")
+
+    def _drain_network_log(self):
+        """Move pending DevTools network events into self._responses (the driver log is consumed on read)"""
+        if not self.capture_network: raise Exception("capture_network이 꺼져 있음")
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.responseReceived":
+                self._response_seq += 1
+                self._responses[params["requestId"]] = {
+                    "url": params["response"]["url"], "status": params["response"]["status"],
+                    "seq": self._response_seq, "finished": False,
+                }
+            elif method == "Network.loadingFinished" and params.get("requestId") in self._responses:
+                self._responses[params["requestId"]]["finished"] = True
+
+    def network_mark(self):
+        """-> marker for wait_for_json_response so only responses received after this point match"""
+        self._drain_network_log()
+        self._responses.clear()  # earlier responses can no longer match, don't let them pile up in warm sessions
+        return self._response_seq + 1
+
+    def wait_for_json_response(self, url_pattern, since=0, timeout=None):
+        """
+        Wait for a finished response whose URL matches url_pattern and decode its JSON body
+        
+        url_pattern: regular expression searched in the response URL
+        since: value of network_mark() taken before triggering the request
+        -> decoded JSON payload
+        """
+        pattern = re.compile(url_pattern)
+        def _response_finished(driver):
+            self._drain_network_log()
+            for request_id, response in self._responses.items():
+                if response["seq"] >= since and response["finished"] and pattern.search(response["url"]):
+                    return request_id
+            return False
+        request_id = self.wait_for(_response_finished, f"response {url_pattern}", timeout=timeout)
+        response = self._responses.pop(request_id)
+        if response["status"] >= 400: raise Exception(f"{response['url']} 응답 오류 {response['status']}")
+        
+        body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        text = base64.b64decode(body["body"]).decode('utf-8') if body.get("base64Encoded") else body["body"]
+        return json.loads(text)
+
+    @staticmethod
+    def records_from_payload(payload, record_path=None, fields=None):
+        """
+        Decode a JSON API payload into rows
+        
+        record_path: dot-separated path to the record list (e.g. "data.list"); None: the payload itself or its first list
+        fields: record keys in column order; None: keys of the first record
+        -> (fields, rows): column keys and list of lists
+        """
+        records = payload
+        if record_path:
+            for key in record_path.split("."): records = records[key]
+        elif isinstance(records, dict):
+            records = next((value for value in records.values() if isinstance(value, list)), [])
+        if not records: return fields or [], []
+        
+        if isinstance(records[0], dict):
+            fields = fields or list(records[0].keys())
+            return fields, [[record.get(field) for field in fields] for record in records]
+        return fields or [], [list(record) for record in records]
+
     @staticmethod
     def parse_clipboard_to_rows():
         """
         Clipboard data (tab-separated values)        
         -> list of lists: Data rows with each row as a list of cell values
         """
-        clipboard_data = pyperclip.paste()
-        if not clipboard_data: return []
+        return EasyScraper.parse_tsv_to_rows(pyperclip.paste())
+
+    @staticmethod
+    def parse_tsv_to_rows(text):
+        """
+        Tab-separated text -> list of lists, one Python string per cell.
+        For large tables prefer scrape.create_dataframe_from_tsv, which parses the text in C.
+        """
+        if not text: return []
         
-        lines = clipboard_data.strip().split('\n')        
+        lines = text.strip().splitlines()  # Windows clipboard text is \r\n-terminated
         data_rows = []
         for line in lines:
             if line.strip(): data_rows.append(line.split('\t'))
@@ -183,6 +911,11 @@ class EasyScraper:
         if headless:
             chrome_options.add_argument("--headless=new")
         
+        # Persistent profile keeps cookies and the disk cache (TMS JS/CSS bundle) between runs
+        if self.profile_dir:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(self.profile_dir)}")
+        
         # Stability and crash prevention options
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -190,8 +923,6 @@ class EasyScraper:
         chrome_options.add_argument("--disable-web-security")
         chrome_options.add_argument("--disable-features=VizDisplayCompositor")
         chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
         chrome_options.add_argument("--disable-default-apps")
         chrome_options.add_argument("--disable-sync")
         chrome_options.add_argument("--disable-translate")
@@ -213,12 +944,229 @@ class EasyScraper:
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
         chrome_options.add_argument("--window-size=1600,1000")
+        
+        # Images, fonts and trackers are blocked through DevTools after startup (blocked_urls);
+        # "eager" returns from driver.get at DOMContentLoaded, callers wait on explicit readiness checks
+        chrome_options.page_load_strategy = get("page_load_strategy", "normal")
+        
+        # DevTools network events, read back by wait_for_json_response
+        if self.capture_network:
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
 
-        # Use Selenium Manager (built into Selenium 4.6+) for consistent driver resolution
-        print("Chrome driver 시작 중... (Selenium Manager)")
-        driver = webdriver.Chrome(options=chrome_options)
+        # Use Selenium Manager (built into Selenium 4.6+) for consistent driver resolution,
+        # unless a chromedriver was already resolved (batch workers share the parent's)
+        driver_path = get("chromedriver_path")
+        print(f"Chrome driver 시작 중... ({driver_path or 'Selenium Manager'})")
+        service = Service(executable_path=driver_path) if driver_path else None
+        driver = webdriver.Chrome(options=chrome_options, service=service)
         driver.set_page_load_timeout(get("long_loadtime"))
         wait = WebDriverWait(driver, get("long_loadtime"))
         print("✅ Chrome driver 로딩 완료")
         return driver, wait
-        
\ No newline at end of file
+        
+
+def resolve_chromedriver():
+    """
+    Locate (downloading if needed) the chromedriver matching the installed Chrome once, so
+    several processes can start browsers without each running Selenium Manager
+    -> driver path, or None if it cannot be resolved here
+    """
+    if get("chromedriver_path"): return get("chromedriver_path")
+    try:
+        from selenium.webdriver.common.selenium_manager import SeleniumManager
+        return SeleniumManager().binary_paths(["--browser", "chrome"])["driver_path"]
+    except Exception as e:
+        print(f"⚠️ chromedriver 확인 실패, 각 브라우저가 직접 찾음: {e}")
+        return None
+
+class ScraperPool:
+    """
+    Process-wide pool of logged-in EasyScraper sessions kept warm between runs.
+    
+    login: callable(scraper) that signs in from scratch
+    is_logged_in: callable(scraper) -> bool, opens the site and reports whether the session is still valid
+    size: maximum number of browsers
+    max_runs: recycle a browser after this many runs (None: never)
+    max_memory_mb: recycle a browser whose JS heap grew above this (None: never)
+    profile_dir: persistent profile directory; browsers beyond the first get "<profile_dir>-<n>"
+                 since Chrome locks a user-data-dir to one process
+    """
+    def __init__(self, login, is_logged_in, headless=False, size=1, max_runs=None, max_memory_mb=None, profile_dir=None):
+        self.headless = headless
+        self.profile_dir = profile_dir
+        self.size = size
+        self.max_runs = max_runs
+        self.max_memory_mb = max_memory_mb
+        self._login = login
+        self._is_logged_in = is_logged_in
+        self._idle = []
+        self._runs = {}
+        self._profiles_in_use = set()
+        self._count = 0
+        self._closed = False
+        self._available = threading.Condition()
+
+    def _should_recycle(self, scraper):
+        if not scraper.is_alive(): return "응답 없음"
+        if self.max_runs and self._runs.get(id(scraper), 0) >= self.max_runs: return f"{self.max_runs}회 실행"
+        if self.max_memory_mb:
+            try:
+                memory = scraper.memory_mb()
+                if memory > self.max_memory_mb: return f"메모리 {memory:.0f}MB"
+            except WebDriverException: return "응답 없음"
+        return None
+
+    def _free_profile_dir(self):
+        if not self.profile_dir: return None
+        with self._available:
+            for n in range(self.size):
+                candidate = self.profile_dir if n == 0 else f"{self.profile_dir}-{n}"
+                if candidate not in self._profiles_in_use:
+                    self._profiles_in_use.add(candidate)
+                    return candidate
+        return None
+
+    def _discard(self, scraper):
+        self._profiles_in_use.discard(scraper.profile_dir)
+        self._runs.pop(id(scraper), None)
+        try: scraper.cleanup()
+        except Exception: pass
+
+    def _take(self):
+        """Reserve an idle browser (or a slot for a new one) -> scraper or None"""
+        with self._available:
+            while True:
+                if self._closed: raise Exception("ScraperPool is closed")
+                if self._idle: return self._idle.pop()
+                if self._count < self.size:
+                    self._count += 1
+                    return None
+                self._available.wait()
+
+    def acquire(self):
+        """-> logged-in EasyScraper, warm when possible"""
+        scraper = self._take()
+        try:
+            if scraper is not None:
+                reason = self._should_recycle(scraper)
+                if reason:
+                    print(f"♻️ Chrome 재시작 ({reason})")
+                    self._discard(scraper)
+                    scraper = None
+            if scraper is None:
+                scraper = EasyScraper(headless=self.headless, profile_dir=self._free_profile_dir())
+                scraper.setup()
+                self._runs[id(scraper)] = 0
+                self._login(scraper)
+            elif not self._is_logged_in(scraper):
+                print("세션 만료, 다시 로그인")
+                self._login(scraper)
+            else:
+                print("✅ 기존 세션 재사용")
+        except Exception:
+            if scraper is not None: self._discard(scraper)
+            with self._available:
+                self._count -= 1
+                self._available.notify()
+            raise
+        scraper.timer = StepTimer()
+        return scraper
+
+    def release(self, scraper, broken=False, ran=True):
+        """Return a scraper to the pool; broken sessions are closed instead of reused"""
+        with self._available:
+            if ran: self._runs[id(scraper)] = self._runs.get(id(scraper), 0) + 1
+            if broken or self._closed:
+                self._discard(scraper)
+                self._count -= 1
+            else:
+                self._idle.append(scraper)
+            self._available.notify()
+
+    def prewarm(self):
+        """
+        Start and log in a browser ahead of the first run, so session() finds it idle
+        -> False if nothing was started (a browser is already idle, every slot is taken, or the pool is closed)
+        """
+        with self._available:
+            if self._closed or self._idle or self._count >= self.size: return False
+        self.release(self.acquire(), ran=False)
+        return True
+
+    @contextmanager
+    def session(self):
+        """with pool.session() as scraper: ... -- acquire and release around a run"""
+        scraper = self.acquire()
+        broken = False
+        try: yield scraper
+        except Exception:
+            broken = not scraper.is_alive()
+            raise
+        finally: self.release(scraper, broken=broken)
+
+    def close(self):
+        """Quit every idle browser; browsers in use are closed when released"""
+        with self._available:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+                self._count -= 1
+            self._available.notify_all()
+
+
+class HttpScraper:
+    """
+    Browserless client that replays the TMS login and data API calls over one pooled,
+    keep-alive requests.Session. Configured by the "http_login" and "endpoints" settings.
+    """
+    def __init__(self, base_url=None, pool_size=None):
+        self.base_url = base_url or get("details_url")
+        pool_size = pool_size or get("http_pool_size", 10)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                              max_retries=Retry(total=2, backoff_factor=0.3, allowed_methods=["GET"]))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def cleanup(self):
+        self.session.close()
+
+    def login(self, userid, password):
+        """Sign in through the login endpoint; keeps the session cookie (and bearer token if configured)"""
+        config = get("http_login")
+        url = urljoin(self.base_url, config["path"])
+        credentials = {config["user_field"]: userid, config["password_field"]: password}
+        if config.get("json", True): response = self.session.post(url, json=credentials, timeout=get("long_loadtime"))
+        else: response = self.session.post(url, data=credentials, timeout=get("long_loadtime"))
+        if response.status_code >= 400: raise Exception(f"❌ 로그인 실패: {response.status_code}")
+        
+        if config.get("token_field"):
+            token = response.json()
+            for key in config["token_field"].split("."): token = token[key]
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        print("✅ HTTP 로그인 완료")
+
+    def fetch_json(self, path, params=None):
+        """-> decoded JSON payload of GET base_url/path"""
+        response = self.session.get(urljoin(self.base_url, path), params=params, timeout=get("long_loadtime"))
+        if response.status_code >= 400: raise Exception(f"{path} 응답 오류 {response.status_code}")
+        return response.json()
+
+    def fetch_all(self, endpoints):
+        """
+        Fetch several endpoints concurrently over the shared connection pool
+        
+        endpoints: dict name -> endpoint setting ({"path", "params", "record_path", "fields"})
+        -> dict name -> rows (list of lists), or the Exception raised for that endpoint
+        """
+        def _fetch(endpoint):
+            try:
+                payload = self.fetch_json(endpoint["path"], endpoint.get("params"))
+                _, rows = EasyScraper.records_from_payload(payload, endpoint.get("record_path"), endpoint.get("fields"))
+                return rows
+            except Exception as e: return e
+
+        with ThreadPoolExecutor(max_workers=max(1, len(endpoints))) as executor:
+            results = executor.map(_fetch, endpoints.values())
+            return dict(zip(endpoints.keys(), results))
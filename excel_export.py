@@ -0,0 +1,279 @@
+"""
+Streaming, constant-memory .xlsx export.
+
+write_sheets replaces (or adds) sheets of a workbook without loading it: the new sheets are
+streamed as worksheet XML in row chunks with inline strings, and every other part of the
+existing file (untouched sheets, shared strings, styles) is copied over at the zip level.
+The result is written to a temporary file and moved into place, so readers never see a
+half-written workbook.
+
+A sheet holds at most 1,048,576 rows: longer frames continue on "<sheet>_2", "<sheet>_3"...
+(each with the header row), and continuation sheets left from an earlier, longer export are
+dropped.
+"""
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+SHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+WORKSHEET_TYPE = REL_NS + "/worksheet"
+CALC_CHAIN_TYPE = REL_NS + "/calcChain"
+WORKSHEET_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+DATE_FORMAT_ID = "14"  # built-in m/d/yyyy
+EXCEL_MAX_ROWS = 1_048_576  # header row included
+EXCEL_MAX_COLUMNS = 16_384
+SHEET_NAME_MAX = 31
+EXCEL_EPOCH = pd.Timestamp("1899-12-30")
+
+_ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Parts of an empty workbook, used when the target file does not exist yet
+_EMPTY_WORKBOOK = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{PKG_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<workbook xmlns="{SHEET_NS}" xmlns:r="{REL_NS}"><sheets></sheets></workbook>'),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{PKG_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{REL_NS}/styles" Target="styles.xml"/>'
+        '</Relationships>'),
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<styleSheet xmlns="{SHEET_NS}">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'),
+}
+
+def column_letter(index):
+    """0 -> A, 25 -> Z, 26 -> AA"""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def _xml_text(value):
+    return escape(_ILLEGAL_XML_CHARS.sub("", str(value)))
+
+def _attr(value):
+    return escape(str(value), {'"': "&quot;"})
+
+def _column_cells(series, letter, first_row, date_style):
+    """-> list of <c> elements ('' for empty cells) for one column chunk"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if getattr(series.dt, "tz", None) is not None: series = series.dt.tz_localize(None)
+        serials = ((series - EXCEL_EPOCH) / pd.Timedelta(days=1)).tolist()
+        return ["" if pd.isna(v) else f'<c r="{letter}{first_row + i}" s="{date_style}"><v>{v!r}</v></c>'
+                for i, v in enumerate(serials)]
+    if pd.api.types.is_bool_dtype(series):
+        return [f'<c r="{letter}{first_row + i}" t="b"><v>{int(v)}</v></c>' for i, v in enumerate(series.tolist())]
+    if pd.api.types.is_numeric_dtype(series):
+        # NaN and +/-inf have no SpreadsheetML number form (Excel refuses "<v>inf</v>"): empty cells
+        values = series.astype(object).where(series.notna(), None)
+        if pd.api.types.is_float_dtype(series): values = values.where(np.isfinite(series.to_numpy(dtype="float64", na_value=np.nan)), None)
+        return ["" if v is None else f'<c r="{letter}{first_row + i}"><v>{v!r}</v></c>'
+                for i, v in enumerate(values.tolist())]
+
+    cells = []
+    for i, v in enumerate(series.tolist()):
+        if v is None or v is pd.NA or v is pd.NaT or (isinstance(v, (float, np.floating)) and not np.isfinite(v)) or v == "": cells.append("")
+        elif isinstance(v, bool): cells.append(f'<c r="{letter}{first_row + i}" t="b"><v>{int(v)}</v></c>')
+        elif isinstance(v, (int, float, np.number)): cells.append(f'<c r="{letter}{first_row + i}"><v>{v.item() if isinstance(v, np.number) else v!r}</v></c>')
+        elif isinstance(v, pd.Timestamp): cells.append(f'<c r="{letter}{first_row + i}" s="{date_style}"><v>{(v.tz_localize(None) - EXCEL_EPOCH) / pd.Timedelta(days=1)!r}</v></c>')
+        else: cells.append(f'<c r="{letter}{first_row + i}" t="inlineStr"><is><t xml:space="preserve">{_xml_text(v)}</t></is></c>')
+    return cells
+
+def write_sheet_xml(stream, df, date_style, chunk_rows=5000):
+    """
+    Stream one DataFrame as worksheet XML (header row + data) in chunks of chunk_rows rows
+
+    stream: binary file-like object
+    date_style: index of the cellXfs entry used for dates
+    """
+    letters = [column_letter(i) for i in range(df.shape[1])]
+    stream.write(f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<worksheet xmlns="{SHEET_NS}"><sheetData>'.encode("utf-8"))
+    header = "".join(f'<c r="{letter}1" t="inlineStr"><is><t xml:space="preserve">{_xml_text(name)}</t></is></c>'
+                     for letter, name in zip(letters, df.columns))
+    stream.write(f'<row r="1">{header}</row>'.encode("utf-8"))
+
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        first_row = start + 2
+        columns = [_column_cells(chunk.iloc[:, j], letters[j], first_row, date_style) for j in range(chunk.shape[1])]
+        rows = [f'<row r="{first_row + i}">{"".join(cells)}</row>' for i, cells in enumerate(zip(*columns))]
+        stream.write("".join(rows).encode("utf-8"))
+    stream.write(b"</sheetData></worksheet>")
+
+def continuation_name(sheet, part):
+    """Name of the part-th sheet of a split frame: sheet, sheet_2, sheet_3... (within 31 characters)"""
+    if part == 1: return sheet
+    suffix = f"_{part}"
+    return sheet[:SHEET_NAME_MAX - len(suffix)] + suffix
+
+def split_sheets(frames, max_rows=EXCEL_MAX_ROWS):
+    """
+    Fit every frame into Excel's sheet limits
+    max_rows: rows per sheet, header row included
+    -> dict sheet name -> DataFrame, frames longer than a sheet continued on continuation_name sheets;
+       raises ValueError for a frame wider than 16,384 columns
+    """
+    per_sheet = max_rows - 1
+    sheets = {}
+    for sheet, df in frames.items():
+        if df.shape[1] > EXCEL_MAX_COLUMNS: raise ValueError(f"{sheet}: {df.shape[1]}열, 엑셀 시트 한도 {EXCEL_MAX_COLUMNS}열 초과")
+        if len(df) <= per_sheet:
+            sheets[sheet] = df
+            continue
+        starts = range(0, len(df), per_sheet)
+        for part, start in enumerate(starts, 1): sheets[continuation_name(sheet, part)] = df.iloc[start:start + per_sheet]
+        print(f"⚠️ {sheet}: {len(df):,}행, 엑셀 시트 한도 초과로 {len(starts)}개 시트에 나눠 기록")
+    return sheets
+
+def _stale_continuations(frames, sheets, existing):
+    """Existing continuation sheets of the frames being written that this export no longer fills"""
+    stale = []
+    for name in existing:
+        match = re.fullmatch(r".*_(\d+)", name)
+        if not match or name in sheets or int(match.group(1)) < 2: continue
+        if any(continuation_name(sheet, int(match.group(1))) == name for sheet in frames): stale.append(name)
+    return stale
+
+def _relationships(rels_xml):
+    """-> list of dicts (Id, Type, Target) from a .rels part"""
+    return [dict(re.findall(r'(\w+)="([^"]*)"', match)) for match in re.findall(r"<Relationship\b([^>]*?)/?>", rels_xml)]
+
+def _part_path(target):
+    """Relationship target of workbook.xml.rels -> zip member name"""
+    return target.lstrip("/") if target.startswith("/") else "xl/" + target
+
+def _ensure_date_style(styles_xml):
+    """-> (styles xml, index of a cellXfs entry formatting dates), appending one if the workbook has none"""
+    match = re.search(r"<cellXfs\b[^>]*>(.*?)</cellXfs>", styles_xml, re.S)
+    entries = re.findall(r"<xf\b[^>]*?/>|<xf\b[^>]*?>.*?</xf>", match.group(1), re.S)
+    for index, entry in enumerate(entries):
+        if re.search(rf'numFmtId="{DATE_FORMAT_ID}"', entry): return styles_xml, index
+    date_xf = f'<xf numFmtId="{DATE_FORMAT_ID}" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    cell_xfs = f'<cellXfs count="{len(entries) + 1}">{match.group(1)}{date_xf}</cellXfs>'
+    return styles_xml[:match.start()] + cell_xfs + styles_xml[match.end():], len(entries)
+
+def write_sheets(filename, frames, chunk_rows=5000, max_rows=EXCEL_MAX_ROWS):
+    """
+    Replace or add sheets of filename without parsing the rest of the workbook
+
+    frames: dict sheet name -> DataFrame; existing sheets with these names are replaced in place,
+            new names are appended after the existing sheets
+    chunk_rows: rows serialized per write, bounds the memory used on top of the DataFrames
+    max_rows: rows per sheet (header included) before a frame continues on "<sheet>_2"...
+    """
+    frames, originals = split_sheets(frames, max_rows), frames
+    source = zipfile.ZipFile(filename) if os.path.exists(filename) else None
+    try:
+        read = (lambda name: source.read(name).decode("utf-8")) if source else _EMPTY_WORKBOOK.__getitem__
+        names = source.namelist() if source else list(_EMPTY_WORKBOOK)
+        workbook = read("xl/workbook.xml")
+        workbook_rels = read("xl/_rels/workbook.xml.rels")
+        content_types = read("[Content_Types].xml")
+        styles_name = next(_part_path(r["Target"]) for r in _relationships(workbook_rels) if r["Type"].endswith("/styles"))
+        styles, date_style = _ensure_date_style(read(styles_name))
+
+        # Existing sheets: name -> zip member
+        rel_targets = {r["Id"]: _part_path(r["Target"]) for r in _relationships(workbook_rels)}
+        sheet_elements = re.findall(r"<sheet\b[^>]*?/>", workbook)
+        sheet_parts = {}
+        for element in sheet_elements:
+            attrs = dict(re.findall(r'([\w:]+)="([^"]*)"', element))
+            sheet_parts[attrs["name"].replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">").replace("&quot;", '"')] = rel_targets[attrs["r:id"]]
+
+        # Continuation sheets a shorter frame no longer needs: sheet element, relationship, content type, part
+        removed = set()
+        for sheet in _stale_continuations(originals, frames, list(sheet_parts)):
+            element = next(e for e in sheet_elements if _attr(sheet) in re.findall(r'name="([^"]*)"', e))
+            rel_id = dict(re.findall(r'([\w:]+)="([^"]*)"', element))["r:id"]
+            workbook = workbook.replace(element, "")
+            workbook_rels = re.sub(rf'<Relationship\b[^>]*Id="{rel_id}"[^>]*/>', "", workbook_rels)
+            part = sheet_parts.pop(sheet)
+            content_types = re.sub(rf'<Override\b[^>]*PartName="/{re.escape(part)}"[^>]*/>', "", content_types)
+            removed |= {part, f"{os.path.dirname(part)}/_rels/{os.path.basename(part)}.rels"}
+            print(f"🗑️ 더 이상 필요 없는 시트 삭제: {sheet}")
+        # The selected tab may have been one of them
+        if removed: workbook = re.sub(r'\bactiveTab="\d+"', 'activeTab="0"', workbook)
+
+        # New sheets get fresh sheetId, relationship id and part name
+        next_sheet_id = max([int(i) for i in re.findall(r'<sheet\b[^>]*?sheetId="(\d+)"', workbook)] + [0]) + 1
+        next_rel = max([int(i) for i in re.findall(r'Id="rId(\d+)"', workbook_rels)] + [0]) + 1
+        used_parts = set(names)
+        new_sheets = ""
+        new_rels = ""
+        new_types = ""
+        for sheet in frames:
+            if sheet in sheet_parts: continue
+            n = 1
+            while f"xl/worksheets/sheet{n}.xml" in used_parts: n += 1
+            part = f"xl/worksheets/sheet{n}.xml"
+            used_parts.add(part)
+            sheet_parts[sheet] = part
+            new_sheets += f'<sheet name="{_attr(sheet)}" sheetId="{next_sheet_id}" r:id="rId{next_rel}"/>'
+            new_rels += f'<Relationship Id="rId{next_rel}" Type="{WORKSHEET_TYPE}" Target="worksheets/sheet{n}.xml"/>'
+            new_types += f'<Override PartName="/{part}" ContentType="{WORKSHEET_CONTENT_TYPE}"/>'
+            next_sheet_id += 1
+            next_rel += 1
+        workbook = re.sub(r"<sheets\s*/>", "<sheets></sheets>", workbook).replace("</sheets>", new_sheets + "</sheets>")
+        workbook_rels = workbook_rels.replace("</Relationships>", new_rels + "</Relationships>")
+        content_types = content_types.replace("</Types>", new_types + "</Types>")
+
+        # Cached formula chain may point at replaced cells; Excel rebuilds it when missing
+        workbook_rels = re.sub(rf'<Relationship\b[^>]*Type="{re.escape(CALC_CHAIN_TYPE)}"[^>]*/>', "", workbook_rels)
+        content_types = re.sub(r'<Override PartName="/xl/calcChain.xml"[^>]*/>', "", content_types)
+
+        replaced = {sheet_parts[sheet]: df for sheet, df in frames.items()}
+        dropped = {"xl/calcChain.xml"} | removed | {f"{os.path.dirname(p)}/_rels/{os.path.basename(p)}.rels" for p in replaced}
+        rewritten = {"xl/workbook.xml": workbook, "xl/_rels/workbook.xml.rels": workbook_rels,
+                     "[Content_Types].xml": content_types, styles_name: styles}
+
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, temp_name = tempfile.mkstemp(suffix=".xlsx", dir=directory)
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(temp_name, "w", zipfile.ZIP_DEFLATED) as target:
+                for name, xml in rewritten.items(): target.writestr(name, xml)
+                for name in names:
+                    if name in replaced or name in dropped or name in rewritten: continue
+                    if source:
+                        # Untouched parts are copied as bytes, never parsed
+                        with source.open(name) as src, target.open(name, "w") as dst: shutil.copyfileobj(src, dst)
+                    else: target.writestr(name, _EMPTY_WORKBOOK[name])
+                for part, df in replaced.items():
+                    with target.open(part, "w", force_zip64=True) as stream: write_sheet_xml(stream, df, date_style, chunk_rows)
+        except BaseException:
+            os.remove(temp_name)
+            raise
+    finally:
+        if source: source.close()
+    os.replace(temp_name, filename)
@@ -1,7 +1,10 @@
+from startup import Startup  # first: its clock is the reference of the startup timings
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
+import json
 import sys
+import time
 
 try:
     from ctypes import windll
@@ -9,10 +12,13 @@ try:
 except:
     pass
 
-import scrape
+# scrape (pandas, selenium, openpyxl) is imported by Startup in the background after the first paint
 class ScraperGUI:
-    def __init__(self, root):
+    def __init__(self, root, prewarm=None, credentials_file=None):
         self.root = root
+        self.startup = Startup(credentials_file)
+        self.prewarm = prewarm
+        self.first_paint_at = None
         self.root.title("Excel Update")
         self.root.geometry("800x700")
         self.root.resizable(False, False)
@@ -48,8 +54,15 @@ class ScraperGUI:
                                           style="TButton", width=30)
         self.headless_button.pack(side=tk.LEFT, padx=(0, 15))
         
+        # Tracing toggle: per-stage timings written to the traces folder
+        self.trace_var = tk.BooleanVar(value=False)
+        self.trace_button = ttk.Button(button_frame, text="로깅 꺼짐",
+                                       command=self.toggle_trace,
+                                       style="TButton", width=12)
+        self.trace_button.pack(side=tk.LEFT, padx=(0, 15))
+        
         # Exit button
-        exit_button = ttk.Button(button_frame, text="종료", command=self.root.quit, 
+        exit_button = ttk.Button(button_frame, text="종료", command=self.quit, 
                                style="TButton", width=10)
         exit_button.pack(side=tk.LEFT)
         
@@ -61,11 +74,36 @@ class ScraperGUI:
         self.status_label = ttk.Label(main_frame, text="", font=("Segoe UI", 9))
         self.status_label.grid(row=3, column=0, columnspan=2, pady=5)
         
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
+        
         # Configure grid weights
         root.columnconfigure(0, weight=1)
         root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
+        
+        # Runs once the window is drawn: heavy imports and Chrome start behind it
+        self.root.after_idle(self.on_first_paint)
     
+    def on_first_paint(self):
+        """Start importing scrape and prewarming Chrome now that the window is on screen"""
+        self.startup.mark("first paint")
+        self.first_paint_at = time.time()
+        self.status_label.config(text="준비 중...")
+        self.startup.start(self.headless_var.get(), self.prewarm)
+        self.wait_for_import()
+    
+    def wait_for_import(self):
+        """Poll the background import and clear the status once scrape is loaded"""
+        if not self.startup.import_finished:
+            self.root.after(100, self.wait_for_import)
+        elif self.run_button.instate(['!disabled']):
+            self.status_label.config(text="")
+    
+    def quit(self):
+        """Close the warm Chrome sessions before leaving"""
+        if self.startup.imported: self.startup.scrape().close_pool()
+        self.root.quit()
+
     def toggle_headless(self):
         """Toggle headless mode and update button appearance"""
         current_value = self.headless_var.get()
@@ -76,6 +114,18 @@ class ScraperGUI:
             self.headless_button.config(text="Chrome 숨기기 선택됨", style="Accent.TButton")
         else:
             self.headless_button.config(text="Chrome 열기 선택됨", style="TButton")
+        
+        # Get a browser of the new mode ready unless a run is using the pool
+        if self.startup.imported and self.run_button.instate(['!disabled']):
+            threading.Thread(target=self.startup.prewarm, args=(self.headless_var.get(), self.prewarm), daemon=True).start()
+    
+    def toggle_trace(self):
+        """Toggle per-stage tracing (JSON summary + Chrome trace per run)"""
+        self.trace_var.set(not self.trace_var.get())
+        if self.trace_var.get():
+            self.trace_button.config(text="로깅 켜짐", style="Accent.TButton")
+        else:
+            self.trace_button.config(text="로깅 꺼짐", style="TButton")
     
     def setup_styles(self):
         """Configure custom styles for better appearance"""
@@ -179,16 +229,20 @@ class ScraperGUI:
         # Get headless mode setting
         headless_mode = self.headless_var.get()
         
+        trace = self.trace_var.get()
+        
         # Run script in separate thread to prevent GUI freezing
-        thread = threading.Thread(target=self.execute_scraper, args=(headless_mode,))
+        thread = threading.Thread(target=self.execute_scraper, args=(headless_mode, trace))
         thread.daemon = True
         thread.start()
     
-    def execute_scraper(self, headless_mode):
+    def execute_scraper(self, headless_mode, trace=False):
         """Execute the scraper directly"""
         try:
-            # Run the main scraper function
-            scrape.scrape_once(headless=headless_mode)
+            # Waits for the background import; the pool hands over the prewarmed browser when it is ready
+            scrape = self.startup.scrape()
+            # Run the main scraper function on a warm browser from the process-wide pool
+            scrape.scrape_once(headless=headless_mode, pool=scrape.get_pool(headless_mode), trace=trace or None)
             
             # Create a mock result object
             class MockResult:
@@ -222,8 +276,20 @@ class ScraperGUI:
         self.status_label.config(text="")
         print("오류 발생")
         messagebox.showerror("오류", f"실행 실패:\n{error_msg}")
+    
+    def report_startup(self):
+        """--startup-timing: print the startup timings as JSON once scrape is imported, then exit"""
+        if not self.startup.import_finished:
+            self.root.after(20, self.report_startup)
+            return
+        print(json.dumps({"timings": self.startup.timings, "first_paint_at": self.first_paint_at}))
+        self.root.quit()
 
 def main():
+    # --startup-timing: measure the startup without starting Chrome (see benchmarks/bench_startup.py)
+    startup_timing = "--startup-timing" in sys.argv
+    # Credentials JSON: the first argument that is not a flag, otherwise config.py (as in scrape.py)
+    json_files = [arg for arg in sys.argv[1:] if not arg.startswith("-")]
     root = tk.Tk()
     
     # Configure style
@@ -231,7 +297,8 @@ def main():
     style.theme_use('clam')
     
     # Create and run the GUI
-    app = ScraperGUI(root)
+    app = ScraperGUI(root, prewarm=False if startup_timing else None, credentials_file=json_files[0] if json_files else None)
+    if startup_timing: app.report_startup()
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,157 @@
+"""
+Columnar history of every scrape: each run is appended to a local Parquet dataset partitioned by
+table and snapshot date, so past snapshots survive temp.xlsx being overwritten.
+
+    history/table=자산내역/date=2026-10-17/part-083000.parquet
+
+Text and categorical columns are stored dictionary-encoded (and read back as pandas categoricals),
+numbers as float64/int64 and dates as timestamps, with the run time in a 스냅샷시각 column.
+Queries open only the table's directory, prune date partitions and read the requested columns,
+so a year of daily snapshots answers without touching old workbooks.
+
+    store = HistoryStore("history")
+    store.append(frames)
+    store.fund_values("타임폴리오 AI 1호", start="2026-01-01")   # 평가액 per day for one 펀드
+    store.weight_trend("펀드내비중")                              # 보유비중 column per day and 펀드
+"""
+import os
+import threading
+from datetime import date, datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from schema import unique_names
+
+SNAPSHOT_COLUMN = "스냅샷시각"
+_PARTITIONING = ds.partitioning(pa.schema([("date", pa.date32())]), flavor="hive")
+_OPERATORS = {"==": "__eq__", "!=": "__ne__", ">": "__gt__", ">=": "__ge__", "<": "__lt__", "<=": "__le__"}
+
+def _to_date(value):
+    if value is None or isinstance(value, date) and not isinstance(value, datetime): return value
+    return pd.Timestamp(value).date()
+
+def to_arrow(df, snapshot_at):
+    """
+    DataFrame -> pyarrow Table with unique column names, a 스냅샷시각 column and a stable type per
+    kind of column, so every file of a table shares one schema
+    """
+    arrays, names = [], []
+    for name, (_, values) in zip(unique_names(df.columns), df.items()):
+        if pd.api.types.is_datetime64_any_dtype(values):
+            array = pa.array(values.dt.tz_localize(None) if values.dt.tz else values, type=pa.timestamp("ms"), from_pandas=True)
+        elif pd.api.types.is_bool_dtype(values): array = pa.array(values, type=pa.bool_(), from_pandas=True)
+        elif pd.api.types.is_integer_dtype(values): array = pa.array(values, type=pa.int64(), from_pandas=True)
+        elif pd.api.types.is_float_dtype(values): array = pa.array(values, type=pa.float64(), from_pandas=True)
+        else:
+            text = values.astype("string")
+            array = pa.array(text, type=pa.string(), from_pandas=True).dictionary_encode()
+        arrays.append(array)
+        names.append(name)
+    arrays.append(pa.array([snapshot_at] * len(df), type=pa.timestamp("ms")))
+    names.append(SNAPSHOT_COLUMN)
+    return pa.Table.from_arrays(arrays, names=names)
+
+class HistoryStore:
+    def __init__(self, directory):
+        self.directory = directory
+        self._datasets = {}
+        self._lock = threading.Lock()
+
+    def _table_dir(self, sheet):
+        return os.path.join(self.directory, f"table={sheet}")
+
+    def append(self, frames, snapshot_at=None):
+        """
+        Write one run of every non-empty frame
+        frames: dict sheet name -> DataFrame
+        -> list of written file paths
+        """
+        snapshot_at = snapshot_at or datetime.now()
+        paths = []
+        for sheet, df in frames.items():
+            if df is None or df.empty: continue
+            partition = os.path.join(self._table_dir(sheet), f"date={snapshot_at:%Y-%m-%d}")
+            os.makedirs(partition, exist_ok=True)
+            path = os.path.join(partition, f"part-{snapshot_at:%H%M%S}.parquet")
+            temp = os.path.join(partition, f".part-{snapshot_at:%H%M%S}.tmp")  # dot prefix: skipped by readers
+            pq.write_table(to_arrow(df, snapshot_at), temp, compression="zstd", use_dictionary=True)
+            os.replace(temp, path)
+            paths.append(path)
+            with self._lock: self._datasets.pop(sheet, None)
+        return paths
+
+    def _dataset(self, sheet):
+        with self._lock:
+            dataset = self._datasets.get(sheet)
+            if dataset is None:
+                directory = self._table_dir(sheet)
+                if not os.path.isdir(directory): return None
+                # Schema of the newest file, so columns added later are visible
+                newest = max(self.dates(sheet))
+                files = sorted(f for f in os.listdir(os.path.join(directory, f"date={newest}")) if f.endswith(".parquet"))
+                schema = pq.read_schema(os.path.join(directory, f"date={newest}", files[-1]))
+                schema = schema.append(pa.field("date", pa.date32()))
+                dataset = self._datasets[sheet] = ds.dataset(directory, format="parquet", partitioning=_PARTITIONING, schema=schema)
+            return dataset
+
+    def dates(self, sheet):
+        """-> sorted snapshot dates (YYYY-MM-DD strings) stored for sheet"""
+        directory = self._table_dir(sheet)
+        if not os.path.isdir(directory): return []
+        return sorted(name[len("date="):] for name in os.listdir(directory) if name.startswith("date="))
+
+    def query(self, sheet, columns=None, start=None, end=None, filters=None, latest_per_day=True):
+        """
+        Read history with partition pruning and column projection
+
+        columns: columns to read (None: all); "date" and 스냅샷시각 are always included
+        start, end: inclusive snapshot date bounds (date, datetime or "YYYY-MM-DD")
+        filters: dict column -> value or list of values, or list of (column, op, value) with
+                 op one of ==, !=, >, >=, <, <=
+        latest_per_day: keep only the last run of each day
+        -> DataFrame
+        """
+        dataset = self._dataset(sheet)
+        if dataset is None: return pd.DataFrame()
+
+        expression = None
+        def _and(condition):
+            nonlocal expression
+            expression = condition if expression is None else expression & condition
+        if start is not None: _and(ds.field("date") >= pa.scalar(_to_date(start), pa.date32()))
+        if end is not None: _and(ds.field("date") <= pa.scalar(_to_date(end), pa.date32()))
+        items = filters.items() if isinstance(filters, dict) else [(c, op, v) for c, op, v in (filters or [])]
+        for item in items:
+            if len(item) == 2:
+                column, value = item
+                _and(ds.field(column).isin(value) if isinstance(value, (list, tuple, set)) else ds.field(column) == value)
+            else:
+                column, op, value = item
+                _and(getattr(ds.field(column), _OPERATORS[op])(value))
+
+        if columns is not None:
+            columns = list(dict.fromkeys(["date", SNAPSHOT_COLUMN] + list(columns)))
+        table = dataset.to_table(columns=columns, filter=expression)
+        df = table.to_pandas()
+        df["date"] = pd.to_datetime(df["date"])
+        if latest_per_day and not df.empty:
+            last = df.groupby("date", observed=True)[SNAPSHOT_COLUMN].transform("max")
+            df = df[df[SNAPSHOT_COLUMN] == last].reset_index(drop=True)
+        return df
+
+    def fund_values(self, fund, start=None, end=None, value_column="평가액"):
+        """자산내역 value_column summed per snapshot date for one 펀드 -> Series indexed by date"""
+        df = self.query("자산내역", columns=[value_column], start=start, end=end, filters={"펀드": fund})
+        if df.empty: return pd.Series(dtype="float64", name=value_column)
+        return df.groupby("date")[value_column].sum()
+
+    def weight_trend(self, column="펀드내비중", funds=None, start=None, end=None):
+        """보유비중 column per snapshot date (rows) and 펀드 (columns) -> DataFrame"""
+        fund_column = "펀드 - 펀드"
+        filters = {fund_column: list(funds)} if funds else None
+        df = self.query("보유비중", columns=[fund_column, column], start=start, end=end, filters=filters)
+        if df.empty: return pd.DataFrame()
+        return df.pivot_table(index="date", columns=fund_column, values=column, aggfunc="sum", observed=True)
@@ -0,0 +1,69 @@
+"""
+Learned grid-cell locator.
+
+The first data cell of each view used to be guessed by trying #cell{n}_Id for every n around a
+hard-coded start, each miss costing a full long_loadtime. Instead, the cell is discovered with one
+in-page query (first visible element inside the grid container whose id matches the view's cell id
+pattern), remembered per view in a JSON file, and tried first on later runs. The cached selector is
+only re-learned when it no longer matches a cell on the page.
+"""
+import json
+import os
+import threading
+
+from easyscraperlib import cell_discovered, write_json_atomic
+
+class CellLocator:
+    def __init__(self, path):
+        """path: JSON cache file, view name -> CSS selector"""
+        self.path = path
+        self._lock = threading.Lock()
+        self._cache = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path): return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f: return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 셀 위치 캐시 읽기 실패: {e}")
+            return {}
+
+    def _save(self):
+        # Shared by parallel batch workers: a failed write only costs re-learning on a later run
+        try: write_json_atomic(self.path, self._cache, indent=2)
+        except OSError as e: print(f"⚠️ 셀 위치 캐시 저장 실패: {e}")
+
+    def cached(self, view):
+        with self._lock: return self._cache.get(view)
+
+    def remember(self, view, selector):
+        with self._lock:
+            if self._cache.get(view) == selector: return
+            self._cache[view] = selector
+            self._save()
+
+    def forget(self, view):
+        """Drop a selector that led to a failed extraction, so the next run re-learns it"""
+        with self._lock:
+            if self._cache.pop(view, None) is None: return
+            self._save()
+
+    def locate(self, scraper, view, id_pattern, hint=None):
+        """
+        Resolve the first data cell of the grid currently on screen
+
+        view: cache key (sheet name)
+        id_pattern: regular expression the cell ids of the view match, e.g. r"^cell\\d+_Id$"
+        hint: selector to try when nothing is cached (e.g. the id seen when the view was written)
+        -> CSS selector of the cell; raises TimeoutException if no matching cell appears
+        """
+        cached = self.cached(view)
+        for candidate in filter(None, (cached, hint)):
+            if scraper.is_grid_cell(candidate, id_pattern):
+                if candidate != cached: self.remember(view, candidate)
+                return candidate
+
+        selector = scraper.wait_for(cell_discovered(id_pattern), f"locate {view} cell")
+        print(f"🔎 {view} 셀 위치 학습: {cached or hint} -> {selector}")
+        self.remember(view, selector)
+        return selector
@@ -0,0 +1,236 @@
+"""
+Local stand-in for the TMS site, so extraction can be exercised without tms.timefolio.net.
+
+Serves the operation views as JSON API responses and a page with the login form, the
+AI -> 오퍼레이션 menus and datagrids with the same cell ids and context menu (Select All,
+Copy Selected Cells) as the real site, at a configurable row count and response latency.
+With --virtual the grids only render the rows in view, like a virtualized datagrid.
+With --assets N the page also loads N images, a web font and an analytics script of
+--asset-kb each (served with the same latency), like the real site's subresources.
+
+Usage: python mock_tms.py [--rows N] [--port 5000] [--require-login] [--latency 0.2] [--virtual] [--assets 20] [--asset-kb 50]
+then point "details_url" in system_constants.json at http://127.0.0.1:5000
+"""
+import argparse
+import datetime
+import random
+import time
+
+import secrets
+
+from flask import Flask, jsonify, abort, request
+
+from schema import SCHEMAS, DATE, INT, NUMBER
+
+# view key -> sheet, menu text and grid cell id pattern, mirroring scrape.TABLES
+VIEWS = {
+    "weight": {"sheet": "보유비중", "menu": "보유비중(AI,Bond,재간접)", "id_column": "d", "id_offset": 0},
+    "asset": {"sheet": "자산내역", "menu": "자산내역", "id_column": "d", "id_offset": 0},
+    "deal": {"sheet": "투자원장", "menu": "투자 원장 조회", "id_column": "Id", "id_offset": 105},
+}
+for spec in VIEWS.values(): spec["columns"] = SCHEMAS[spec["sheet"]].headers
+
+# Identifiers: typed TEXT in the schema, numbered and unique per row like the real site's
+ID_COLUMNS = {"ID", "투자번호"}
+CATEGORIES = {"펀드": ["타임폴리오 AI 1호", "타임폴리오 AI 2호", "타임폴리오 메자닌 1호"], "전략": ["AI", "MEZZ", "BOND"], "자산구분": ["주식", "CB", "BW", "EB"], "섹터": ["IT", "바이오", "소재", "산업재"]}
+
+def make_value(column, row, rng):
+    """Plausible raw JSON value for one cell of a schema.Column"""
+    if column.dtype == INT or column.name in ID_COLUMNS: return row + 1
+    if column.dtype == DATE: return (datetime.date(2024, 1, 1) + datetime.timedelta(days=row % 365)).isoformat()
+    if column.dtype == NUMBER: return round(rng.uniform(-1000, 1_000_000), 2)
+    if column.name.endswith("코드"): return f"A{100000 + row % 5000:06d}"
+    for name, values in CATEGORIES.items():
+        if column.name.startswith(name): return values[row % len(values)]
+    return f"{column.name}{row % 97}"
+
+def make_records(view, rows, seed=0):
+    """-> list of dicts keyed c0..cN (weight has duplicate column names, so keys are positional)"""
+    rng = random.Random(seed)
+    columns = SCHEMAS[VIEWS[view]["sheet"]].columns
+    return [{f"c{i}": make_value(column, row, rng) for i, column in enumerate(columns)} for row in range(rows)]
+
+PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>TMS mock</title>
+%(assets_head)s
+<style>
+  .datagrid td.selected { background: #cde; }
+  .datagrid tbody tr { height: 24px; } .datagrid td { white-space: nowrap; }
+  #ctx { position: absolute; background: #fff; border: 1px solid #888; display: flex; flex-direction: column; }
+</style></head>
+<body>%(assets_body)s<div id="root"></div>
+<div id="ctx" hidden><button onclick="selectAll()">Select All</button><button onclick="copySelected()">Copy Selected Cells</button></div>
+<script>
+var VIEWS = %(views)s;
+var LATENCY = %(latency)s * 1000;
+var VIRTUAL = %(virtual)s;
+var root = document.getElementById('root'), ctx = document.getElementById('ctx');
+
+function showLogin(message) {
+  root.innerHTML = '<div><div><div><div class="login-right"><div><form onsubmit="return submitLogin()">' +
+    '<input id="userId"><input id="password" type="password"><button type="submit">로그인</button>' +
+    '<p id="loginError">' + (message || '') + '</p></form></div></div></div></div>';
+}
+function submitLogin() {
+  var body = {userId: document.getElementById('userId').value, password: document.getElementById('password').value};
+  fetch('/api/auth/login', {method: 'POST', headers: {'Content-Type': 'application/json'}, body: JSON.stringify(body)})
+    .then(function(r) { if (r.ok) showApp(); else showLogin('로그인 실패'); });
+  return false;
+}
+function showApp() {
+  var buttons = Object.keys(VIEWS).map(function(v) { return '<button onclick="openView(\\'' + v + '\\')">' + VIEWS[v].menu + '</button>'; });
+  root.innerHTML = '<div><div><nav><button onclick="toggle(\\'aiMenu\\')">AI</button>' +
+    '<div id="aiMenu" hidden><button onclick="openOperations()">오퍼레이션</button></div></nav>' +
+    '<main><div id="views" hidden>' + buttons.join('') + '</div><div id="grid"></div></main></div></div>';
+}
+function toggle(id) { var el = document.getElementById(id); el.hidden = !el.hidden; }
+function openOperations() { setTimeout(function() { document.getElementById('views').hidden = false; }, LATENCY); }
+
+function fmt(v) { return typeof v === 'number' ? v.toLocaleString('en-US') : (v == null ? '' : String(v)); }
+function rowHtml(spec, r, i) {
+  var html = ['<tr>'];
+  spec.columns.forEach(function(c, j) {
+    var id = j === 0 ? ' id="cell' + (i + spec.id_offset) + '_' + spec.id_column + '"' : '';
+    html.push('<td' + id + '>' + fmt(r['c' + j]) + '</td>');
+  });
+  html.push('</tr>');
+  return html.join('');
+}
+function render(view, records) {
+  var spec = VIEWS[view], html = ['<div class="datagrid scroll"><table><thead><tr>'];
+  spec.columns.forEach(function(c) { html.push('<th>' + c + '</th>'); });
+  html.push('</tr></thead><tbody>');
+  if (!VIRTUAL) records.forEach(function(r, i) { html.push(rowHtml(spec, r, i)); });
+  html.push('</tbody></table></div>');
+  document.getElementById('grid').innerHTML = html.join('');
+  if (VIRTUAL) virtualize(spec, records);
+}
+// Virtualized grid: only the rows in view (plus a margin) are in the DOM, spacer rows keep the scroll height
+function virtualize(spec, records) {
+  var ROW = 24, box = document.querySelector('#grid .datagrid'), tbody = box.querySelector('tbody');
+  box.style.cssText = 'height: 480px; overflow-y: auto;';
+  var draw = function() {
+    var first = Math.max(0, Math.floor(box.scrollTop / ROW) - 5);
+    var last = Math.min(records.length, first + Math.ceil(box.clientHeight / ROW) + 10);
+    var html = ['<tr style="height: ' + first * ROW + 'px"></tr>'];
+    for (var i = first; i < last; i++) html.push(rowHtml(spec, records[i], i));
+    html.push('<tr style="height: ' + (records.length - last) * ROW + 'px"></tr>');
+    tbody.innerHTML = html.join('');
+  };
+  box.addEventListener('scroll', function() { requestAnimationFrame(draw); });
+  draw();
+}
+function openView(view) {
+  document.getElementById('grid').innerHTML = '';
+  fetch('/api/operation/' + view).then(function(r) { return r.json(); }).then(function(records) { render(view, records); });
+}
+
+// Grid context menu: Select All marks every cell, Copy Selected Cells puts the data rows on the clipboard as TSV
+document.addEventListener('contextmenu', function(e) {
+  if (!e.target.closest('.datagrid')) return;
+  e.preventDefault();
+  ctx.style.left = e.pageX + 'px';
+  ctx.style.top = e.pageY + 'px';
+  ctx.hidden = false;
+});
+document.addEventListener('click', function(e) { if (!ctx.contains(e.target)) ctx.hidden = true; });
+function selectAll() {
+  document.querySelectorAll('.datagrid tbody td').forEach(function(td) { td.classList.add('selected'); });
+  ctx.hidden = true;
+}
+function copySelected() {
+  var lines = [];
+  document.querySelectorAll('.datagrid tbody tr').forEach(function(tr) {
+    var cells = Array.prototype.filter.call(tr.children, function(td) { return td.classList.contains('selected'); });
+    if (cells.length) lines.push(cells.map(function(td) { return td.textContent; }).join('\\t'));
+  });
+  var area = document.createElement('textarea');
+  area.value = lines.join('\\r\\n') + '\\r\\n';
+  document.body.appendChild(area);
+  area.select();
+  document.execCommand('copy');
+  area.remove();
+  ctx.hidden = true;
+}
+%(start)s
+</script></body></html>"""
+
+ASSET_TYPES = {".png": "image/png", ".woff2": "font/woff2", ".js": "application/javascript"}
+
+def asset_markup(count):
+    """-> (head, body) HTML loading `count` images, one web font and one analytics script"""
+    if not count: return "", ""
+    head = ('<style>@font-face { font-family: Brand; src: url(/asset/brand.woff2); } body { font-family: Brand, sans-serif; }</style>'
+            '<script async src="/asset/analytics.js"></script>')
+    body = "".join(f'<img src="/asset/banner{i}.png" width="1" height="1">' for i in range(count))
+    return head, body
+
+def create_app(rows=100, seed=0, require_login=False, userid="mock", password="mock", latency=0.0, assets=0, asset_kb=50,
+               virtual=False):
+    """
+    rows: number of records per view
+    require_login: the page shows the login form and /api/operation/* answers 401 until
+                   /api/auth/login set the session cookie
+    latency: seconds added to every API response (and to opening 오퍼레이션)
+    virtual: grids render only the rows scrolled into view
+    assets: images on the page, plus a font and an analytics script when > 0 (asset_kb each)
+    -> Flask app serving the mock page, /api/auth/login, /api/operation/<view> and /asset/<name>
+    """
+    app = Flask(__name__)
+    sessions = set()
+    app.json.ensure_ascii = False
+    app.json.sort_keys = False  # records keep column order, as records_from_payload reads it from the first record
+    data = {view: make_records(view, rows, seed) for view in VIEWS}
+
+    def logged_in():
+        return not require_login or request.cookies.get("TMS_SESSION") in sessions
+
+    @app.route("/")
+    def index():
+        views = {view: {"menu": spec["menu"], "columns": spec["columns"], "id_column": spec["id_column"],
+                        "id_offset": spec["id_offset"]} for view, spec in VIEWS.items()}
+        head, body = asset_markup(assets)
+        return PAGE % {"views": jsonify(views).get_data(as_text=True), "latency": latency,
+                       "start": "showApp();" if logged_in() else "showLogin();", "assets_head": head, "assets_body": body,
+                       "virtual": "true" if virtual else "false"}
+
+    @app.route("/asset/<name>")
+    def asset(name):
+        mimetype = ASSET_TYPES.get(name[name.rfind("."):])
+        if mimetype is None: abort(404)
+        time.sleep(latency)
+        content = b"//" + b"x" * (asset_kb * 1024) if mimetype == "application/javascript" else secrets.token_bytes(asset_kb * 1024)
+        return app.response_class(content, mimetype=mimetype, headers={"Cache-Control": "no-store"})
+
+    @app.route("/api/auth/login", methods=["POST"])
+    def auth_login():
+        time.sleep(latency)
+        credentials = request.get_json(silent=True) or request.form
+        if credentials.get("userId") != userid or credentials.get("password") != password: abort(401)
+        token = secrets.token_hex(16)
+        sessions.add(token)
+        response = jsonify({"token": token})
+        response.set_cookie("TMS_SESSION", token)
+        return response
+
+    @app.route("/api/operation/<view>")
+    def operation(view):
+        if view not in data: abort(404)
+        if not logged_in(): abort(401)
+        time.sleep(latency)
+        return jsonify(data[view])
+
+    return app
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local TMS stand-in")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--require-login", action="store_true", help="show the login form and reject API calls without a session cookie")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every API response")
+    parser.add_argument("--virtual", action="store_true", help="render only the grid rows in view")
+    parser.add_argument("--assets", type=int, default=0, help="images on the page (plus a font and an analytics script)")
+    parser.add_argument("--asset-kb", type=int, default=50, help="size of every asset")
+    args = parser.parse_args()
+    create_app(rows=args.rows, require_login=args.require_login, latency=args.latency, assets=args.assets,
+               asset_kb=args.asset_kb, virtual=args.virtual).run(port=args.port, threaded=True)
@@ -0,0 +1,118 @@
+"""
+Typed column schemas for the scraped tables.
+
+Each table declares, column by column in grid order, the dtype it is parsed to and whether it is
+stored as a pandas categorical. TableSchema.convert parses a DataFrame of raw strings in one
+vectorized pass per column: "1,234" -> 1234, "12.5%" -> 12.5, "(300)" -> -300, and
+"2024-01-31" / "2024.01.31" / "20240131" -> datetime64.
+"""
+import pandas as pd
+
+TEXT = "text"
+NUMBER = "number"
+INT = "int"
+DATE = "date"
+
+class Column:
+    def __init__(self, name, dtype=TEXT, categorical=False):
+        """
+        name: header as it appears in the sheet
+        dtype: TEXT, NUMBER (float64), INT (nullable Int64) or DATE (datetime64)
+        categorical: store as pandas category (low-cardinality labels such as 펀드, 전략)
+        """
+        self.name = name
+        self.dtype = dtype
+        self.categorical = categorical
+
+def parse_numbers(series):
+    """
+    Vectorized Korean-locale number parsing: thousands separators, percent signs and
+    accounting-style parenthesis negatives. Unparseable values become NaN.
+    """
+    if pd.api.types.is_numeric_dtype(series): return series.astype("float64")
+    text = series.astype("string").str.strip()
+    negative = text.str.match(r"^\(.*\)$", na=False)
+    text = text.str.replace(r"[,%()\s]", "", regex=True)
+    numbers = pd.to_numeric(text.replace("", None), errors="coerce").astype("float64")
+    return numbers.mask(negative, -numbers)
+
+def parse_dates(series):
+    """Vectorized date parsing for YYYY-MM-DD, YYYY.MM.DD, YYYY/MM/DD and YYYYMMDD"""
+    if pd.api.types.is_datetime64_any_dtype(series): return series
+    text = series.astype("string").str.strip().str.replace(r"[./]", "-", regex=True)
+    dates = pd.to_datetime(text.str.slice(0, 10), format="%Y-%m-%d", errors="coerce")
+    compact = dates.isna() & text.str.fullmatch(r"\d{8}", na=False)
+    if compact.any(): dates[compact] = pd.to_datetime(text[compact], format="%Y%m%d", errors="coerce")
+    return dates
+
+PARSERS = {
+    NUMBER: parse_numbers,
+    INT: lambda series: parse_numbers(series).round().astype("Int64"),
+    DATE: parse_dates,
+}
+
+class TableSchema:
+    def __init__(self, sheet, columns):
+        self.sheet = sheet
+        self.columns = columns
+
+    @property
+    def headers(self):
+        return [column.name for column in self.columns]
+
+    def convert(self, df):
+        """
+        Parse every declared column of df (matched by position, since 보유비중 repeats header names).
+        Columns beyond the schema are left as they are.
+        -> new DataFrame
+        """
+        df = df.copy()
+        for position, column in enumerate(self.columns[:df.shape[1]]):
+            values = df.iloc[:, position]
+            parser = PARSERS.get(column.dtype)
+            if parser: values = parser(values)
+            elif pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+                values = values.astype("string")
+            if column.categorical: values = values.astype("category")
+            df.isetitem(position, values)
+        return df
+
+def unique_names(columns):
+    """보유비중 repeats 평가액/펀드내비중; Arrow and Parquet need unique field names -> ["평가액", "평가액.1", ...]"""
+    seen = {}
+    names = []
+    for column in columns:
+        count = seen.get(column, 0)
+        seen[column] = count + 1
+        names.append(column if count == 0 else f"{column}.{count}")
+    return names
+
+def _columns(*specs):
+    """("name", dtype[, categorical]) tuples -> list of Column"""
+    return [Column(*spec) for spec in specs]
+
+SCHEMAS = {
+    "보유비중": TableSchema("보유비중", _columns(
+        ("날짜", DATE), ("펀드 - 펀드", TEXT, True), ("AI(전략) - NAV", NUMBER), ("MEZZ(전략) - 좌수", NUMBER),
+        ("AI + MEZZ - 평가액", NUMBER), ("간접투자(전체) - 펀드내비중", NUMBER), ("비시장성자산 - 평가액", NUMBER),
+        ("비유동성자산 - 펀드내비중", NUMBER), ("평가액", NUMBER), ("펀드내비중", NUMBER), ("평가액", NUMBER),
+        ("펀드내비중", NUMBER), ("평가액", NUMBER), ("펀드내비중", NUMBER), ("평가액", NUMBER), ("펀드내비중", NUMBER),
+    )),
+    "자산내역": TableSchema("자산내역", _columns(
+        ("날짜", DATE), ("펀드", TEXT, True), ("전략", TEXT, True), ("종목코드", TEXT), ("종목명", TEXT),
+        ("매매제한", TEXT, True), ("보유수량", NUMBER), ("종가", NUMBER), ("직간접", TEXT, True), ("자산구분", TEXT, True),
+        ("투자형태", TEXT, True), ("상장시장", TEXT, True), ("시가평가여부", TEXT, True), ("기초자산코드", TEXT),
+        ("기초자산명", TEXT), ("기초자산구분", TEXT, True), ("기초자산투자형태", TEXT, True), ("기초자산 상장시장", TEXT, True),
+        ("기초자산 기업코드", TEXT), ("기초자산 기업명", TEXT), ("기초자산기업 상장시장", TEXT, True), ("섹터", TEXT, True),
+    )),
+    "투자원장": TableSchema("투자원장", _columns(
+        ("ID", TEXT), ("자산코드", TEXT), ("자산명", TEXT), ("투자형태", TEXT, True), ("기초자산명", TEXT),
+        ("구/신", TEXT, True), ("보유형태", TEXT, True), ("최초투자원금", NUMBER), ("현재원금액", NUMBER),
+        ("현재평가액", NUMBER), ("평가수익률", NUMBER), ("회수수익률", NUMBER), ("투자단가", NUMBER), ("현재주가", NUMBER),
+        ("괴리율", NUMBER), ("담당자(운용)", TEXT, True), ("담당자(지원)", TEXT, True), ("Exit예상(M)", TEXT),
+        ("Exit예상(급)", TEXT), ("Exit방안(급)", TEXT), ("Exit예상(평)", TEXT), ("Exit방안(평)", TEXT), ("투자일", DATE),
+        ("전환가능일", DATE), ("PUT최초일", DATE), ("PUT다음일", DATE), ("PUT최종일", DATE), ("CALL최초일", DATE),
+        ("CALL종료일", DATE), ("보호예수종료일", DATE), ("만기일", DATE), ("YTM", NUMBER), ("YTP", NUMBER), ("YTC", NUMBER),
+        ("CALL가능비율", NUMBER), ("투자번호", TEXT),
+    )),
+}
@@ -1,15 +1,26 @@
-from easyscraperlib import EasyScraper, get
+from easyscraperlib import EasyScraper, ScraperPool, HttpScraper, get, dom_settled, network_idle, grid_rows_stable, view_replaced, element_clickable, clipboard_filled, text_element_present
 import time
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 import pandas as pd
+from excel_export import write_sheets
+from schema import SCHEMAS, TableSchema
+from locator import CellLocator
+from spill import RowSpill
+from tracing import span, start_trace, stop_trace
+from delta import SnapshotStore, append_log, compute_deltas, report as report_changes
 import glob
 import os
+import pyperclip
 
+import io
+import csv
 import json
 import sys
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Get USERID, PASSWORD, and headless from JSON file if provided, otherwise from config
 def get_credentials_from_json(json_file):
@@ -36,19 +47,38 @@ def get_exe_dir():
         # Running as script
         return os.path.dirname(os.path.abspath(__file__))
 
-# Check if JSON file is provided as command line argument
-if len(sys.argv) > 1:
-    # Get credentials from JSON file
-    USERID, PASSWORD, HEADLESS_FROM_JSON = get_credentials_from_json(sys.argv[1])
-else:
-    # Fall back to config file
-    try:
-        from config import USERID, PASSWORD
-        HEADLESS_FROM_JSON = None
-    except ImportError:
-        USERID = ""
-        PASSWORD = ""
-        HEADLESS_FROM_JSON = None
+def get_output_dir():
+    """Directory temp.xlsx and its snapshots are written to: the "output_dir" setting, or the exe directory"""
+    return get("output_dir") or get_exe_dir()
+
+# Credentials used by login(), get_pool() and the HTTP replay; load_credentials() fills them in
+USERID = None
+PASSWORD = None
+HEADLESS_FROM_JSON = None
+
+def load_credentials(json_file=None):
+    """
+    Set the module-level credentials from a credentials JSON file, otherwise from config.py
+    -> (userid, password, headless from the JSON file or None)
+    """
+    global USERID, PASSWORD, HEADLESS_FROM_JSON
+    if json_file:
+        USERID, PASSWORD, HEADLESS_FROM_JSON = get_credentials_from_json(json_file)
+    else:
+        try: from config import USERID as userid, PASSWORD as password
+        except ImportError: userid, password = "", ""
+        USERID, PASSWORD, HEADLESS_FROM_JSON = userid, password, None
+    return USERID, PASSWORD, HEADLESS_FROM_JSON
+
+def credentials():
+    """-> (userid, password), loaded from config.py on first use when nothing set them"""
+    if USERID is None: load_credentials()
+    return USERID, PASSWORD
+
+def publish_snapshots(frames):
+    """Hand the frames to the snapshot service when this process serves it (flask is only imported by serve())"""
+    service = sys.modules.get("snapshot_service")
+    if service is not None: service.publish(frames)
 
 def convert_numeric_columns(df):
     """
@@ -79,10 +109,12 @@ def create_dataframe_from_rows(data_rows, headers):
     Create a pandas DataFrame from datas.
     
     data_rows: list of row data (list of lists)
-    headers: list of header names
+    headers: TableSchema from schema.SCHEMAS, or a plain list of header names
     -> pandas.DataFrame with aligned headers
     """
     if not data_rows: return pd.DataFrame()
+    schema = headers if isinstance(headers, TableSchema) else None
+    if schema: headers = schema.headers
 
     num_cols = len(data_rows[0])
     if len(headers) < num_cols: headers = headers + [f'Column_{i+1}' for i in range(num_cols - len(headers))]
@@ -90,11 +122,90 @@ def create_dataframe_from_rows(data_rows, headers):
     
     df = pd.DataFrame(data_rows, columns=headers)
     
-    # Convert numeric columns
-    df = convert_numeric_columns(df)
+    # Typed conversion from the schema, or best-effort numeric detection for plain headers
+    df = schema.convert(df) if schema else convert_numeric_columns(df)
+    
+    return df
+
+def create_dataframe_from_tsv(text, headers):
+    """
+    Create a pandas DataFrame straight from tab-separated text (clipboard or grid copy)
+    without building Python lists per cell: the text goes to the pandas C parser (or pyarrow,
+    via the "tsv_engine" setting) and headers are aligned like create_dataframe_from_rows.
+    Ragged rows are padded; rows longer than the first one get Column_N headers.
+    
+    text: tab-separated values, one row per line
+    headers: TableSchema from schema.SCHEMAS, or a plain list of header names
+    -> pandas.DataFrame with aligned headers
+    """
+    if not text or not text.strip(): return pd.DataFrame()
+    schema = headers if isinstance(headers, TableSchema) else None
+    if schema: headers = schema.headers
+
+    first_line = next(line for line in io.StringIO(text) if line.strip())
+    num_cols = first_line.count('\t') + 1
+    if len(headers) < num_cols: headers = headers + [f'Column_{i+1}' for i in range(num_cols - len(headers))]
+    elif len(headers) > num_cols: headers = headers[:num_cols]
+
+    try: df = _read_tsv(text, num_cols)
+    except pd.errors.ParserError:
+        # Some row is wider than the first one: measure the widest row and read again
+        width = max(line.count('\t') + 1 for line in io.StringIO(text))
+        df = _read_tsv(text, width, engine="c")
+        headers = headers + [f'Column_{i+1}' for i in range(num_cols, width)]
+    df.columns = headers
+
+    # Typed conversion from the schema, or best-effort numeric detection for plain headers
+    return schema.convert(df) if schema else convert_numeric_columns(df)
+
+def create_dataframe_from_spill(spill, headers):
+    """
+    Create a pandas DataFrame from rows spilled to a TSV file (scroll extractor), read by the
+    pandas C parser straight from disk; headers are aligned like create_dataframe_from_rows.
     
+    spill: RowSpill
+    headers: TableSchema from schema.SCHEMAS, or a plain list of header names
+    -> pandas.DataFrame with aligned headers
+    """
+    if not spill.rows: return pd.DataFrame()
+    schema = headers if isinstance(headers, TableSchema) else None
+    if schema: headers = schema.headers
+
+    num_cols = spill.width
+    if len(headers) < num_cols: headers = headers + [f'Column_{i+1}' for i in range(num_cols - len(headers))]
+    elif len(headers) > num_cols: headers = headers[:num_cols]
+
+    df = pd.read_csv(spill.path, sep='\t', header=None, names=range(num_cols), dtype=str, engine="c", encoding="utf-8",
+                     quoting=csv.QUOTE_NONE, na_filter=False, skip_blank_lines=True)
+    df.columns = headers
+    return schema.convert(df) if schema else convert_numeric_columns(df)
+
+def _read_tsv_arrow(text, width):
+    """pyarrow parse with the C path's semantics: no quoting, every cell a string, "NA"/"" kept as text"""
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    names = [str(i) for i in range(width)]
+    table = pa_csv.read_csv(
+        io.BytesIO(text.encode("utf-8")),
+        read_options=pa_csv.ReadOptions(column_names=names),
+        parse_options=pa_csv.ParseOptions(delimiter='\t', quote_char=False, double_quote=False, escape_char=False),
+        convert_options=pa_csv.ConvertOptions(column_types={name: pa.string() for name in names}, null_values=[],
+                                              strings_can_be_null=False, quoted_strings_can_be_null=False))
+    df = table.to_pandas()
+    df.columns = range(width)
     return df
 
+def _read_tsv(text, width, engine=None):
+    engine = engine or get("tsv_engine", "c")
+    if engine == "pyarrow":
+        # Rows shorter than the widest one are an error for pyarrow; the C parser pads them
+        try: return _read_tsv_arrow(text, width)
+        except ImportError: pass
+        except Exception as e: print(f"pyarrow TSV parse failed, using the C parser: {e}")
+        engine = "c"
+    return pd.read_csv(io.StringIO(text), sep='\t', header=None, names=range(width), dtype=str, engine=engine,
+                       quoting=csv.QUOTE_NONE, na_filter=False, skip_blank_lines=True)
+
 def find_latest_deallog_file():
     """Find the latest 메자닌_DealLog_{version}.xlsx file"""
     pattern = "메자닌_DealLog_*.xlsx"
@@ -116,150 +227,509 @@ def find_latest_deallog_file():
     print(f"Found latest deal log file: {latest_file}")
     return latest_file
 
+# The OS clipboard is shared by every browser of the process, so clipboard extractions run one at a time
+_clipboard_lock = threading.Lock()
+
 def scrape_table_to_clipboard(scraper, cell_selector):
     """
     cell_selector: CSS selector for the starting cell
-    -> list of lists: Data rows parsed from clipboard
+    -> str: tab-separated table text copied to the clipboard
 
     * Waits until cell is loaded
     """
+    with _clipboard_lock:
+        return _scrape_table_to_clipboard(scraper, cell_selector)
+
+def _scrape_table_to_clipboard(scraper, cell_selector):
     try:
-        cell_element = WebDriverWait(scraper.driver, get("long_loadtime")).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, cell_selector))
-        )
+        cell_element = scraper.wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, cell_selector)), f"cell {cell_selector}")
         scraper.driver.execute_script("arguments[0].click();", cell_element)
-        time.sleep(get("buffer_time"))
+        scraper.settle(dom_settled(), f"select {cell_selector}")
         
         action = ActionChains(scraper.driver)
         action.context_click(cell_element).perform()
-        time.sleep(get("buffer_time"))
-        
+        # click_button_by_text waits for the menu entry to be displayed and clicks it in the same call
         scraper.click_button_by_text("Select All")
-        time.sleep(get("buffer_time"))
 
         action = ActionChains(scraper.driver)
         action.context_click(cell_element).perform()
-        time.sleep(get("buffer_time"))
-        
-        scraper.click_button_by_text("Copy Selected Cells")
-        time.sleep(get("buffer_time"))
+        # Cleared first, so the previous table's text can never pass for this one's
+        pyperclip.copy("")
+        scraper.click_button_by_text("Copy Selected Cells", until=clipboard_filled())
         
-        data_rows = EasyScraper.parse_clipboard_to_rows()
-        return data_rows
+        # Raw TSV text; build_table_frame hands it to the pandas C parser. A hard wait: an empty
+        # clipboard means the copy failed
+        return scraper.wait_for(clipboard_filled(), "clipboard copy")
         
     except Exception as e:
         raise Exception(f"Error scraping clipboard data from {cell_selector}: {e}")
 
-def scrape_table_to_clipboard_with_fallback(scraper, base_cell_selector, start_num=160, num_range=40, suffix="_Id"):
+def scrape_table_with_script(scraper, cell_selector):
+    """
+    cell_selector: CSS selector for any cell of the grid
+    -> list of lists: Data rows serialized in-page by a single execute_script call
+
+    * Waits until cell is loaded
+    """
+    try:
+        scraper.wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, cell_selector)), f"cell {cell_selector}")
+        _, data_rows = scraper.extract_grid(cell_selector)
+        return data_rows
+
+    except Exception as e:
+        raise Exception(f"Error scraping grid data from {cell_selector}: {e}")
+
+def scrape_table_by_scrolling(scraper, cell_selector, key_columns=()):
+    """
+    cell_selector: CSS selector for any cell of the grid
+    key_columns: indexes of the cells identifying a row (empty: the whole row)
+    -> RowSpill: rows harvested while scrolling the grid, streamed to a temporary TSV file
+
+    * Waits until cell is loaded; works on grids that only render the rows in view
+    """
+    try:
+        scraper.wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, cell_selector)), f"cell {cell_selector}")
+        with RowSpill(get("spill_dir")) as spill:
+            for chunk in scraper.harvest_grid(cell_selector, key_columns): spill.write(chunk)
+        return spill
+
+    except Exception as e:
+        raise Exception(f"Error harvesting grid data from {cell_selector}: {e}")
+
+# Extraction strategies selectable per table via the "extraction" section of system_constants.json
+EXTRACTORS = {
+    "clipboard": scrape_table_to_clipboard,
+    "script": scrape_table_with_script,
+    "scroll": scrape_table_by_scrolling,
+}
+
+def scrape_table(scraper, cell_selector, extractor="clipboard", key_columns=()):
+    """
+    extractor: "clipboard" (context menu copy), "script" (in-page JSON serialization) or
+               "scroll" (scroll-and-harvest for virtualized grids, spilled to disk)
+    key_columns: row key cell indexes for the scroll extractor (empty: the whole row)
+    -> list of lists, tab-separated text from the clipboard extractor, or a RowSpill
+    """
+    if extractor not in EXTRACTORS: raise ValueError(f"Unknown extractor: {extractor}")
+    if extractor == "scroll": return EXTRACTORS[extractor](scraper, cell_selector, key_columns)
+    return EXTRACTORS[extractor](scraper, cell_selector)
+
+def row_key_columns(table):
+    """-> indexes of the table's row_key columns in its schema headers (empty: the whole row is the key)"""
+    return [table["schema"].headers.index(column) for column in table.get("row_key") or []]
+
+def benchmark_extractors(scraper, cell_selector, repeats=3):
     """
-    Try scraping with base_cell_selector, if fails, try alternative cell numbers
+    Time every extractor against the grid currently on screen
     
-    base_cell_selector: e.g., "#cell105_Id"
-    start_num: starting cell number
-    num_range: how many cells above and below to try
-    suffix: suffix for the cell selector (e.g., "_Id")
-    """
-    # Extract the selector pattern
-    if "#cell" in base_cell_selector and suffix in base_cell_selector:
-        # Try the original selector first
-        try:
-            return scrape_table_to_clipboard(scraper, base_cell_selector)
-        except Exception as e1:
-            print(f"Failed with {base_cell_selector}, trying alternatives...")
-            
-            # Try nearby cell numbers
-            for offset in range(-num_range, num_range + 1):
-                if offset == 0:  # Skip the original
-                    continue
-                    
-                try_cell_num = start_num + offset
-                try_selector = f"#cell{try_cell_num}{suffix}"
-                
-                try:
-                    print(f"Trying {try_selector}...")
-                    return scrape_table_to_clipboard(scraper, try_selector)
-                except Exception:
-                    continue
-            
-            # If all attempts fail, raise the original error
-            raise Exception(f"Failed to find working cell selector after trying {num_range*2 + 1} alternatives: {e1}")
-    else:
-        # If pattern doesn't match, just try the original
-        return scrape_table_to_clipboard(scraper, base_cell_selector)
+    -> dict: extractor name -> {"rows": row count, "seconds": mean seconds per extraction}
+    """
+    results = {}
+    for name in EXTRACTORS:
+        timings = []
+        rows = 0
+        for _ in range(repeats):
+            start = time.perf_counter()
+            try:
+                data = scrape_table(scraper, cell_selector, name)
+                if isinstance(data, RowSpill):
+                    rows = data.rows
+                    data.remove()
+                else: rows = sum(1 for line in data.splitlines() if line.strip()) if isinstance(data, str) else len(data)
+            except Exception as e:
+                print(f"{name} failed on {cell_selector}: {e}")
+                break
+            timings.append(time.perf_counter() - start)
+        if timings: results[name] = {"rows": rows, "seconds": sum(timings) / len(timings)}
+    for name, result in results.items():
+        print(f"{cell_selector} {name:<10} {result['rows']:>7} rows  {result['seconds']:.3f}s")
+    return results
 
-def scrape_once(headless=False):
-    print("Initializing scraper...")
-    scraper = EasyScraper(headless=headless)
-    scraper.setup()
-    print("Opening details page...")
-    scraper.driver.get(get("details_url"))
-    time.sleep(get("buffer_time"))
+_locator = None
+_locator_lock = threading.Lock()
+
+def get_locator():
+    """-> the process-wide CellLocator, cached next to the exe"""
+    global _locator
+    with _locator_lock:
+        if _locator is None: _locator = CellLocator(os.path.join(get_exe_dir(), get("locator_cache", "locators.json")))
+        return _locator
+
+def scrape_located_table(scraper, table, extractor="clipboard"):
+    """
+    Extract the grid on screen starting from its learned first cell.
+    A cached cell that leads to a failed extraction is forgotten, so the next run re-learns it.
+
+    table: entry of TABLES
+    """
+    locator = get_locator()
+    cell_selector = locator.locate(scraper, table["sheet"], table["cell_pattern"], hint=table["cell"])
+    scraper.settle(grid_rows_stable(cell_selector), f"grid {table['sheet']}")
+    try: return scrape_table(scraper, cell_selector, extractor, row_key_columns(table))
+    except Exception:
+        locator.forget(table["sheet"])
+        raise
+
+def profile_dir_for(userid):
+    """Persistent Chrome profile directory for one credential, next to the exe"""
+    digest = hashlib.sha256(userid.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(get_exe_dir(), get("profile_root", "profiles"), digest)
+
+def login(scraper, userid=None, password=None):
+    """
+    Open the TMS site and sign in (defaults to the module-level credentials).
+    With a persistent profile, a still-valid session (profile cookies or saved cookies) skips the login form.
+    """
+    with span("login"):
+        if scraper.profile_dir:
+            if is_logged_in(scraper) or (scraper.restore_cookies() and is_logged_in(scraper)):
+                print("✅ 저장된 세션으로 로그인 생략")
+                return
+            print("저장된 세션 없음 또는 만료, 로그인 진행")
 
-    scraper.fill_input("#userId", USERID)
-    scraper.fill_input("#password", PASSWORD)
-    scraper.click_button("#root > div > div > div > div.login-right > div > form > button")
-    time.sleep(get("buffer_time"))
+        print("Opening details page...")
+        scraper.open(get("details_url"), until=element_clickable("#userId"), name="login page", replaced=get("buffer_time"))
 
+        default_userid, default_password = credentials()
+        scraper.fill_input("#userId", default_userid if userid is None else userid)
+        scraper.fill_input("#password", default_password if password is None else password)
+        scraper.click_button("#root > div > div > div > div.login-right > div > form > button", until=network_idle())
+        scraper.save_cookies()
+
+def is_logged_in(scraper):
+    """Open the TMS site and report whether the session is still signed in (menu shown instead of the login form)"""
+    menu_shown = text_element_present("AI")
+    def _state(driver):
+        if driver.find_elements(By.CSS_SELECTOR, "#userId"): return "login"
+        return "menu" if menu_shown(driver) else False
+    try: return scraper.open(get("details_url"), until=_state, name="session check", replaced=get("buffer_time")) == "menu"
+    except Exception: return False
+
+# Browser pool owned by the process (GUI), keeping a logged-in Chrome warm between runs
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool(headless=False):
+    """-> the process-wide ScraperPool, rebuilt when the headless setting changes"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool.headless != headless:
+            _pool.close()
+            _pool = None
+        if _pool is None:
+            profile_dir = profile_dir_for(credentials()[0]) if get("persistent_profile", False) else None
+            _pool = ScraperPool(login, is_logged_in, headless=headless, size=get("pool_size", 1),
+                                max_runs=get("pool_max_runs"), max_memory_mb=get("pool_max_memory_mb"), profile_dir=profile_dir)
+        return _pool
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None: _pool.close()
+        _pool = None
+
+def open_operations(scraper):
+    """Navigate AI -> 오퍼레이션, where the 보유비중/자산내역/투자 원장 views live"""
     scraper.click_button_by_text("AI")
-    time.sleep(get("buffer_time"))
-    
-    scraper.click_button_by_text("오퍼레이션")
-    time.sleep(get("buffer_time"))
+    scraper.click_button_by_text("오퍼레이션", until=network_idle())
 
-    scraper.click_button_by_text("보유비중(AI,Bond,재간접)")
-    time.sleep(get("buffer_time"))
-    try:
-        data_rows = scrape_table_to_clipboard(scraper, "#cell1_d")
-        predefined_headers = ["날짜", "펀드 - 펀드", "AI(전략) - NAV", "MEZZ(전략) - 좌수", "AI + MEZZ - 평가액", "간접투자(전체) - 펀드내비중", "비시장성자산 - 평가액", "비유동성자산 - 펀드내비중", "평가액", "펀드내비중", "평가액", "펀드내비중", "평가액", "펀드내비중", "평가액", "펀드내비중"]
-        df_weight = create_dataframe_from_rows(data_rows, predefined_headers)
-    except Exception as e: raise Exception(f"Error processing weight data: {e}")
+# Views scraped into temp.xlsx, in sheet order.
+# required: a failure aborts the sequential run instead of leaving an empty sheet
+# row_key: columns identifying a row for the scroll extractor (None: the whole row)
+TABLES = [
+    {
+        "sheet": "보유비중", "menu": "보유비중(AI,Bond,재간접)", "cell": "#cell1_d", "cell_pattern": r"^cell\d+_d$",
+        "extractor": "weight_extractor", "endpoint": "weight_endpoint", "required": True,
+        "schema": SCHEMAS["보유비중"], "row_key": None,
+    },
+    {
+        "sheet": "자산내역", "menu": "자산내역", "cell": "#cell0_d", "cell_pattern": r"^cell\d+_d$",
+        "extractor": "asset_extractor", "endpoint": "asset_endpoint", "required": True,
+        "schema": SCHEMAS["자산내역"], "row_key": None,
+    },
+    {
+        "sheet": "투자원장", "menu": "투자 원장 조회", "cell": "#cell105_Id", "cell_pattern": r"^cell\d+_Id$",
+        "extractor": "deal_extractor", "endpoint": "deal_endpoint", "required": False,
+        "schema": SCHEMAS["투자원장"], "row_key": ["투자번호"],
+    },
+]
 
-    scraper.click_button_by_text("자산내역")
-    time.sleep(get("buffer_time"))
+def scrape_table_from_network(scraper, table):
+    """
+    Open the table's view and decode the API response behind its grid, captured through DevTools
+    
+    table: entry of TABLES; its "endpoint" setting gives url_pattern, record_path and fields
+    -> list of lists: Data rows
+    """
+    endpoint = get(table["endpoint"])
+    mark = scraper.network_mark()
+    scraper.click_button_by_text(table["menu"], until=network_idle())
     try:
-        data_rows = scrape_table_to_clipboard(scraper, "#cell0_d")
-        predefined_headers = ["날짜", "펀드", "전략", "종목코드", "종목명", "매매제한", "보유수량", "종가", "직간접", "자산구분", "투자형태", "상장시장", "시가평가여부", "기초자산코드", "기초자산명", "기초자산구분", "기초자산투자형태", "기초자산 상장시장", "기초자산 기업코드", "기초자산 기업명", "기초자산기업 상장시장", "섹터"]
-        df_asset = create_dataframe_from_rows(data_rows, predefined_headers)
-        
+        payload = scraper.wait_for_json_response(endpoint["url_pattern"], since=mark)
+        _, data_rows = EasyScraper.records_from_payload(payload, endpoint.get("record_path"), endpoint.get("fields"))
+        return data_rows
+    except Exception as e:
+        raise Exception(f"Error capturing {endpoint['url_pattern']} response: {e}")
+
+def extract_table(scraper, table):
+    """
+    Open the table's view and extract it
+    
+    table: entry of TABLES
+    -> pandas.DataFrame
+    """
+    extractor = get(table["extractor"], "clipboard")
+    with span(f"extract {table['sheet']}", extractor=extractor):
+        if extractor == "network":
+            data_rows = scrape_table_from_network(scraper, table)
+        else:
+            # 보유비중 and 자산내역 share cell ids: the previous view's grid must be gone (or re-headed)
+            # before the locator runs, or its rows would be copied under this sheet's name.
+            # The exact first cell is resolved by the locator.
+            previous = scraper.mark_grid(table["cell_pattern"])
+            replaced = view_replaced(previous, table["cell_pattern"])
+            scraper.click_button_by_text(table["menu"], until=replaced)
+            scraper.wait_for(replaced, f"view {table['sheet']}")
+            data_rows = scrape_located_table(scraper, table, extractor)
+    return build_table_frame(table, data_rows)
+
+def build_table_frame(table, data_rows):
+    """
+    table: entry of TABLES
+    data_rows: list of lists, tab-separated text (clipboard extractor) or a RowSpill (scroll
+               extractor, removed once read), from any extractor
+    -> pandas.DataFrame with the table's headers and calculated columns
+    """
+    with span(f"convert {table['sheet']}"):
+        if isinstance(data_rows, RowSpill):
+            try: df = create_dataframe_from_spill(data_rows, table["schema"])
+            finally: data_rows.remove()
+        elif isinstance(data_rows, str): df = create_dataframe_from_tsv(data_rows, table["schema"])
+        else: df = create_dataframe_from_rows(data_rows, table["schema"])
+
         # Add calculated column: 평가액 = 보유수량 * 종가
-        if "보유수량" in df_asset.columns and "종가" in df_asset.columns:
+        if table["sheet"] == "자산내역" and "보유수량" in df.columns and "종가" in df.columns:
             # Convert to numeric if needed and multiply
-            df_asset["평가액"] = pd.to_numeric(df_asset["보유수량"], errors='coerce') * pd.to_numeric(df_asset["종가"], errors='coerce')
+            df["평가액"] = pd.to_numeric(df["보유수량"], errors='coerce') * pd.to_numeric(df["종가"], errors='coerce')
             print(f"Added calculated column '평가액' (보유수량 * 종가)")
-    except Exception as e: raise Exception(f"Error processing asset data: {e}")
+        print(f"Extracted {len(df)} rows for {table['sheet']}")
+        return df
 
-    scraper.click_button_by_text("투자 원장 조회")
-    time.sleep(get("buffer_time"))
-    try:
-        # Use fallback function to try alternative cell selectors if #cell105_Id fails
-        data_rows = scrape_table_to_clipboard_with_fallback(scraper, "#cell105_Id", start_num=105, num_range=10, suffix="_Id")
-        predefined_headers = ["ID", "자산코드", "자산명", "투자형태", "기초자산명", "구/신", "보유형태", "최초투자원금", "현재원금액", "현재평가액", "평가수익률", "회수수익률", "투자단가", "현재주가", "괴리율", "담당자(운용)", "담당자(지원)", "Exit예상(M)", "Exit예상(급)", "Exit방안(급)", "Exit예상(평)", "Exit방안(평)", "투자일", "전환가능일", "PUT최초일", "PUT다음일", "PUT최종일", "CALL최초일", "CALL종료일", "보호예수종료일", "만기일", "YTM", "YTP", "YTC", "CALL가능비율", "투자번호"]
-        df_deal = create_dataframe_from_rows(data_rows, predefined_headers)
-        print(f"Extracted {len(df_deal)} rows for 투자 원장")
+def extract_table_isolated(scraper, table):
+    """extract_table, falling back to an empty DataFrame so one failing view does not sink the others"""
+    try: return extract_table(scraper, table)
     except Exception as e:
-        print(f"Error processing 투자 원장 data: {e}")
-        df_deal = pd.DataFrame()  # Create empty dataframe if there's an error
+        print(f"Error processing {table['sheet']} data: {e}")
+        return pd.DataFrame()
+
+def scrape_tables(scraper):
+    """
+    Extract every table one after another on a logged-in scraper
+    -> dict: sheet name -> DataFrame
+    """
+    frames = {}
+    for table in TABLES:
+        if table["required"]:
+            try: frames[table["sheet"]] = extract_table(scraper, table)
+            except Exception as e: raise Exception(f"Error processing {table['sheet']} data: {e}")
+        else: frames[table["sheet"]] = extract_table_isolated(scraper, table)
+    return frames
+
+def scrape_tables_concurrently(scraper, headless=False):
+    """
+    Extract every table in parallel, one browser per view sharing the logged-in session of `scraper`.
+    A WebDriver session executes one command at a time, so tabs of the same driver cannot be
+    driven in parallel; extra drivers get the cookies and web storage of `scraper` instead of logging in.
+    
+    -> dict: sheet name -> DataFrame (empty DataFrame for a view that failed)
+    """
+    session = scraper.export_session()
+    workers = [scraper]
 
-    # Save data to temp.xlsx in the same directory as the exe
-    exe_dir = get_exe_dir()
-    excel_filename = os.path.join(exe_dir, "temp.xlsx")
+    def _extract(index, table):
+        try:
+            if index == 0: worker = scraper
+            else:
+                worker = EasyScraper(headless=headless)
+                workers.append(worker)
+                worker.setup()
+                worker.import_session(session)
+                open_operations(worker)
+            return extract_table(worker, table)
+        except Exception as e:
+            print(f"Error processing {table['sheet']} data: {e}")
+            return pd.DataFrame()
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(TABLES)) as executor:
+            futures = [executor.submit(_extract, i, table) for i, table in enumerate(TABLES)]
+            results = [future.result() for future in futures]
+    finally:
+        for worker in workers[1:]:
+            worker.timer.report()
+            worker.cleanup()
+    return {table["sheet"]: df for table, df in zip(TABLES, results)}
+
+def scrape_tables_http(userid=None, password=None):
+    """
+    Browserless run: log in and fetch the three tables' API endpoints concurrently over HTTP
+    -> dict: sheet name -> DataFrame; raises if a required table fails
+    """
+    client = HttpScraper()
+    try:
+        default_userid, default_password = credentials()
+        with span("login", http=True):
+            client.login(default_userid if userid is None else userid, default_password if password is None else password)
+        with span("extract (http)"): results = client.fetch_all({table["sheet"]: get(table["endpoint"]) for table in TABLES})
+    finally:
+        client.cleanup()
+
+    frames = {}
+    for table in TABLES:
+        result = results[table["sheet"]]
+        if isinstance(result, Exception):
+            if table["required"]: raise Exception(f"Error processing {table['sheet']} data: {result}")
+            print(f"Error processing {table['sheet']} data: {result}")
+            frames[table["sheet"]] = pd.DataFrame()
+        else: frames[table["sheet"]] = build_table_frame(table, result)
+    return frames
+
+def save_tables(frames, delta=None):
+    """
+    Write every DataFrame to its sheet of temp.xlsx in the output directory (by default the exe's)
+    
+    delta: only rewrite sheets whose rows changed since the previous snapshot and append the
+           changed rows to that table's change-log sheet, "<changelog_sheet>_<sheet>"
+           (default: "delta_export" setting)
+    """
+    output_dir = get_output_dir()
+    excel_filename = os.path.join(output_dir, "temp.xlsx")
+    if delta is None: delta = get("delta_export", False)
+    snapshots = {}
+    if delta:
+        store = SnapshotStore(os.path.join(output_dir, get("snapshot_dir", "snapshots")))
+        with span("delta"): frames, snapshots = _delta_frames(frames, store, excel_filename)
+    if not frames:
+        print(f"No changes, {excel_filename} left as is")
+        return
     print(f"Saving data to {excel_filename}")
     
-    # Check if file exists, if not create a new Excel file with all sheets
-    if os.path.exists(excel_filename):
-        # For existing files, just use append mode with replace option
-        with pd.ExcelWriter(excel_filename, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
-            df_weight.to_excel(writer, sheet_name='보유비중', index=False)
-            df_asset.to_excel(writer, sheet_name='자산내역', index=False)
-            df_deal.to_excel(writer, sheet_name='투자원장', index=False)
-    else:
-        with pd.ExcelWriter(excel_filename, engine='openpyxl', mode='w') as writer:
-            df_weight.to_excel(writer, sheet_name='보유비중', index=False)
-            df_asset.to_excel(writer, sheet_name='자산내역', index=False)
-            df_deal.to_excel(writer, sheet_name='투자원장', index=False)
+    # Streams the new sheets and copies the untouched ones at the zip level, creating the file if needed
+    with span("excel write", sheets=len(frames)):
+        write_sheets(excel_filename, frames, chunk_rows=get("excel_chunk_rows", 5000))
     print(f"Data saved to {excel_filename}")
+    # Only now: a snapshot saved before a failed write would hide these changes from every later run
+    for sheet, df in snapshots.items(): store.save(sheet, df)
+
+def record_history(frames):
+    """Append the run to the Parquet history (history_dir next to temp.xlsx); a failure only warns"""
+    if not get("history_enabled", False): return
+    try:
+        from history import HistoryStore
+        with span("history append"):
+            HistoryStore(os.path.join(get_output_dir(), get("history_dir", "history"))).append(frames)
+    except Exception as e: print(f"⚠️ 이력 저장 실패: {e}")
+
+def with_analytics(frames):
+    """
+    frames plus the analytics summary sheets (see analytics.py) when analytics_enabled is on;
+    a failure only warns and leaves the raw tables
+    """
+    if not get("analytics_enabled", False): return frames
+    try:
+        from analytics import run_analytics
+        with span("analytics"):
+            cache_dir = os.path.join(get_output_dir(), get("analytics_cache_dir", "analytics_cache"))
+            return {**frames, **run_analytics(frames, cache_dir, keep=get("analytics_cache_keep", 5))}
+    except Exception as e:
+        print(f"⚠️ 분석 시트 생성 실패: {e}")
+        return frames
+
+def _delta_frames(frames, store, excel_filename):
+    """
+    -> (sheets to rewrite: changed tables plus their updated change logs,
+        snapshots to save once those sheets are written)
+    """
+    results = compute_deltas(frames, store, excel_filename)
+    report_changes(results)
+
+    to_write = {sheet: result["target"] for sheet, result in results.items() if result["target"] is not None}
+    snapshots = dict(to_write)
+    for sheet, result in results.items():
+        if result["log"].empty: continue
+        log_sheet = f"{get('changelog_sheet', '변경내역')}_{sheet}"
+        log = append_log(store.load(log_sheet), result["log"], get("changelog_max_rows", 10000))
+        to_write[log_sheet] = snapshots[log_sheet] = log
+    return to_write, snapshots
+
+def scrape_once(headless=False, concurrent=False, pool=None, persistent_profile=None, http=None, delta=None, trace=None):
+    """
+    concurrent: extract the three views in parallel browsers sharing one login
+    pool: ScraperPool to take a warm, logged-in browser from (None: start and quit a fresh Chrome)
+    persistent_profile: reuse a per-credential Chrome profile and saved cookies (default: "persistent_profile" setting)
+    http: try the browserless HTTP replay first, falling back to Chrome on failure (default: "http_replay" setting)
+    delta: write only changed rows' sheets plus a change log (default: "delta_export" setting)
+    trace: record per-stage timings, WebDriver command counts and RSS to a JSON summary and a
+           Chrome trace file in trace_dir (default: "trace" setting)
+    -> dict: sheet name -> DataFrame
+    """
+    if trace is None: trace = get("trace", False)
+    if not trace: return _scrape_once(headless, concurrent, pool, persistent_profile, http, delta)
+
+    tracer = start_trace()
+    try:
+        with tracer.span("scrape_once"): return _scrape_once(headless, concurrent, pool, persistent_profile, http, delta)
+    finally:
+        stop_trace()
+        tracer.report()
+        summary_path, trace_path = tracer.write(os.path.join(get_exe_dir(), get("trace_dir", "traces")))
+        print(f"📊 트레이스 저장: {summary_path}, {trace_path}")
+
+def _scrape_once(headless, concurrent, pool, persistent_profile, http, delta):
+    if http is None: http = get("http_replay", False)
+    if http:
+        # Only the fetch falls back to Chrome: a save error after a good fetch is raised as it is
+        try: frames = scrape_tables_http()
+        except Exception as e: print(f"HTTP replay failed, falling back to Chrome: {e}")
+        else: return export_tables(frames, delta)
+
+    if pool is not None:
+        with pool.session() as scraper:
+            return _scrape_logged_in(scraper, headless, concurrent, delta)
+
+    if persistent_profile is None: persistent_profile = get("persistent_profile", False)
+    print("Initializing scraper...")
+    scraper = EasyScraper(headless=headless, profile_dir=profile_dir_for(credentials()[0]) if persistent_profile else None)
+    scraper.setup()
+    try:
+        login(scraper)
+        return _scrape_logged_in(scraper, headless, concurrent, delta)
+    finally:
+        scraper.cleanup()
+
+def _scrape_logged_in(scraper, headless, concurrent, delta=None):
+    open_operations(scraper)
+
+    if concurrent: frames = scrape_tables_concurrently(scraper, headless=headless)
+    else: frames = scrape_tables(scraper)
+
+    export_tables(frames, delta)
+    scraper.timer.report()
+    return frames
+
+def export_tables(frames, delta=None):
+    """Save one run's tables (with the analytics sheets), append them to the history and publish them -> frames"""
+    sheets = with_analytics(frames)
+    save_tables(sheets, delta)
+    record_history(frames)
+    publish_snapshots(sheets)
+    return frames
 
 if __name__ == "__main__":
+    # Credentials JSON: the first argument that is not a flag, otherwise config.py
+    json_files = [arg for arg in sys.argv[1:] if not arg.startswith("-")]
+    load_credentials(json_files[0] if json_files else None)
+
     # Use headless from JSON if provided, otherwise check command line arguments
     if HEADLESS_FROM_JSON is not None:
         headless = HEADLESS_FROM_JSON
@@ -267,4 +737,22 @@ if __name__ == "__main__":
         headless = "--headless" in sys.argv or "-h" in sys.argv
     
     logging = "--logging" in sys.argv or "-l" in sys.argv
-    scrape_once(headless=headless)
\ No newline at end of file
+    concurrent = "--concurrent" in sys.argv or "-c" in sys.argv
+    persistent_profile = True if "--profile" in sys.argv or "-p" in sys.argv else None
+    http = True if "--http" in sys.argv else None
+    delta_export = True if "--delta" in sys.argv else None
+    trace = True if logging else None
+    if "--daemon" in sys.argv:
+        # Scheduled runs on a warm pooled browser, see daemon.py
+        from daemon import run_daemon
+        if "--serve" in sys.argv or get("service_enabled", False):
+            from snapshot_service import serve
+            serve()
+        try:
+            run_daemon(lambda: scrape_once(headless=headless, concurrent=concurrent, pool=get_pool(headless), http=http,
+                                           delta=delta_export, trace=trace),
+                       os.path.join(get_output_dir(), "temp.xlsx"))
+        finally: close_pool()
+    else:
+        scrape_once(headless=headless, concurrent=concurrent, persistent_profile=persistent_profile, http=http, delta=delta_export,
+                    trace=trace)
@@ -0,0 +1,245 @@
+"""
+Local HTTP service for the latest scraped tables, so consumers stop opening temp.xlsx.
+
+The latest 보유비중/자산내역/투자원장 DataFrames are held in memory: published by scrape_once
+after every run in the same process (daemon --serve), or loaded from temp.xlsx and reloaded
+when the workbook changes (standalone). Every table is served as JSON, CSV or Arrow with column
+selection and row filters, an ETag derived from the table contents and the query (so
+If-None-Match polling costs a 304 until the data actually changes) and gzip.
+
+GET /tables                         -> sheets with row counts, columns, update time and the ETag
+                                       of the whole table as JSON (what GET /tables/<sheet> sends)
+GET /tables/<sheet>?format=json|csv|arrow
+    columns=펀드,종목명,평가액         select columns
+    펀드=AI 1호,AI 2호                 keep rows whose column equals one of the values
+    평가액__gt=1000000                 comparisons: __gt, __ge, __lt, __le, __ne
+    limit=100&offset=0                 slice after filtering
+Malformed parameters (unknown column, non-numeric limit or comparison value...) answer 400.
+
+Usage: python snapshot_service.py [--port 8765] [--host 127.0.0.1] [--workbook temp.xlsx]
+"""
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import pandas as pd
+from flask import Flask, Response, abort, jsonify, request
+
+from easyscraperlib import get
+from schema import unique_names
+
+RESERVED = {"format", "columns", "limit", "offset"}
+OPERATORS = {"gt": "__gt__", "ge": "__ge__", "lt": "__lt__", "le": "__le__", "ne": "__ne__"}
+MIMETYPES = {
+    "json": "application/json",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+class SnapshotCache:
+    """Latest DataFrame per sheet plus an LRU of rendered responses"""
+    def __init__(self, max_responses=64):
+        self._lock = threading.Lock()
+        self._tables = {}
+        self._responses = OrderedDict()
+        self.max_responses = max_responses
+
+    def publish(self, frames):
+        """frames: dict sheet name -> DataFrame; unchanged tables keep their ETag"""
+        updated = {}
+        for sheet, df in frames.items():
+            if df is None or df.empty and not len(df.columns): continue
+            digest = content_hash(df)
+            with self._lock: current = self._tables.get(sheet)
+            if current and current["digest"] == digest: continue
+            updated[sheet] = {"df": df, "digest": digest, "updated_at": datetime.now().astimezone()}
+        if not updated: return
+        with self._lock:
+            self._tables.update(updated)
+            for key in [key for key in self._responses if key[0] in updated]: del self._responses[key]
+
+    def table(self, sheet):
+        with self._lock: return self._tables.get(sheet)
+
+    def sheets(self):
+        with self._lock: return dict(self._tables)
+
+    def response(self, key, render):
+        """Rendered body for key (sheet, digest, query...), rendering it on a miss"""
+        with self._lock:
+            if key in self._responses:
+                self._responses.move_to_end(key)
+                return self._responses[key]
+        body = render()
+        with self._lock:
+            self._responses[key] = body
+            while len(self._responses) > self.max_responses: self._responses.popitem(last=False)
+        return body
+
+def content_hash(df):
+    """-> hex digest of the values, dtypes and column names of df"""
+    digest = hashlib.sha1()
+    digest.update(repr([(str(c), str(t)) for c, t in zip(df.columns, df.dtypes)]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df.reset_index(drop=True).set_axis(range(df.shape[1]), axis=1), index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def etag_for(digest, args=()):
+    """
+    -> ETag of a table version (content digest) under a query; format=json is the default and
+       left out, so the listing's ETag of a table matches a plain GET /tables/<sheet>
+    """
+    query = tuple(sorted((name, value) for name, value in args if (name, value) != ("format", "json")))
+    return hashlib.sha1(repr((digest, query)).encode("utf-8")).hexdigest()[:24]
+
+def _count(args, name, default=None):
+    """Non-negative integer query parameter -> int (default when absent); 400 otherwise"""
+    value = args.get(name)
+    if value in (None, ""): return default
+    try: number = int(value)
+    except ValueError: abort(400, f"{name} must be a non-negative integer: {value}")
+    if number < 0: abort(400, f"{name} must be a non-negative integer: {value}")
+    return number
+
+def _comparable(values, value):
+    """Comparison value parsed like the column (datetime, number or text); 400 when it does not parse"""
+    try:
+        if pd.api.types.is_datetime64_any_dtype(values): return pd.to_datetime(value)
+        if pd.api.types.is_numeric_dtype(values): return float(value)
+    except (ValueError, TypeError): abort(400, f"not a valid {values.dtype} value for {values.name}: {value}")
+    return value
+
+def select(df, args):
+    """Apply the columns/filter/limit/offset query parameters -> DataFrame"""
+    for name, value in args.items():
+        if name in RESERVED: continue
+        column, _, operator = name.partition("__")
+        if column not in df.columns: abort(400, f"unknown column: {column}")
+        values = df.loc[:, df.columns == column].iloc[:, 0]
+        if operator:
+            if operator not in OPERATORS: abort(400, f"unknown operator: {operator}")
+            target = _comparable(values, value)
+            try: matches = getattr(values, OPERATORS[operator])(target)
+            except TypeError: abort(400, f"cannot compare {column} with {value}")
+            df = df[matches.fillna(False).to_numpy(dtype=bool)]
+        else:
+            df = df[values.astype(str).isin(value.split(",")).to_numpy()]
+    if args.get("columns"):
+        wanted = args["columns"].split(",")
+        missing = [c for c in wanted if c not in df.columns]
+        if missing: abort(400, f"unknown columns: {', '.join(missing)}")
+        df = df.loc[:, df.columns.isin(wanted)]
+    offset = _count(args, "offset", 0)
+    limit = _count(args, "limit")
+    return df.iloc[offset:offset + limit if limit is not None else None]
+
+def render(df, format):
+    """-> response body bytes"""
+    if format == "csv": return df.to_csv(index=False).encode("utf-8")
+    if format == "arrow":
+        try: import pyarrow as pa
+        except ImportError: abort(501, "Arrow output needs pyarrow")
+        table = pa.Table.from_pandas(df.set_axis(unique_names(df.columns), axis=1), preserve_index=False)
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as writer: writer.write_table(table)
+        return sink.getvalue()
+    # {"columns": [...], "data": [[...], ...]} keeps column order and repeated column names
+    columns = json.dumps([str(c) for c in df.columns], ensure_ascii=False)
+    data = df.to_json(orient="values", date_format="iso", force_ascii=False)
+    return f'{{"columns":{columns},"data":{data}}}'.encode("utf-8")
+
+def create_app(cache, reload=None):
+    """
+    cache: SnapshotCache to serve
+    reload: callable run before each request to refresh the cache (standalone mode)
+    """
+    app = Flask(__name__)
+    app.json.ensure_ascii = False
+
+    @app.before_request
+    def _refresh():
+        if reload: reload()
+
+    @app.route("/tables")
+    def tables():
+        return jsonify({sheet: {"rows": len(entry["df"]), "columns": [str(c) for c in entry["df"].columns],
+                                "updated_at": entry["updated_at"].isoformat(timespec="seconds"), "etag": etag_for(entry["digest"])}
+                        for sheet, entry in cache.sheets().items()})
+
+    @app.route("/tables/<sheet>")
+    def table(sheet):
+        entry = cache.table(sheet)
+        if entry is None: abort(404, f"no snapshot for {sheet}")
+        format = request.args.get("format", "json")
+        if format not in MIMETYPES: abort(400, f"unknown format: {format}")
+
+        query = tuple(sorted(request.args.items(multi=True)))
+        etag = etag_for(entry["digest"], query)
+        if etag in request.if_none_match:
+            response = Response(status=304)
+            response.set_etag(etag)
+            return response
+
+        body = cache.response((sheet, entry["digest"], query), lambda: render(select(entry["df"], request.args), format))
+        response = Response(body, mimetype=MIMETYPES[format])
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        response.last_modified = entry["updated_at"]
+        response.vary.add("Accept-Encoding")
+        if "gzip" in request.headers.get("Accept-Encoding", "") and len(body) > 1024:
+            response.set_data(gzip.compress(body, compresslevel=5))
+            response.headers["Content-Encoding"] = "gzip"
+        return response
+
+    return app
+
+# Cache scrape_once publishes into, served by serve() in the same process
+_cache = SnapshotCache()
+_server = None
+
+def publish(frames):
+    """Hand the frames of a finished run to the in-process service (no-op when it is not running)"""
+    if _server is not None: _cache.publish(frames)
+
+def serve(host=None, port=None, cache=None):
+    """Start the service on a daemon thread -> the werkzeug server (call shutdown() to stop)"""
+    global _server
+    from werkzeug.serving import make_server
+    server = _server = make_server(host or get("service_host", "127.0.0.1"), port or get("service_port", 8765),
+                         create_app(cache or _cache), threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True, name="snapshot-service").start()
+    print(f"🌐 스냅샷 서비스: http://{server.host}:{server.server_port}/tables")
+    return server
+
+def workbook_loader(cache, workbook):
+    """-> callable reloading every sheet of workbook into cache when its modification time changes"""
+    state = {"mtime": None}
+    lock = threading.Lock()
+    def _reload():
+        try: mtime = os.path.getmtime(workbook)
+        except OSError: return
+        with lock:
+            if mtime == state["mtime"]: return
+            cache.publish(pd.read_excel(workbook, sheet_name=None))
+            state["mtime"] = mtime
+    return _reload
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Serve the latest scraped tables over HTTP")
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--workbook", default=None, help="workbook to serve (default: temp.xlsx in the output directory)")
+    args = parser.parse_args()
+
+    if args.workbook: workbook = args.workbook
+    else:
+        output_dir = get("output_dir") or os.path.dirname(os.path.abspath(__file__))
+        workbook = os.path.join(output_dir, "temp.xlsx")
+    cache = SnapshotCache()
+    create_app(cache, reload=workbook_loader(cache, workbook)).run(
+        host=args.host or get("service_host", "127.0.0.1"), port=args.port or get("service_port", 8765), threaded=True)
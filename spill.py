@@ -0,0 +1,69 @@
+"""
+Rows streamed to a temporary TSV file in chunks, so a grid of any size never sits in memory as
+one list of lists or one clipboard-sized string before it becomes a DataFrame.
+
+    with RowSpill() as spill:
+        for chunk in scraper.harvest_grid("#cell0_d"): spill.write(chunk)
+    df = pd.read_csv(spill.path, sep="\t", ...)   # or: for chunk in spill.chunks(5000): ...
+    spill.remove()
+
+Tabs and line breaks inside cells are written as spaces, so every line is one row.
+"""
+import os
+import tempfile
+
+def _clean(value):
+    if value is None: return ""
+    return str(value).replace("\t", " ").replace("\r", " ").replace("\n", " ")
+
+def _line(row):
+    # Fast path: text cells without tabs or line breaks join as they are
+    try:
+        line = "\t".join(row)
+        if line.count("\t") == len(row) - 1 and "\n" not in line and "\r" not in line: return line
+    except TypeError: pass
+    return "\t".join(_clean(value) for value in row)
+
+class RowSpill:
+    def __init__(self, directory=None):
+        """directory: where the spill file goes (default: the system temp directory)"""
+        if directory: os.makedirs(directory, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(prefix="spill-", suffix=".tsv", dir=directory or None)
+        self._file = os.fdopen(fd, "w", encoding="utf-8", newline="")
+        self.rows = 0
+        self.width = 0
+
+    def write(self, rows):
+        """Append a chunk of rows (lists of cell values)"""
+        if not rows: return
+        self._file.write("".join(_line(row) + "\n" for row in rows))
+        self.rows += len(rows)
+        self.width = max(self.width, max(len(row) for row in rows))
+
+    def close(self):
+        if not self._file.closed: self._file.close()
+
+    def chunks(self, chunk_rows=5000):
+        """Read the rows back -> iterator of lists of at most chunk_rows rows"""
+        self.close()
+        chunk = []
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            for line in f:
+                chunk.append(line.rstrip("\n").split("\t"))
+                if len(chunk) >= chunk_rows:
+                    yield chunk
+                    chunk = []
+        if chunk: yield chunk
+
+    def remove(self):
+        self.close()
+        try: os.remove(self.path)
+        except FileNotFoundError: pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Keep the file for the reader on success, drop it when the harvest failed
+        if exc_type is None: self.close()
+        else: self.remove()
@@ -0,0 +1,83 @@
+"""
+GUI startup: the window is drawn first and everything heavy happens behind it.
+
+scrape (pandas, selenium, openpyxl) is imported on a background thread once the window has
+painted. With the "prewarm" setting on, the same thread then starts Chrome from the process-wide
+ScraperPool and logs in, so 실행 attaches to a browser that is already on the TMS site.
+
+    startup = Startup(credentials_file)      # credentials JSON from the command line (None: config.py)
+    root.after_idle(startup.start, headless)   # after the first paint
+    scrape = startup.scrape()                  # waits for the import if it is still running
+"""
+import threading
+import time
+
+# Taken when gui imports this module, before tkinter: the reference point of every timing
+PROCESS_START = time.perf_counter()
+
+class Startup:
+    def __init__(self, credentials_file=None):
+        """credentials_file: credentials JSON loaded into scrape right after its import (None: config.py)"""
+        self.credentials_file = credentials_file
+        self.timings = {}
+        self._imported = threading.Event()
+        self._module = None
+        self._error = None
+        self._lock = threading.Lock()
+        self._started = False
+
+    def mark(self, name):
+        """Record the seconds since PROCESS_START under name"""
+        self.timings[name] = time.perf_counter() - PROCESS_START
+
+    def start(self, headless=False, prewarm=None):
+        """Import scrape and prewarm a browser on a daemon thread (only the first call starts anything)"""
+        with self._lock:
+            if self._started: return
+            self._started = True
+        threading.Thread(target=self._run, args=(headless, prewarm), daemon=True, name="startup").start()
+
+    def _run(self, headless, prewarm):
+        try:
+            import scrape
+            # Before anything logs in: the prewarmed browser and every run use these credentials
+            scrape.load_credentials(self.credentials_file)
+            self._module = scrape
+        except Exception as e: self._error = e
+        finally:
+            self.mark("import scrape")
+            self._imported.set()
+        if self._error is None: self.prewarm(headless, prewarm)
+
+    def scrape(self, timeout=None):
+        """-> the scrape module, waiting for the import (started here, without prewarm, if start() was never called)"""
+        if not self._started: self.start(prewarm=False)
+        if not self._imported.wait(timeout): raise TimeoutError("scrape import still running")
+        if self._error is not None: raise self._error
+        return self._module
+
+    @property
+    def import_finished(self):
+        """Whether the background import is over, successfully or not"""
+        return self._imported.is_set()
+
+    @property
+    def imported(self):
+        return self._imported.is_set() and self._error is None
+
+    def prewarm(self, headless=False, enabled=None):
+        """
+        Start and log in a pooled browser for the given headless mode (blocking; call off the UI thread).
+        A failure only warns: the run starts a browser itself.
+        enabled: default "prewarm" setting
+        """
+        from easyscraperlib import get
+        if enabled is None: enabled = get("prewarm", True)
+        if not enabled: return
+        scrape = self.scrape()
+        try:
+            started = time.perf_counter()
+            if scrape.get_pool(headless).prewarm():
+                self.mark("prewarm")
+                print(f"🔥 Chrome 준비 완료 ({time.perf_counter() - started:.1f}s)")
+        except Exception as e: print(f"⚠️ Chrome 미리 준비 실패: {e}")
@@ -0,0 +1,141 @@
+"""
+Self-tuning timeouts: the observed latency of every named wait (login page, find 'AI',
+grid 자산내역...) is kept on disk, and each step's timeout is derived from its own percentile
+instead of one global long_loadtime/short_loadtime.
+
+    learned = clamp(p<timing_percentile> x timing_margin, timing_floor, timing_ceiling)
+
+The percentile is taken over the waits that completed; a timed-out wait only says the step took
+longer than its timeout, so it never raises the learned value. How the learned value is used
+depends on what a timeout costs the caller:
+
+    hard wait (raises, aborts the run)   max(default, learned): a slow step gets more time,
+                                         a fast one never less than its default
+    best-effort wait (settle, continue)  min(default, learned): shortened, never lengthened;
+                                         back to the default while a recent wait timed out
+
+Steps with fewer than timing_min_samples observations, or with no completed wait at all, keep
+the configured default.
+
+The profile (last timing_samples observations per step, plus p50/p90/p99 for reading) is written
+to timing_profile.json next to the exe, at most every 30 seconds while running and at exit.
+
+Usage: python timing_profile.py     (prints the per-step percentiles and derived timeouts)
+"""
+import atexit
+import json
+import math
+import os
+import sys
+import threading
+import time
+
+from easyscraperlib import get, write_json_atomic
+
+SAVE_INTERVAL = 30
+RECENT = 10  # samples checked for timeouts before shortening a best-effort wait
+
+def percentile(values, q):
+    """Nearest-rank percentile of sorted values (q in 0..100)"""
+    if not values: return None
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+class TimingProfile:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._steps = {}
+        self._dirty = False
+        self._saved = time.monotonic()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._steps = {step: [tuple(s) for s in entry["samples"]] for step, entry in json.load(f).items()}
+        except FileNotFoundError: pass
+        except Exception as e: print(f"⚠️ {os.path.basename(path)} 읽기 실패, 새로 기록: {e}")
+
+    def record(self, step, seconds, timed_out=False):
+        """Add one observed latency of step (timed_out: the wait gave up after `seconds`)"""
+        with self._lock:
+            samples = self._steps.setdefault(step, [])
+            samples.append((round(seconds, 4), int(timed_out)))
+            del samples[:-get("timing_samples", 200)]
+            self._dirty = True
+            due = time.monotonic() - self._saved > SAVE_INTERVAL
+        if due: self.save()
+
+    def stats(self, step):
+        """-> dict n, timeouts, p50, p90, p99 for step (None when it has no samples)"""
+        with self._lock: samples = list(self._steps.get(step, []))
+        if not samples: return None
+        values = sorted(s for s, _ in samples)
+        return {"n": len(values), "timeouts": sum(t for _, t in samples),
+                "p50": percentile(values, 50), "p90": percentile(values, 90), "p99": percentile(values, 99)}
+
+    def learned(self, step):
+        """-> timeout derived from step's completed waits, or None while there are too few samples"""
+        with self._lock: samples = list(self._steps.get(step, []))
+        completed = sorted(s for s, timed_out in samples if not timed_out)
+        if len(samples) < get("timing_min_samples", 20) or not completed: return None
+        derived = percentile(completed, get("timing_percentile", 99)) * get("timing_margin", 1.5)
+        return min(get("timing_ceiling", 30), max(get("timing_floor", 0.5), derived))
+
+    def timeout(self, step, default, best_effort=False):
+        """
+        -> timeout in seconds for step
+        default: the caller's configured timeout
+        best_effort: the caller carries on after a timeout, so the learned value may shorten default;
+        a hard wait is never given less than default
+        """
+        learned = self.learned(step)
+        if learned is None: return default
+        if not best_effort: return max(default, learned)
+        with self._lock: recent = self._steps.get(step, [])[-RECENT:]
+        if any(timed_out for _, timed_out in recent): return default
+        return min(default, learned)
+
+    def save(self):
+        """Write the profile atomically if anything was recorded since the last save"""
+        with self._lock:
+            if not self._dirty: return
+            steps = {step: list(samples) for step, samples in self._steps.items()}
+            self._dirty = False
+            self._saved = time.monotonic()
+        data = {}
+        for step, samples in sorted(steps.items()):
+            values = sorted(s for s, _ in samples)
+            data[step] = {"p50": percentile(values, 50), "p90": percentile(values, 90), "p99": percentile(values, 99),
+                          "samples": samples}
+        try: write_json_atomic(self.path, data)
+        except OSError as e: print(f"⚠️ {os.path.basename(self.path)} 저장 실패: {e}")
+
+    def report(self):
+        steps = sorted(self._steps)
+        if not steps:
+            print("기록된 단계 없음")
+            return
+        width = max(len(s) for s in steps)
+        print(f"{'step':<{width}}  {'n':>5}  {'p50':>7}  {'p90':>7}  {'p99':>7}  {'learned':>8}")
+        for step in steps:
+            s = self.stats(step)
+            learned = self.learned(step)
+            learned = f"{learned:>7.2f}s" if learned is not None else f"{'default':>8}"
+            print(f"{step:<{width}}  {s['n']:>5}  {s['p50']:>6.2f}s  {s['p90']:>6.2f}s  {s['p99']:>6.2f}s  {learned}")
+
+_profile = None
+_profile_lock = threading.Lock()
+
+def get_profile():
+    """-> the process-wide TimingProfile, or None when adaptive_timing is off"""
+    global _profile
+    if not get("adaptive_timing", False): return None
+    with _profile_lock:
+        if _profile is None:
+            base = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else os.path.dirname(os.path.abspath(__file__))
+            _profile = TimingProfile(os.path.join(base, get("timing_profile", "timing_profile.json")))
+            atexit.register(_profile.save)
+        return _profile
+
+if __name__ == "__main__":
+    profile = get_profile()
+    if profile is None: print("adaptive_timing 꺼짐")
+    else: profile.report()
@@ -0,0 +1,151 @@
+"""
+Per-stage tracing for scrape runs.
+
+span(name) wraps a stage (driver startup, login, menu clicks, table extraction, DataFrame
+conversion, Excel write) and records its wall time, the WebDriver commands its thread issued
+and the process RSS. Spans are only recorded while a Tracer is active (start_trace), so the
+instrumentation costs nothing on normal runs. Tracer.write produces a JSON summary and a
+Chrome trace-event file that opens in chrome://tracing or https://ui.perfetto.dev.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+try:
+    import psutil
+    _process = psutil.Process()
+except ImportError:
+    _process = None
+
+def rss_mb():
+    """-> resident set size of this process in MB, None without psutil"""
+    if _process is None: return None
+    return _process.memory_info().rss / (1024 * 1024)
+
+# WebDriver commands issued per thread, counted by count_commands
+_commands = {}
+_commands_lock = threading.Lock()
+
+def commands_issued():
+    return _commands.get(threading.get_ident(), 0)
+
+def count_commands(driver):
+    """Wrap driver.execute so every WebDriver command is counted against the calling thread"""
+    if getattr(driver, "_traced", False): return driver
+    execute = driver.execute
+    def _execute(*args, **kwargs):
+        ident = threading.get_ident()
+        with _commands_lock: _commands[ident] = _commands.get(ident, 0) + 1
+        return execute(*args, **kwargs)
+    driver.execute = _execute
+    driver._traced = True
+    return driver
+
+class Tracer:
+    def __init__(self):
+        self.spans = []
+        self._origin = time.perf_counter()
+        self._started_at = datetime.now()
+        self._lock = threading.Lock()
+        self._depth = threading.local()
+
+    @contextmanager
+    def span(self, name, **args):
+        """Record one stage; nested spans show up nested in the trace viewer"""
+        depth = getattr(self._depth, "value", 0)
+        self._depth.value = depth + 1
+        start = time.perf_counter()
+        commands = commands_issued()
+        rss_start = rss_mb()
+        error = None
+        try: yield
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._depth.value = depth
+            record = {
+                "name": name,
+                "start": start - self._origin,
+                "seconds": time.perf_counter() - start,
+                "commands": commands_issued() - commands,
+                "rss_start_mb": rss_start,
+                "rss_end_mb": rss_mb(),
+                "thread": threading.current_thread().name,
+                "tid": threading.get_ident(),
+                "depth": depth,
+                "args": args,
+            }
+            if error: record["error"] = error
+            with self._lock: self.spans.append(record)
+
+    def summary(self):
+        """-> dict: run start, total seconds, peak RSS and the spans in start order"""
+        spans = sorted(self.spans, key=lambda s: s["start"])
+        rss = [s[k] for s in spans for k in ("rss_start_mb", "rss_end_mb") if s[k] is not None]
+        return {
+            "started_at": self._started_at.isoformat(timespec="seconds"),
+            "seconds": time.perf_counter() - self._origin,
+            "peak_rss_mb": max(rss) if rss else None,
+            "spans": [{k: v for k, v in s.items() if k != "tid"} for s in spans],
+        }
+
+    def chrome_trace(self):
+        """-> Chrome trace-event JSON object (complete "X" events, microseconds)"""
+        pid = os.getpid()
+        events = []
+        for s in self.spans:
+            args = dict(s["args"], commands=s["commands"], rss_mb=s["rss_end_mb"])
+            if "error" in s: args["error"] = s["error"]
+            events.append({"name": s["name"], "ph": "X", "pid": pid, "tid": s["tid"],
+                           "ts": s["start"] * 1e6, "dur": s["seconds"] * 1e6, "args": args})
+            if s["rss_end_mb"] is not None:
+                events.append({"name": "RSS (MB)", "ph": "C", "pid": pid, "ts": (s["start"] + s["seconds"]) * 1e6,
+                               "args": {"rss": round(s["rss_end_mb"], 1)}})
+        threads = {s["tid"]: s["thread"] for s in self.spans}
+        for tid, thread in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, directory):
+        """
+        Write trace_<time>.json (summary) and trace_<time>.trace.json (Chrome trace) to directory
+        -> (summary path, chrome trace path)
+        """
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, f"trace_{self._started_at:%Y%m%d_%H%M%S}")
+        paths = (stem + ".json", stem + ".trace.json")
+        for path, data in zip(paths, (self.summary(), self.chrome_trace())):
+            with open(path, 'w', encoding='utf-8') as f: json.dump(data, f, ensure_ascii=False, indent=1)
+        return paths
+
+    def report(self):
+        """Print the top-level stages with their time, command count and RSS"""
+        spans = sorted((s for s in self.spans if s["depth"] <= 1), key=lambda s: s["start"])
+        if not spans: return
+        width = max(len("  " * s["depth"] + s["name"]) for s in spans)
+        print(f"{'stage':<{width}}  {'seconds':>8}  {'cmds':>6}  {'RSS':>8}")
+        for s in spans:
+            rss = f"{s['rss_end_mb']:.0f}MB" if s["rss_end_mb"] is not None else "n/a"
+            print(f"{'  ' * s['depth'] + s['name']:<{width}}  {s['seconds']:>7.2f}s  {s['commands']:>6}  {rss:>8}")
+
+# The tracer of the run in progress, None when tracing is off
+_active = None
+
+def start_trace():
+    global _active
+    _active = Tracer()
+    return _active
+
+def stop_trace():
+    """-> the finished Tracer, or None if tracing was off"""
+    global _active
+    tracer, _active = _active, None
+    return tracer
+
+def span(name, **args):
+    """Stage of the active trace; a no-op context when tracing is off"""
+    return _active.span(name, **args) if _active is not None else nullcontext()